@@ -1,14 +1,18 @@
+import functools
+import importlib.util
 import logging
 import shutil
 import tempfile
 import warnings
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 from subprocess import run
 import os
 
 # Importar y aplicar configuración SSL automática
 try:
-    from audiobook_generator.utils.ssl_config import ssl_manager, auto_configure_ssl
+    from audiobook_generator.utils.ssl_config import ssl_manager, auto_configure_ssl, is_ssl_error, provide_ssl_help, \
+        share_session_with_hf_hub
     auto_configure_ssl()
     logger = logging.getLogger(__name__)
     logger.info("🔧 Sistema SSL automático activado para Coqui TTS")
@@ -43,18 +47,28 @@ warnings.filterwarnings('ignore', message='.*might cause truncated audio.*')
 warnings.filterwarnings('ignore', message='.*In 2.9, this function.*implementation will be changed.*')
 warnings.filterwarnings('ignore', category=UserWarning, module='torchaudio')
 
-# Fix para PyTorch 2.6+ - weights_only=False por defecto
-import torch
-_original_torch_load = torch.load
-
-def custom_torch_load(*args, **kwargs):
-    """Custom torch.load que fuerza weights_only=False para compatibilidad con TTS"""
-    if "weights_only" not in kwargs:
-        kwargs["weights_only"] = False
-    return _original_torch_load(*args, **kwargs)
-
-# Sobrescribir globalmente para TTS
-torch.load = custom_torch_load
+# Fix para PyTorch 2.6+ - weights_only=False por defecto.
+# torch se importa sólo cuando se va a cargar un modelo: importarlo aquí
+# retrasaba varios segundos el arranque de la UI, que sólo usa los listados.
+_torch_load_patched = False
+
+def _patch_torch_load():
+    """Sobrescribe torch.load (una sola vez) para que TTS cargue con weights_only=False"""
+    global _torch_load_patched
+    if _torch_load_patched:
+        return
+    import torch
+    original_torch_load = torch.load
+
+    def custom_torch_load(*args, **kwargs):
+        """Custom torch.load que fuerza weights_only=False para compatibilidad con TTS"""
+        if "weights_only" not in kwargs:
+            kwargs["weights_only"] = False
+        return original_torch_load(*args, **kwargs)
+
+    # Sobrescribir globalmente para TTS
+    torch.load = custom_torch_load
+    _torch_load_patched = True
 
 # También establecer variable de entorno como respaldo
 os.environ["TORCH_FORCE_NO_WEIGHTS_ONLY_LOAD"] = "1"
@@ -65,6 +79,7 @@ from pydub import AudioSegment
 from audiobook_generator.config.general_config import GeneralConfig
 from audiobook_generator.core.audio_tags import AudioTags
 from audiobook_generator.tts_providers.base_tts_provider import BaseTTSProvider
+from audiobook_generator.utils.catalog_cache import disk_cached
 from audiobook_generator.utils.utils import set_audio_tags
 
 logger = logging.getLogger(__name__)
@@ -80,6 +95,8 @@ class CoquiTTSProvider(BaseTTSProvider):
     def __init__(self, config: GeneralConfig):
         # La configuración SSL ya se aplicó automáticamente al importar
         
+        _patch_torch_load()
+
         # Configurar aceptación automática de licencia Coqui para evitar prompts interactivos
         self._setup_coqui_license()
         
@@ -173,6 +190,9 @@ class CoquiTTSProvider(BaseTTSProvider):
         """Carga modelo TTS con manejo robusto de errores SSL y certificados"""
         from TTS.api import TTS
         
+        # Las descargas de huggingface_hub van por la session compartida (pool y reintentos)
+        share_session_with_hf_hub()
+        
         strategies = [
             # Estrategia 1: Carga normal (SSL ya configurado)
             lambda: TTS(model_name).to(device),
@@ -196,7 +216,7 @@ class CoquiTTSProvider(BaseTTSProvider):
                 logger.warning(f"Estrategia {i+1} falló: {e}")
                 
                 # Si es error SSL, reconfigurar y continuar
-                if ssl_manager.is_ssl_error(e):
+                if is_ssl_error(e):
                     logger.info("🔧 Error SSL detectado, reconfigurando...")
                     ssl_manager.setup_ssl_environment()
                     continue
@@ -388,8 +408,8 @@ class CoquiTTSProvider(BaseTTSProvider):
                                 f.write(chunk)
                 except Exception as e:
                     logger.error(f"Error downloading model from {model_name}: {e}")
-                    if ssl_manager.is_ssl_error(e):
-                        ssl_manager.provide_troubleshooting_info(e)
+                    if is_ssl_error(e):
+                        provide_ssl_help(e)
                     raise
             return out_path
 
@@ -435,56 +455,9 @@ class CoquiTTSProvider(BaseTTSProvider):
         return dest_dir
     
     def _create_secure_session(self):
-        """Crear session de requests con configuración SSL robusta"""
-        import requests
-        from requests.adapters import HTTPAdapter
-        from urllib3.util.retry import Retry
-        
-        session = requests.Session()
-        
-        # Configurar SSL
-        session.verify = False
-        
-        # Configurar retry strategy (compatible con urllib3 1.x y 2.x)
-        try:
-            # Para urllib3 2.0+
-            retry_strategy = Retry(
-                total=3,
-                status_forcelist=[429, 500, 502, 503, 504],
-                allowed_methods=["HEAD", "GET", "OPTIONS"],
-                backoff_factor=1
-            )
-        except TypeError:
-            try:
-                # Para urllib3 1.x
-                retry_strategy = Retry(
-                    total=3,
-                    status_forcelist=[429, 500, 502, 503, 504],
-                    method_whitelist=["HEAD", "GET", "OPTIONS"],
-                    backoff_factor=1
-                )
-            except TypeError:
-                # Fallback sin métodos específicos
-                retry_strategy = Retry(
-                    total=3,
-                    status_forcelist=[429, 500, 502, 503, 504],
-                    backoff_factor=1
-                )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        # Headers para evitar bloqueos
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': '*/*',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        })
-        
-        return session
-
+        """Session de requests compartida con configuración SSL robusta (pool, reintentos, sin verificación)"""
+        return ssl_manager.session
+    
     def _text_to_speech_local(self, text: str, output_file: str, audio_tags: AudioTags):
         # Handle different model types
         model_id = self.config.coqui_model
@@ -562,7 +535,7 @@ class CoquiTTSProvider(BaseTTSProvider):
                 
         except Exception as e:
             # Usar el sistema SSL centralizado para detectar y manejar errores
-            if ssl_manager.is_ssl_error(e):
+            if is_ssl_error(e):
                 logger.error("❌ Error de certificado SSL detectado. Aplicando soluciones...")
                 try:
                     # Re-aplicar configuración SSL y reintentar
@@ -571,7 +544,7 @@ class CoquiTTSProvider(BaseTTSProvider):
                     logger.info("✅ Modelo cargado exitosamente después de corregir SSL")
                 except Exception as ssl_retry_error:
                     logger.error(f"Error persistente después de corregir SSL: {ssl_retry_error}")
-                    ssl_manager.provide_troubleshooting_info(e)
+                    provide_ssl_help(e)
                     raise
             else:
                 logger.error(f"Failed to initialize TTS model {tts_model}: {e}")
@@ -1316,6 +1289,26 @@ class CoquiTTSProvider(BaseTTSProvider):
 
 def get_coqui_supported_models(coqui_path: str = None):
     """Return a comprehensive list of Coqui TTS models organized by type and language."""
+    models = list(_coqui_model_catalog())
+
+    # Add any local models if they exist (scanned on every call so new folders show up)
+    try:
+        base = Path(coqui_path) if coqui_path else Path(__file__).parent.parent.parent / "coqui_models"
+        if base.exists() and base.is_dir():
+            for child in base.iterdir():
+                if child.is_dir():
+                    local_model = f"local:{child.name}"
+                    if local_model not in models:
+                        models.append(local_model)
+    except Exception:
+        pass
+
+    return models
+
+
+@functools.lru_cache(maxsize=1)
+def _coqui_model_catalog():
+    """Build the built-in model list once; local models are not part of it."""
     
     # Multilingual models (including XTTS-v2) - Best for Spanish
     multilingual_models = [
@@ -1412,19 +1405,7 @@ def get_coqui_supported_models(coqui_path: str = None):
         "tts_models/sv/cv/vits",
     ]
 
-    # Add any local models if they exist
-    try:
-        base = Path(coqui_path) if coqui_path else Path(__file__).parent.parent.parent / "coqui_models"
-        if base.exists() and base.is_dir():
-            for child in base.iterdir():
-                if child.is_dir():
-                    local_model = f"local:{child.name}"
-                    if local_model not in models:
-                        models.append(local_model)
-    except Exception:
-        pass
-
-    return models
+    return tuple(models)
 
 
 def get_coqui_supported_languages():
@@ -1452,7 +1433,13 @@ def get_coqui_supported_languages():
 
 def get_coqui_models_by_language(language: str):
     """Return Coqui models for a specific language, including multilingual models."""
-    all_models = get_coqui_supported_models()
+    return list(_coqui_models_for_language(language))
+
+
+@functools.lru_cache(maxsize=32)
+def _coqui_models_for_language(language):
+    # Local models have no language in their name, so the built-in list is enough
+    all_models = _coqui_model_catalog()
     
     # First add models specific to the language
     language_specific = [model for model in all_models if f"/{language}/" in model or model.startswith(f"tts_models/{language}/")]
@@ -1485,7 +1472,7 @@ def get_coqui_models_by_language(language: str):
             if model not in result:
                 result.append(model)
         
-        return result
+        return tuple(result)
     else:
         # For other languages, combine language-specific + multilingual
         combined = language_specific + multilingual_models
@@ -1496,15 +1483,47 @@ def get_coqui_models_by_language(language: str):
             if model not in seen:
                 seen.add(model)
                 result.append(model)
-        return result
+        return tuple(result)
+
+
+@functools.lru_cache(maxsize=32)
+def _inspect_tts_model(model_name: str):
+    """Load a model once and keep only its speaker/language metadata.
+
+    The voice, language and info lookups below all need the same fields; this
+    lets them share one model load instead of each constructing TTS(model_name).
+    """
+    metadata = _load_tts_model_metadata(model_name)
+    return SimpleNamespace(
+        is_multi_speaker=metadata["is_multi_speaker"],
+        is_multi_lingual=metadata["is_multi_lingual"],
+        speakers=tuple(metadata["speakers"]) if metadata["speakers"] else None,
+        languages=tuple(metadata["languages"]) if metadata["languages"] else None,
+    )
+
+
+@disk_cached(ttl="7d")
+def _load_tts_model_metadata(model_name):
+    # A model's speakers/languages don't change, so keep them across restarts
+    # rather than loading the whole model again on the next UI session
+    _patch_torch_load()
+    from TTS.api import TTS
+
+    tts = TTS(model_name)
+    return {
+        "is_multi_speaker": bool(tts.is_multi_speaker),
+        "is_multi_lingual": bool(tts.is_multi_lingual),
+        "speakers": list(tts.speakers) if tts.speakers else None,
+        "languages": list(tts.languages) if tts.languages else None,
+    }
 
 
 def get_coqui_supported_voices(model_name: str = None):
     """Get available voices for a specific Coqui TTS model."""
+    if importlib.util.find_spec("TTS") is None:
+        logger.warning("TTS package not available for voice detection")
+        return ["Voz por Defecto"]
     try:
-        # Import TTS here to check model capabilities
-        from TTS.api import TTS
-        
         if not model_name:
             return []
         
@@ -1554,7 +1573,7 @@ def get_coqui_supported_voices(model_name: str = None):
         
         # Try to load the model and get speakers dynamically
         try:
-            tts = TTS(model_name)
+            tts = _inspect_tts_model(model_name)
             if tts.is_multi_speaker and tts.speakers:
                 # Add Spanish descriptive names if possible
                 spanish_speakers = []
@@ -1563,18 +1582,15 @@ def get_coqui_supported_voices(model_name: str = None):
                         spanish_speakers.append(f"{speaker} (Voz {i+1})")
                     else:
                         spanish_speakers.append(f"Voz {i+1}")
-                return spanish_speakers if spanish_speakers else tts.speakers
+                return spanish_speakers if spanish_speakers else list(tts.speakers)
             elif tts.is_multi_lingual and hasattr(tts, 'speakers') and tts.speakers:
-                return tts.speakers
+                return list(tts.speakers)
             else:
                 return ["Voz por Defecto"]
         except Exception as e:
             logger.debug(f"Could not load model {model_name} to check speakers: {e}")
             return ["Voz por Defecto"]
             
-    except ImportError:
-        logger.warning("TTS package not available for voice detection")
-        return ["Voz por Defecto"]
     except Exception as e:
         logger.error(f"Error getting voices for model {model_name}: {e}")
         return ["Voz por Defecto"]
@@ -1582,9 +1598,10 @@ def get_coqui_supported_voices(model_name: str = None):
 
 def get_coqui_supported_languages_for_model(model_name: str = None):
     """Get supported languages for a specific Coqui TTS model."""
+    if importlib.util.find_spec("TTS") is None:
+        logger.warning("TTS package not available for language detection")
+        return ["en"]
     try:
-        from TTS.api import TTS
-        
         if not model_name:
             return []
             
@@ -1597,9 +1614,9 @@ def get_coqui_supported_languages_for_model(model_name: str = None):
         
         # Try to load model and get languages
         try:
-            tts = TTS(model_name)
+            tts = _inspect_tts_model(model_name)
             if tts.is_multi_lingual and tts.languages:
-                return tts.languages
+                return list(tts.languages)
             else:
                 # Extract language from model path
                 if "/" in model_name:
@@ -1616,9 +1633,6 @@ def get_coqui_supported_languages_for_model(model_name: str = None):
                     return [parts[1]]
             return ["en"]
             
-    except ImportError:
-        logger.warning("TTS package not available for language detection")
-        return ["en"]
     except Exception as e:
         logger.error(f"Error getting languages for model {model_name}: {e}")
         return ["en"]
@@ -1626,9 +1640,17 @@ def get_coqui_supported_languages_for_model(model_name: str = None):
 
 def get_coqui_model_info(model_name: str):
     """Get detailed information about a Coqui TTS model."""
+    if importlib.util.find_spec("TTS") is None:
+        logger.warning("TTS package not available for model info")
+        return {
+            "is_multi_speaker": False,
+            "is_multi_lingual": False,
+            "speakers": ["Default"],
+            "languages": ["en"],
+            "supports_voice_cloning": False,
+            "model_type": "unknown"
+        }
     try:
-        from TTS.api import TTS
-        
         info = {
             "is_multi_speaker": False,
             "is_multi_lingual": False,
@@ -1659,12 +1681,12 @@ def get_coqui_model_info(model_name: str):
         
         # Try to get actual model info
         try:
-            tts = TTS(model_name)
+            tts = _inspect_tts_model(model_name)
             info.update({
                 "is_multi_speaker": tts.is_multi_speaker,
                 "is_multi_lingual": tts.is_multi_lingual,
-                "speakers": tts.speakers if tts.is_multi_speaker else ["Default"],
-                "languages": tts.languages if tts.is_multi_lingual else get_coqui_supported_languages_for_model(model_name)
+                "speakers": list(tts.speakers or []) if tts.is_multi_speaker else ["Default"],
+                "languages": list(tts.languages or []) if tts.is_multi_lingual else get_coqui_supported_languages_for_model(model_name)
             })
         except Exception as e:
             logger.debug(f"Could not load model {model_name} for info: {e}")
@@ -1674,16 +1696,6 @@ def get_coqui_model_info(model_name: str):
         
         return info
         
-    except ImportError:
-        logger.warning("TTS package not available for model info")
-        return {
-            "is_multi_speaker": False,
-            "is_multi_lingual": False,
-            "speakers": ["Default"],
-            "languages": ["en"],
-            "supports_voice_cloning": False,
-            "model_type": "unknown"
-        }
     except Exception as e:
         logger.error(f"Error getting model info for {model_name}: {e}")
         return {
@@ -1696,6 +1708,43 @@ def get_coqui_model_info(model_name: str):
         }
 
 
+# get_coqui_model_bundle results by model name, only for models whose metadata loaded;
+# a fallback bundle (TTS missing, download failed) is rebuilt on the next request
+_MODEL_BUNDLES = {}
+_MODEL_BUNDLES_SIZE = 128
+
+
+def get_coqui_model_bundle(model_name: str):
+    """Get (info, voices, languages) for a model in one call, cached per model name.
+
+    The bundle is shared between callers, so info is a read-only mapping and every
+    list in it (speakers, languages, voices) is a tuple.
+    """
+    bundle = _MODEL_BUNDLES.get(model_name)
+    if bundle is not None:
+        return bundle
+
+    # XTTS info is static; other models are loaded once (_inspect_tts_model is cached)
+    metadata_loaded = False
+    if importlib.util.find_spec("TTS") is not None:
+        try:
+            metadata_loaded = "xtts" in model_name.lower() or _inspect_tts_model(model_name) is not None
+        except Exception as e:
+            logger.debug(f"Could not load model {model_name}, not caching its bundle: {e}")
+
+    info = get_coqui_model_info(model_name)
+    bundle = (
+        MappingProxyType({key: tuple(value) if isinstance(value, list) else value for key, value in info.items()}),
+        tuple(get_coqui_supported_voices(model_name)),
+        tuple(get_coqui_supported_languages_for_model(model_name)),
+    )
+    if metadata_loaded:
+        if len(_MODEL_BUNDLES) >= _MODEL_BUNDLES_SIZE:
+            _MODEL_BUNDLES.pop(next(iter(_MODEL_BUNDLES)))
+        _MODEL_BUNDLES[model_name] = bundle
+    return bundle
+
+
 def get_coqui_supported_output_formats():
     """Return supported output formats for Coqui TTS."""
     return ["mp3", "wav"]
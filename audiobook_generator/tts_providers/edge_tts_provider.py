@@ -4,8 +4,6 @@ import math
 import io
 from time import sleep
 
-import edge_tts
-from edge_tts import list_voices
 from pydub import AudioSegment
 
 from audiobook_generator.config.general_config import GeneralConfig
@@ -27,6 +25,8 @@ async def get_supported_voices():
     # all available voices.
     # Returns:
     #     dict: A dictionary of voice attributes.
+    from edge_tts import list_voices
+
     voices = await list_voices()
     voices = sorted(voices, key=lambda voice: voice["ShortName"])
 
@@ -133,6 +133,8 @@ class CommWithPauses:
         logger.debug(f"Generating audio for: <{text}>")
         # this genertes the real TTS using edge_tts for this part.
         temp_chunk = io.BytesIO()
+        import edge_tts  # deferred: the UI only needs the static voice lists
+
         communicate = edge_tts.Communicate(text, self.voice_name, **self.kwargs)
         async for chunk in communicate.stream():
             if chunk["type"] == "audio":
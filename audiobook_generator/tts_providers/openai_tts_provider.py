@@ -5,8 +5,6 @@ import tempfile
 import os
 from pydub import AudioSegment
 
-from openai import OpenAI
-
 from audiobook_generator.core.audio_tags import AudioTags
 from audiobook_generator.config.general_config import GeneralConfig
 from audiobook_generator.utils.utils import split_text, set_audio_tags, merge_audio_segments
@@ -74,6 +72,9 @@ class OpenAITTSProvider(BaseTTSProvider):
                 provider_prefix=None  # Usar configuraciones generales
             )
 
+        # Imported here so listing models/voices in the UI doesn't load the SDK
+        from openai import OpenAI
+
         # User should set OPENAI_API_KEY environment variable for authentication.
         # If OPENAI_BASE_URL is set, prefer that so the OpenAI client can target
         # OpenAI-compatible servers (e.g. local Kokoro). Fall back to default client.
@@ -0,0 +1,48 @@
+"""Memoized provider catalog lookups for the web UI.
+
+The Gradio builder and the dropdown change handlers ask the providers for the
+same voice/language/format lists over and over. Each getter here is the provider
+function wrapped in an unbounded lru_cache (keyed by its arguments), so every
+catalog is built once per process. Results are returned as tuples because they
+are shared between callers.
+
+Coqui is not wrapped: its built-in model lists and per-model bundles are cached
+inside the provider, and local models are rescanned from disk on every call.
+"""
+import functools
+
+from audiobook_generator.tts_providers.azure_tts_provider import get_azure_supported_languages as _azure_languages, \
+    get_azure_supported_voices as _azure_voices, get_azure_supported_output_formats as _azure_output_formats
+from audiobook_generator.tts_providers.edge_tts_provider import get_edge_tts_supported_voices as _edge_voices, \
+    get_edge_tts_supported_language as _edge_languages, get_edge_tts_supported_output_formats as _edge_output_formats
+from audiobook_generator.tts_providers.openai_tts_provider import get_openai_supported_models as _openai_models, \
+    get_openai_supported_voices as _openai_voices, get_openai_supported_output_formats as _openai_output_formats
+from audiobook_generator.tts_providers.piper_tts_provider import get_piper_supported_languages as _piper_languages, \
+    get_piper_supported_voices as _piper_voices, get_piper_supported_qualities as _piper_qualities, \
+    get_piper_supported_speakers as _piper_speakers
+
+
+def _cached_catalog(getter):
+    @functools.lru_cache(maxsize=None)
+    @functools.wraps(getter)
+    def cached(*args):
+        return tuple(getter(*args))
+    return cached
+
+
+get_azure_supported_languages = _cached_catalog(_azure_languages)
+get_azure_supported_voices = _cached_catalog(_azure_voices)
+get_azure_supported_output_formats = _cached_catalog(_azure_output_formats)
+
+get_edge_tts_supported_language = _cached_catalog(_edge_languages)
+get_edge_tts_supported_voices = _cached_catalog(_edge_voices)
+get_edge_tts_supported_output_formats = _cached_catalog(_edge_output_formats)
+
+get_openai_supported_models = _cached_catalog(_openai_models)
+get_openai_supported_voices = _cached_catalog(_openai_voices)
+get_openai_supported_output_formats = _cached_catalog(_openai_output_formats)
+
+get_piper_supported_languages = _cached_catalog(_piper_languages)
+get_piper_supported_voices = _cached_catalog(_piper_voices)
+get_piper_supported_qualities = _cached_catalog(_piper_qualities)
+get_piper_supported_speakers = _cached_catalog(_piper_speakers)
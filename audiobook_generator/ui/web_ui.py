@@ -1,8 +1,21 @@
-from multiprocessing import Process
+import atexit
+from bisect import bisect_left, bisect_right
+import collections
+import dataclasses
+import functools
+from multiprocessing import get_context
+from multiprocessing.process import BaseProcess
 from typing import Optional
+import io
 import json
+import logging
 import os
+import re
 import requests
+import sys
+import time
+import wave
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from pathlib import Path
 
@@ -13,159 +26,241 @@ from gradio_log import Log
 os.environ["GRADIO_ANALYTICS_ENABLED"] = "False"
 gr.analytics.track = lambda *args, **kwargs: None
 from audiobook_generator.config.general_config import GeneralConfig
-from audiobook_generator.tts_providers.azure_tts_provider import get_azure_supported_languages, \
-    get_azure_supported_voices, get_azure_supported_output_formats
-from audiobook_generator.tts_providers.edge_tts_provider import get_edge_tts_supported_voices, \
-    get_edge_tts_supported_language, get_edge_tts_supported_output_formats
-from audiobook_generator.tts_providers.openai_tts_provider import get_openai_supported_models, \
-    get_openai_supported_voices, get_openai_instructions_example, get_openai_supported_output_formats
-from audiobook_generator.tts_providers.piper_tts_provider import get_piper_supported_languages, \
-    get_piper_supported_voices, get_piper_supported_qualities, get_piper_supported_speakers
-from audiobook_generator.tts_providers.coqui_tts_provider import (
-    get_coqui_supported_models, get_coqui_supported_output_formats, 
-    get_coqui_supported_languages, get_coqui_models_by_language,
-    get_coqui_supported_voices, get_coqui_supported_languages_for_model,
-    get_coqui_model_info
-)
+from audiobook_generator.tts_providers.openai_tts_provider import get_openai_instructions_example
+from audiobook_generator.tts_providers.coqui_tts_provider import get_coqui_model_bundle, \
+    get_coqui_supported_models, get_coqui_supported_output_formats, get_coqui_supported_languages, \
+    get_coqui_models_by_language
+from audiobook_generator.ui._catalog_cache import get_azure_supported_languages, \
+    get_azure_supported_voices, get_azure_supported_output_formats, \
+    get_edge_tts_supported_voices, get_edge_tts_supported_language, get_edge_tts_supported_output_formats, \
+    get_openai_supported_models, get_openai_supported_voices, get_openai_supported_output_formats, \
+    get_piper_supported_languages, get_piper_supported_voices, get_piper_supported_qualities, \
+    get_piper_supported_speakers
 from audiobook_generator.utils.log_handler import generate_unique_log_path
 from main import main
 
+logger = logging.getLogger(__name__)
+
+# Voice configs are (de)serialized on every mixer/tester event; use orjson's
+# native encoder when it is available (gradio depends on it) and fall back to
+# the stdlib otherwise. Preset/config files keep stdlib json for pretty output.
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 selected_tts = "Edge"
-running_process: Optional[Process] = None
+running_process: Optional[BaseProcess] = None
+# Fork on Linux so each run starts from this already-imported interpreter
+# (Gradio, providers) instead of re-importing it; other platforms keep spawn.
+# A fresh process per run is kept, rather than a reusable pool worker, so
+# "Stop" can still terminate a run that is in progress.
+_MP_CTX = get_context("fork" if sys.platform.startswith("linux") else "spawn")
 webui_log_file = None
 
+# Mapear los nombres de las pestañas a los nombres internos
+_TAB_MAPPING = {
+    "OpenAI": "OpenAI",
+    "Azure": "Azure", 
+    "Edge": "Edge",
+    "Piper": "Piper",
+    "Coqui TTS": "Coqui",  # Mapear "Coqui TTS" a "Coqui"
+    "Coqui": "Coqui",
+    "Kokoro": "Kokoro"
+}
+
+# Default path to the local piper executable
+try:
+    from audiobook_generator.utils.resource_path import resource_path
+    _DEFAULT_PIPER_PATH = str(resource_path("piper_tts/piper.exe"))
+except Exception:
+    _DEFAULT_PIPER_PATH = str(Path(__file__).parent.parent.parent / "piper_tts" / "piper.exe")
+
+# (local_group, docker_group) visibility for each Piper deployment choice. The
+# updates only carry "visible", so the same dicts can be returned on every event.
+_PIPER_DEPLOY_STATES = {
+    "Local": (gr.update(visible=True), gr.update(visible=False)),
+    "Docker": (gr.update(visible=False), gr.update(visible=True)),
+}
+
+
+def _uploaded_file_path(file):
+    """Path of an uploaded gr.File (a path string, or a tempfile wrapper on older Gradio)."""
+    return getattr(file, "name", file) or ""
+
+
 def on_tab_change(evt: gr.SelectData):
     print(f"{evt.value} tab selected")
     global selected_tts
-    # Mapear los nombres de las pestañas a los nombres internos
-    tab_mapping = {
-        "OpenAI": "OpenAI",
-        "Azure": "Azure", 
-        "Edge": "Edge",
-        "Piper": "Piper",
-        "Coqui TTS": "Coqui",  # Mapear "Coqui TTS" a "Coqui"
-        "Coqui": "Coqui",
-        "Kokoro": "Kokoro"
-    }
-    selected_tts = tab_mapping.get(evt.value, evt.value)
+    selected_tts = _TAB_MAPPING.get(evt.value, evt.value)
     print(f"Selected TTS provider: {selected_tts}")
 
+# Static (languages, voices) catalogs of the cloud providers, by provider name
+_VOICE_CATALOGS = {
+    "azure": get_azure_supported_voices,
+    "edge": get_edge_tts_supported_voices,
+}
+
+
+@functools.cache
+def _sorted_voice_catalog(provider):
+    """Sort a provider's voice list once, keeping each voice's catalog position."""
+    ordered = sorted((voice, position) for position, voice in enumerate(_VOICE_CATALOGS[provider]()))
+    return tuple(voice for voice, _ in ordered), tuple(position for _, position in ordered)
+
+
+def _voices_for_language(provider, language):
+    # Prefix match by binary search over the sorted catalog, then restore catalog order
+    keys, positions = _sorted_voice_catalog(provider)
+    lo = bisect_left(keys, language)
+    hi = bisect_right(keys, language + "\uffff")
+    return [keys[i] for i in sorted(range(lo, hi), key=positions.__getitem__)]
+
+# Event handlers below return gr.update(...) with only the fields that change;
+# labels and info stay on the component definitions in host_ui.
 def get_azure_voices_by_language(language):
-    voices_list = [voice for voice in get_azure_supported_voices() if voice.startswith(language)]
-    return gr.Dropdown(voices_list, value=voices_list[0], label="Voice", interactive=True, info="Select the voice")
+    voices_list = _voices_for_language("azure", language)
+    return gr.update(choices=voices_list, value=voices_list[0] if voices_list else None, interactive=True)
 
 def get_edge_voices_by_language(language):
-    voices_list = [voice for voice in get_edge_tts_supported_voices() if voice.startswith(language)]
-    return gr.Dropdown(voices_list, value=voices_list[0], label="Voice", interactive=True, info="Select the voice")
+    voices_list = _voices_for_language("edge", language)
+    return gr.update(choices=voices_list, value=voices_list[0] if voices_list else None, interactive=True)
 
 def get_piper_supported_voices_gui(language):
     voices_list = get_piper_supported_voices(language)
-    return gr.Dropdown(voices_list, value=voices_list[0], label="Voice", interactive=True, info="Select the voice")
+    return gr.update(choices=voices_list, value=voices_list[0], interactive=True)
 
 def get_piper_supported_qualities_gui(language, voice):
     qualities_list = get_piper_supported_qualities(language, voice)
-    return gr.Dropdown(qualities_list, value=qualities_list[0], label="Quality", interactive=True, info="Select the quality")
+    return gr.update(choices=qualities_list, value=qualities_list[0], interactive=True)
 
 def get_piper_supported_speakers_gui(language, voice, quality):
     speakers_list = get_piper_supported_speakers(language, voice, quality)
-    return gr.Dropdown(speakers_list, value=speakers_list[0], label="Speaker", interactive=True, info="Select the speaker")
+    return gr.update(choices=speakers_list, value=speakers_list[0], interactive=True)
 
 def get_coqui_models_by_language_gui(language):
     models_list = get_coqui_models_by_language(language)
     if not models_list:
         models_list = get_coqui_supported_models()  # Fallback to all models
-    return gr.Dropdown(models_list, value=models_list[0] if models_list else "", label="Model", interactive=True, allow_custom_value=True, info="Select a model or enter a custom model name")
+    return gr.update(choices=models_list, value=models_list[0] if models_list else "", interactive=True)
 
 def get_coqui_voices_by_model_gui(model_name):
     """Get voices available for a specific Coqui model."""
     if not model_name:
-        return gr.Dropdown(["Default"], value="Default", label="Voice/Speaker", interactive=True)
+        return gr.update(choices=["Default"], value="Default", interactive=True)
     
-    voices = get_coqui_supported_voices(model_name)
-    if not voices:
-        voices = ["Default"]
+    voices = list(get_coqui_model_bundle(model_name)[1]) or ["Default"]
     
-    return gr.Dropdown(voices, value=voices[0], label="Voice/Speaker", interactive=True, 
-                      allow_custom_value=True)
+    return gr.update(choices=voices, value=voices[0], interactive=True)
 
 def get_coqui_languages_by_model_gui(model_name):
     """Get languages available for a specific Coqui model."""
     if not model_name:
-        return gr.Dropdown(["en"], value="en", label="Language", interactive=True)
+        return gr.update(choices=["en"], value="en", interactive=True)
     
-    languages = get_coqui_supported_languages_for_model(model_name)
-    if not languages:
-        languages = ["en"]
+    languages = list(get_coqui_model_bundle(model_name)[2]) or ["en"]
     
-    return gr.Dropdown(languages, value=languages[0], label="Language", interactive=True)
+    return gr.update(choices=languages, value=languages[0], interactive=True)
+
+# Model information shown under the Coqui model dropdown, by model kind.
+# XTTS is checked first, wherever it appears in the name, then Spanish-only models.
+_COQUI_MODEL_KIND_RE = re.compile(r"(?P<xtts>(?=.*(?i:xtts)))|(?P<es>(?=.*/es/))")
+_COQUI_INFO_HEADER = "**📋 {model}**"
+_COQUI_INFO_TEMPLATES = {
+    "xtts": "\n\n".join([
+        _COQUI_INFO_HEADER,
+        "🌟 **PREMIUM MODEL** - Maximum quality",
+        "🎤 {nv} predefined voices",
+        "🌍 {nl} supported languages",
+        "✅ Voice cloning",
+        "⚡ Requires GPU for best performance",
+    ]),
+    "es": "\n\n".join([
+        _COQUI_INFO_HEADER,
+        "🇪🇸 **SPANISH-SPECIFIC MODEL**",
+        "✅ Optimized for Spanish",
+        "⚡ Works well on CPU",
+    ]),
+}
+# Generic models list only the capabilities the model reports
+_COQUI_GENERIC_INFO_LINES = (
+    ("is_multi_speaker", "🎤 Multi-speaker ({nv} voices)"),
+    ("is_multi_lingual", "🌍 Multi-language ({nl} languages)"),
+    ("supports_voice_cloning", "✅ Voice cloning"),
+)
+
+
+def _coqui_model_kind(model_name):
+    """Classify a Coqui model name as "xtts", "es" or "generic"."""
+    match = _COQUI_MODEL_KIND_RE.match(model_name)
+    return match.lastgroup if match else "generic"
+
+
+# The browser renders every dropdown option up front, so long speaker/voice lists
+# are capped; the rest can still be typed in (these dropdowns allow custom values).
+_DROPDOWN_CHOICE_LIMIT = 50
+
+
+def _speaker_dropdown_update(voices, **kwargs):
+    shown = voices[:_DROPDOWN_CHOICE_LIMIT]
+    info = f"Showing {len(shown)} of {len(voices)} speakers; type a name to use another" if len(shown) < len(voices) else None
+    return gr.update(choices=shown, info=info, **kwargs)
+
+
+def load_coqui_tab(loaded, model_name):
+    """Fill the speaker list the first time the Coqui tab is opened (it imports TTS)."""
+    if loaded:
+        return gr.skip(), True
+    return _speaker_dropdown_update(get_coqui_model_bundle(model_name)[1]), True
+
 
 def update_coqui_model_options(model_name):
     """Update voice and language options when model changes."""
     if not model_name:
         return (
-            gr.Dropdown(["Default Voice"], value="Default Voice", label="🎤 Voice/Speaker", interactive=True),
-            gr.Dropdown(["es"], value="es", label="🗣️ Target Language", interactive=True),
-            gr.File(visible=False),  # speaker_wav file
-            gr.Markdown("**📋 Model Information:** Select a model first")
+            gr.update(choices=["Default Voice"], value="Default Voice", interactive=True),
+            gr.update(choices=["es"], value="es", interactive=True),
+            gr.update(visible=False),  # speaker_wav file
+            "**📋 Model Information:** Select a model first"
         )
     
-    # Get model information
-    model_info = get_coqui_model_info(model_name)
-    voices = get_coqui_supported_voices(model_name)
-    languages = get_coqui_supported_languages_for_model(model_name)
+    # Get model information (one cached lookup for all three)
+    # The cached tuples are shared, so they are never mutated in place.
+    model_info, voices, languages = get_coqui_model_bundle(model_name)
     
     # Ensure Spanish is first in languages if available
-    if "es" in languages and languages[0] != "es":
-        languages.remove("es")
-        languages.insert(0, "es")
+    if "es" in languages:
+        languages = ("es",) + tuple(lang for lang in languages if lang != "es")
     
     # Update voice dropdown
-    voice_dropdown = gr.Dropdown(
-        voices, 
+    voice_dropdown = _speaker_dropdown_update(
+        voices,
         value=voices[0] if voices else "Default Voice", 
-        label="🎤 Voice/Speaker", 
-        interactive=True,
-        allow_custom_value=True
+        interactive=True
     )
     
     # Update language dropdown
-    language_dropdown = gr.Dropdown(
-        languages,
+    language_dropdown = gr.update(
+        choices=languages,
         value="es" if "es" in languages else (languages[0] if languages else "es"),
-        label="🗣️ Target Language",
         interactive=model_info.get("is_multi_lingual", False)
     )
     
     # Show/hide voice cloning file upload based on model capabilities
-    show_speaker_wav = model_info.get("supports_voice_cloning", False)
-    speaker_wav_file = gr.File(
-        label="🎙️ Voice Cloning - Upload reference audio",
-        file_types=[".wav", ".mp3", ".flac"],
-        visible=show_speaker_wav
-    )
+    speaker_wav_file = gr.update(visible=model_info.get("supports_voice_cloning", False))
     
     # Create detailed model info text
-    info_parts = [f"**📋 {model_name}**"]
-    
-    if "xtts" in model_name.lower():
-        info_parts.append("🌟 **PREMIUM MODEL** - Maximum quality")
-        info_parts.append(f"🎤 {len(voices)} predefined voices")
-        info_parts.append(f"🌍 {len(languages)} supported languages")
-        info_parts.append("✅ Voice cloning")
-        info_parts.append("⚡ Requires GPU for best performance")
-    elif "/es/" in model_name:
-        info_parts.append("🇪🇸 **SPANISH-SPECIFIC MODEL**")
-        info_parts.append("✅ Optimized for Spanish")
-        info_parts.append("⚡ Works well on CPU")
-    else:
-        if model_info.get("is_multi_speaker", False):
-            info_parts.append(f"🎤 Multi-speaker ({len(voices)} voices)")
-        if model_info.get("is_multi_lingual", False):
-            info_parts.append(f"🌍 Multi-language ({len(languages)} languages)")
-        if model_info.get("supports_voice_cloning", False):
-            info_parts.append("✅ Voice cloning")
-    
-    model_info_text = gr.Markdown("\n\n".join(info_parts))
+    kind = _coqui_model_kind(model_name)
+    template = _COQUI_INFO_TEMPLATES.get(kind) or "\n\n".join(
+        [_COQUI_INFO_HEADER] + [line for flag, line in _COQUI_GENERIC_INFO_LINES if model_info.get(flag, False)]
+    )
+    model_info_text = template.format(model=model_name, nv=len(voices), nl=len(languages))
     
     return voice_dropdown, language_dropdown, speaker_wav_file, model_info_text
 
@@ -186,83 +281,163 @@ def apply_noticias_preset():
     """Preset for news style."""
     return 0.9, 0.3, 0.6  # News pace, less expressive, precise timing
 
-# Functions for audio quality presets
-def apply_mobile_quality_preset():
-    """Preset for mobile/podcast quality - Small files"""
-    return "22050", "128k", 1, "16", 4, True  # sample_rate, bitrate, channels, bit_depth, mp3_quality, limiter
+# Audio quality presets, in quality widget order:
+# (sample_rate, bitrate, channels, bit_depth, mp3_quality, limiter, normalize)
+_QUALITY_TIERS = {
+    "mobile": (22050, "128k", 1, 16, 4, True, True),  # Móvil/podcast - Archivos pequeños
+    "desktop": (44100, "192k", 1, 24, 2, True, True),  # Escritorio - Balance calidad/tamaño
+    "high": (44100, "320k", 1, 24, 0, True, True),  # Alta calidad - Recomendado
+    "max": (48000, "320k", 2, 24, 0, True, True),  # Máxima calidad - Archivos grandes
+}
+
+# Per (engine, tier). Coqui's dropdowns hold strings and it has no normalize toggle.
+_QUALITY_PRESETS = {
+    **{(engine, tier): preset
+       for engine in ("openai", "piper", "kokoro") for tier, preset in _QUALITY_TIERS.items()},
+    **{("coqui", tier): (str(rate), bitrate, channels, str(depth), mp3_quality, limiter)
+       for tier, (rate, bitrate, channels, depth, mp3_quality, limiter, _) in _QUALITY_TIERS.items()},
+}
+
+
+def _apply_preset(engine, tier, current):
+    """Values for an engine's quality widgets under the given preset tier.
+
+    ``current`` is the engine's quality State; widgets that already hold the
+    preset value are skipped so the browser does not repaint them.
+    """
+    preset = _QUALITY_PRESETS[(engine, tier)]
+    return tuple(gr.skip() if current.get(key) == value else value
+                 for key, value in zip(_QUALITY_KEYS, preset))
+
+def _kokoro_format_visibility(output_format):
+    """Show only the quality widgets the export path uses for this format.
+
+    Returns visibility updates for (bitrate, wav bit depth, mp3 quality):
+    bitrate applies to lossy formats, bit depth to WAV, quality level to MP3.
+    """
+    return (
+        gr.update(visible=output_format in ("mp3", "opus")),
+        gr.update(visible=output_format == "wav"),
+        gr.update(visible=output_format == "mp3"),
+    )
+
+
+# Keys of the per-engine audio quality dict held in a gr.State, in widget order
+_QUALITY_KEYS = ("sample_rate", "audio_bitrate", "audio_channels", "wav_bit_depth",
+                 "mp3_quality", "enable_limiter", "normalize_volume")
+
+
+def _quality_settings(*values):
+    """Pack an engine's audio quality widget values into a single dict."""
+    return dict(zip(_QUALITY_KEYS, values))
+
 
-def apply_desktop_quality_preset():
-    """Preset for desktop quality - Balance quality/size"""
-    return "44100", "192k", 1, "24", 2, True
+def _bind_quality_state(engine, widgets, state, preset_buttons):
+    """Wire an engine's preset buttons and keep its quality gr.State in sync with its widgets.
 
-def apply_high_quality_preset():
-    """Preset for high quality - Recommended"""
-    return "44100", "320k", 1, "24", 0, True
+    ``preset_buttons`` maps a tier of _QUALITY_TIERS to its button. User edits arrive
+    through ``.input`` (which programmatic updates do not fire); preset buttons
+    update the widgets first and refresh the state in a chained step.
+    """
+    gr.on(triggers=[widget.input for widget in widgets], fn=_quality_settings, inputs=widgets, outputs=state)
+    for tier, button in preset_buttons.items():
+        button.click(fn=functools.partial(_apply_preset, engine, tier), inputs=state, outputs=widgets
+                     ).then(fn=_quality_settings, inputs=widgets, outputs=state)
+
+
+# One keep-alive session for every Kokoro request so rapid UI interactions reuse
+# pooled connections instead of opening a new socket each time.
+_KOKORO_SESSION = requests.Session()
+_KOKORO_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_KOKORO_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+atexit.register(_KOKORO_SESSION.close)
+
+
+# Voice catalogs keyed by base URL as (fetched_at, KokoroCatalog). The UI asks for the same
+# list from several widgets and handlers, so it is reused for a short while and
+# dropped on "Refresh Voices" or a successful connection test.
+_VOICES_CACHE = {}
+_VOICES_CACHE_TTL = 60  # seconds
 
-def apply_max_quality_preset():
-    """Preset for maximum quality - Large files"""
-    return "48000", "320k", 2, "24", 0, True
 
-# Functions for OpenAI/Kokoro audio quality presets
-def apply_openai_mobile_quality_preset():
-    """Preset para calidad móvil/podcast OpenAI - Archivos pequeños"""
-    return 22050, "128k", 1, 16, 4, True, True  # sample_rate, bitrate, channels, bit_depth, mp3_quality, limiter, normalize
+@functools.lru_cache(maxsize=16)
+def _kokoro_voice_pattern(language_code):
+    """Compiled matcher for voice ids of a language ('e' -> ef_/em_ voices); longer codes match as a prefix."""
+    suffix = "[fm]_" if len(language_code) == 1 else ""
+    return re.compile(re.escape(language_code) + suffix)
 
-def apply_openai_desktop_quality_preset():
-    """Preset para calidad escritorio OpenAI - Balance calidad/tamaño"""
-    return 44100, "192k", 1, 24, 2, True, True
 
-def apply_openai_high_quality_preset():
-    """Preset para alta calidad OpenAI - Recomendado"""
-    return 44100, "320k", 1, 24, 0, True, True
+@dataclasses.dataclass(frozen=True)
+class KokoroCatalog:
+    """Kokoro voice list plus the same voices bucketed by their language letter."""
+    voices: tuple  # in server order
+    by_lang: dict  # language code -> tuple of voices matching _kokoro_voice_pattern(code)
 
-def apply_openai_max_quality_preset():
-    """Preset para máxima calidad OpenAI - Archivos grandes"""
-    return 48000, "320k", 2, 24, 0, True, True
+    @classmethod
+    def from_voices(cls, voices):
+        by_lang = collections.defaultdict(list)
+        for voice in voices:
+            code = str(voice)[:1]
+            if code and _kokoro_voice_pattern(code).match(str(voice)):
+                by_lang[code].append(voice)
+        return cls(tuple(voices), {code: tuple(group) for code, group in by_lang.items()})
+
+    def for_language(self, language_code):
+        """Same result as filter_voices_by_language(self.voices, language_code)."""
+        if len(language_code or "") > 1:
+            return list(filter_voices_by_language(self.voices, language_code))
+        return list(self.by_lang.get(language_code, self.voices) if language_code else self.voices)
 
-# Functions for Piper audio quality presets
-def apply_piper_mobile_quality_preset():
-    """Preset para calidad móvil/podcast Piper - Archivos pequeños"""
-    return 22050, "128k", 1, 16, 4, True, True  # sample_rate, bitrate, channels, bit_depth, mp3_quality, limiter, normalize
+    @functools.cached_property
+    def search_index(self):
+        """(lowercase id, voice) pairs in server order, for the mixer search box."""
+        return tuple((str(voice).lower(), voice) for voice in self.voices)
 
-def apply_piper_desktop_quality_preset():
-    """Preset para calidad escritorio Piper - Balance calidad/tamaño"""
-    return 44100, "192k", 1, 24, 2, True, True
+    @functools.cached_property
+    def sorted_search_index(self):
+        """search_index sorted by lowercase id, plus those ids alone for bisecting."""
+        ordered = tuple(sorted(self.search_index))
+        return ordered, [lower for lower, _ in ordered]
 
-def apply_piper_high_quality_preset():
-    """Preset para alta calidad Piper - Recomendado"""
-    return 44100, "320k", 1, 24, 0, True, True
 
-def apply_piper_max_quality_preset():
-    """Preset para máxima calidad Piper - Archivos grandes"""
-    return 48000, "320k", 2, 24, 0, True, True
+_FALLBACK_KOKORO_CATALOG = KokoroCatalog.from_voices([
+    "af_bella", "af_sky", "af_heart", "af_nicole", "af_sarah", "af_emma",
+    "bf_emma", "bf_sarah", "bf_nicole", "bf_sky",
+    "am_adam", "am_daniel", "bm_lewis", "bm_george"
+])
 
-# Functions for Kokoro audio quality presets
-def apply_kokoro_mobile_quality_preset():
-    """Preset para calidad móvil/podcast Kokoro - Archivos pequeños"""
-    return 22050, "128k", 1, 16, 4, True, True  # sample_rate, bitrate, channels, bit_depth, mp3_quality, limiter, normalize
 
-def apply_kokoro_desktop_quality_preset():
-    """Preset para calidad escritorio Kokoro - Balance calidad/tamaño"""
-    return 44100, "192k", 1, 24, 2, True, True
+def fetch_kokoro_catalog(kokoro_base_url: str = "http://localhost:8880"):
+    """Fetch the Kokoro voice catalog, reusing a recent result for the same URL."""
+    cached = _VOICES_CACHE.get(kokoro_base_url)
+    if cached is not None and time.monotonic() - cached[0] < _VOICES_CACHE_TTL:
+        return cached[1]
 
-def apply_kokoro_high_quality_preset():
-    """Preset para alta calidad Kokoro - Recomendado"""
-    return 44100, "320k", 1, 24, 0, True, True
+    voices = _fetch_kokoro_voices_uncached(kokoro_base_url)
+    if voices is not None:
+        catalog = KokoroCatalog.from_voices(voices)
+        _VOICES_CACHE[kokoro_base_url] = (time.monotonic(), catalog)
+        return catalog
 
-def apply_kokoro_max_quality_preset():
-    """Preset para máxima calidad Kokoro - Archivos grandes"""
-    return 48000, "320k", 2, 24, 0, True, True
+    # Default voices as fallback (not cached, so the next call retries)
+    return _FALLBACK_KOKORO_CATALOG
 
 
 def fetch_kokoro_voices(kokoro_base_url: str = "http://localhost:8880"):
-    """Fetch available voices from Kokoro server using the correct endpoint."""
+    """Fetch available voices from Kokoro server, reusing a recent result for the same URL."""
+    return list(fetch_kokoro_catalog(kokoro_base_url).voices)
+
+
+def _fetch_kokoro_voices_uncached(kokoro_base_url: str):
+    """Fetch available voices from Kokoro server using the correct endpoint; None if unreachable."""
     try:
         # Use the correct Kokoro voices endpoint
         url = f"{kokoro_base_url.rstrip('/')}/v1/audio/voices"
-        resp = requests.get(url, timeout=10)
+        # Short connect timeout: an unreachable server should fall back quickly
+        resp = _KOKORO_SESSION.get(url, timeout=(3, 10))
         if resp.status_code != 200:
-            return []
+            # Not cached, so the fallback voices are used and the next call retries
+            return None
         
         data = resp.json()
         
@@ -275,38 +450,35 @@ def fetch_kokoro_voices(kokoro_base_url: str = "http://localhost:8880"):
             return []
             
         # Ensure we return a list of strings
-        voice_list = []
-        for voice in voices:
-            if isinstance(voice, dict):
-                voice_list.append(voice.get('id', voice.get('name', str(voice))))
-            elif isinstance(voice, str):
-                voice_list.append(voice)
-        
-        return voice_list
+        return [
+            voice if isinstance(voice, str) else voice.get('id') or voice.get('name') or str(voice)
+            for voice in voices
+            if isinstance(voice, (str, dict))
+        ]
         
     except Exception as e:
         print(f"Error fetching Kokoro voices: {e}")
-        # Return default voices as fallback
-        return [
-            "af_bella", "af_sky", "af_heart", "af_nicole", "af_sarah", "af_emma",
-            "bf_emma", "bf_sarah", "bf_nicole", "bf_sky",
-            "am_adam", "am_daniel", "bm_lewis", "bm_george"
-        ]
+        return None
+
+_KOKORO_LANGUAGES = (
+    ("", "Auto-detect"),
+    ("a", "English (US)"), 
+    ("b", "British English"),
+    ("e", "Spanish"),
+    ("f", "French"), 
+    ("h", "Hindi"),
+    ("i", "Italian"),
+    ("p", "Portuguese"),
+    ("j", "Japanese"),
+    ("z", "Chinese")
+)
+_KOKORO_NAME_TO_CODE = {name: code for code, name in _KOKORO_LANGUAGES}
+_KOKORO_LANGUAGE_NAMES = tuple(_KOKORO_NAME_TO_CODE)
+_KOKORO_CODE_TO_NAME = dict(_KOKORO_LANGUAGES)
 
 def get_kokoro_languages():
     """Get supported Kokoro languages with their full names."""
-    return [
-        ("", "Auto-detect"),
-        ("a", "English (US)"), 
-        ("b", "British English"),
-        ("e", "Spanish"),
-        ("f", "French"), 
-        ("h", "Hindi"),
-        ("i", "Italian"),
-        ("p", "Portuguese"),
-        ("j", "Japanese"),
-        ("z", "Chinese")
-    ]
+    return list(_KOKORO_LANGUAGES)
 
 def filter_voices_by_language(voices, language_code):
     """Filter voices based on language preference using Kokoro voice naming convention.
@@ -318,12 +490,8 @@ def filter_voices_by_language(voices, language_code):
     if not language_code or language_code == "":
         return voices  # Return all voices for auto-detect
     
-    # Filter voices that start with the language code
-    filtered = []
-    for voice in voices:
-        voice_str = str(voice)
-        if voice_str.startswith(language_code):
-            filtered.append(voice)
+    match = _kokoro_voice_pattern(language_code).match
+    filtered = [voice for voice in voices if match(str(voice))]
     
     # If no voices match the language, return all voices as fallback
     return filtered if filtered else voices
@@ -331,12 +499,13 @@ def filter_voices_by_language(voices, language_code):
 
 def get_kokoro_voices_gui(base_url: str = None, language_code: str = ""):
     base = base_url or os.environ.get('OPENAI_BASE_URL', 'http://localhost:8880')
-    all_voices = fetch_kokoro_voices(base.rstrip('/'))
-    filtered_voices = filter_voices_by_language(all_voices, language_code)
+    catalog = fetch_kokoro_catalog(base.rstrip('/'))
+    all_voices = catalog.voices
+    filtered_voices = catalog.for_language(language_code)
     
     if not filtered_voices:
         # Default fallback voices (American English)
-        filtered_voices = [v for v in all_voices if str(v).startswith('a')] or all_voices[:4]
+        filtered_voices = list(catalog.by_lang.get('a', ())) or list(all_voices[:4])
     
     return gr.Dropdown(
         choices=filtered_voices, 
@@ -349,28 +518,49 @@ def get_kokoro_voices_gui(base_url: str = None, language_code: str = ""):
 
 def update_kokoro_voices_by_language(language_code, base_url):
     """Update voice dropdown when language changes."""
-    all_voices = fetch_kokoro_voices(base_url or 'http://localhost:8880')
-    filtered_voices = filter_voices_by_language(all_voices, language_code)
+    catalog = fetch_kokoro_catalog(base_url or 'http://localhost:8880')
+    all_voices = catalog.voices
+    filtered_voices = catalog.for_language(language_code)
     
     if not filtered_voices:
         # Default fallback voices (American English)
-        filtered_voices = [v for v in all_voices if str(v).startswith('a')] or all_voices[:4]
+        filtered_voices = list(catalog.by_lang.get('a', ())) or list(all_voices[:4])
     
     # Get language name for display
-    lang_dict = dict(get_kokoro_languages())
-    lang_name = lang_dict.get(language_code, 'selected language')
+    lang_name = _KOKORO_CODE_TO_NAME.get(language_code, 'selected language')
+    info = f"Select a Kokoro voice ({len(filtered_voices)} available for {lang_name})"
+    if len(filtered_voices) > _DROPDOWN_CHOICE_LIMIT:
+        info += f"; showing the first {_DROPDOWN_CHOICE_LIMIT}, pick a language or type a name for the rest"
     
     return gr.Dropdown(
-        choices=filtered_voices,
+        choices=filtered_voices[:_DROPDOWN_CHOICE_LIMIT],
         value=filtered_voices[0] if filtered_voices else None,
         label="Kokoro Voice",
         interactive=True,
         allow_custom_value=True,
-        info=f"Select a Kokoro voice ({len(filtered_voices)} available for {lang_name})"
+        info=info
     )
 
 
+def _kokoro_language_code(language_name: str) -> str:
+    """Map a Kokoro language display name (e.g. "Spanish") to its code, or "" if unknown."""
+    return _KOKORO_NAME_TO_CODE.get(language_name, "")
+
+
+def kokoro_voices_for_ui(language_name, base_url):
+    """Update voice dropdown from the language dropdown's display name."""
+    return update_kokoro_voices_by_language(_kokoro_language_code(language_name), base_url)
+
+
 # Advanced Kokoro Functions
+
+# Successful results of validate_voice_combination keyed by (voice_spec, base_url);
+# cleared whenever a connection test succeeds, since the server's voice list may have
+# changed. Failures are not kept: they may come from an unreachable server.
+_VALIDATION_CACHE = {}
+_VALIDATION_CACHE_SIZE = 64
+
+
 def validate_voice_combination(voice_spec: str, base_url: str = "http://localhost:8880"):
     """
     Validate voice combination syntax and check if voices exist
@@ -382,6 +572,24 @@ def validate_voice_combination(voice_spec: str, base_url: str = "http://localhos
     Returns:
         Tuple of (is_valid: bool, message: str)
     """
+    key = (voice_spec, base_url)
+    cached = _VALIDATION_CACHE.get(key)
+    if cached is not None:
+        return cached
+    result = _validate_voice_combination_uncached(voice_spec, base_url)
+    if result[0]:
+        if len(_VALIDATION_CACHE) >= _VALIDATION_CACHE_SIZE:
+            _VALIDATION_CACHE.pop(next(iter(_VALIDATION_CACHE)))
+        _VALIDATION_CACHE[key] = result
+    return result
+
+
+def validate_voice_combination_msg(voice_spec: str, base_url: str = "http://localhost:8880"):
+    """Validation message only, for binding straight to a status textbox"""
+    return validate_voice_combination(voice_spec, base_url)[1]
+
+
+def _validate_voice_combination_uncached(voice_spec: str, base_url: str):
     try:
         # Import the provider to use its validation logic
         from audiobook_generator.tts_providers.kokoro_tts_provider import KokoroTTSProvider
@@ -419,7 +627,7 @@ def create_voice_combination(voice_spec: str, base_url: str = "http://localhost:
     """
     try:
         # Check if the server allows voice combination creation
-        response = requests.post(
+        response = _KOKORO_SESSION.post(
             f"{base_url.rstrip('/')}/v1/audio/voices/combine",
             json=voice_spec,
             headers={"Authorization": "Bearer fake-key", "Content-Type": "application/json"},
@@ -440,7 +648,7 @@ def create_voice_combination(voice_spec: str, base_url: str = "http://localhost:
 def test_kokoro_connection(base_url: str = "http://localhost:8880"):
     """Test connection to Kokoro server"""
     try:
-        response = requests.get(f"{base_url.rstrip('/')}/v1/models", timeout=5)
+        response = _KOKORO_SESSION.get(f"{base_url.rstrip('/')}/v1/models", timeout=5)
         if response.status_code == 200:
             return True, f"✅ Connected to Kokoro server at {base_url}"
         else:
@@ -449,20 +657,26 @@ def test_kokoro_connection(base_url: str = "http://localhost:8880"):
         return False, f"❌ Connection failed: {str(e)}"
 
 
+_KOKORO_SAMPLE_TEXTS = {
+    "": "Hello, this is a test of the selected voice.",
+    "a": "Hello, this is a test of the American English voice.",
+    "b": "Hello, this is a test of the British English voice.",
+    "e": "Hola, esta es una prueba de la voz en español.",
+    "f": "Bonjour, ceci est un test de la voix française.",
+    "h": "नमस्ते, यह चयनित आवाज़ का परीक्षण है।",
+    "i": "Ciao, questo è un test della voce italiana.",
+    "p": "Olá, este é um teste da voz portuguesa.",
+    "j": "こんにちは、これは選択された音声のテストです。",
+    "z": "你好，这是所选语音的测试。"
+}
+
+# Preview language for a voice prefix when none is selected (e.g. "em" -> "e" for Spanish)
+_VOICE_PREFIX_LANGUAGE = {"af": "a", "am": "a", "em": "e", "ef": "e", "fm": "f", "ff": "f"}
+
+
 def get_kokoro_voice_samples():
     """Get sample text for different languages to test voices"""
-    return {
-        "": "Hello, this is a test of the selected voice.",
-        "a": "Hello, this is a test of the American English voice.",
-        "b": "Hello, this is a test of the British English voice.",
-        "e": "Hola, esta es una prueba de la voz en español.",
-        "f": "Bonjour, ceci est un test de la voix française.",
-        "h": "नमस्ते, यह चयनित आवाज़ का परीक्षण है।",
-        "i": "Ciao, questo è un test della voce italiana.",
-        "p": "Olá, este é um teste da voz portuguesa.",
-        "j": "こんにちは、これは選択された音声のテストです。",
-        "z": "你好，这是所选语音的测试。"
-    }
+    return dict(_KOKORO_SAMPLE_TEXTS)
 
 
 # Voice Preset Management Functions
@@ -604,12 +818,17 @@ def format_voice_combination_from_dict(voices_list):
     return "".join(result)
 
 
-def create_multi_voice_combination(selected_voices_json: str):
-    """Create voice combination string from JSON of selected voices with weights"""
-    import json
-    
+def _voice_config_list(voice_configs):
+    """Voice configs as a list, whether gr.JSON already decoded them or they come as a JSON string"""
+    if isinstance(voice_configs, str):
+        return _json_loads(voice_configs) if voice_configs else []
+    return list(voice_configs or [])
+
+
+def create_multi_voice_combination(selected_voices_json):
+    """Create voice combination string from the selected voices with weights (a list or its JSON)"""
     try:
-        selected_voices = json.loads(selected_voices_json) if selected_voices_json else []
+        selected_voices = _voice_config_list(selected_voices_json)
         
         if not selected_voices:
             return ""
@@ -637,10 +856,21 @@ def create_multi_voice_combination(selected_voices_json: str):
         return ""
 
 
+def refresh_voice_search_index(base_url="http://localhost:8880"):
+    """Build the search index of the voice catalog cached for base_url ahead of the first search"""
+    fetch_kokoro_catalog(base_url or "http://localhost:8880").sorted_search_index
+
+
 def filter_voices_by_search(search_term, base_url="http://localhost:8880"):
-    """Filter available voices based on search term"""
+    """Filter available voices based on search term.
+
+    A term starting with '^' is matched as a prefix (e.g. '^ef' for Spanish female
+    voices), anything else as a case-insensitive substring. The index belongs to the
+    catalog cached for base_url, so it is rebuilt whenever that catalog is refetched.
+    """
     try:
-        all_voices = fetch_kokoro_voices(base_url)
+        catalog = fetch_kokoro_catalog(base_url or "http://localhost:8880")
+        all_voices = list(catalog.voices)
         
         if not search_term or search_term.strip() == "":
             return gr.CheckboxGroup(
@@ -650,9 +880,16 @@ def filter_voices_by_search(search_term, base_url="http://localhost:8880"):
                 interactive=True
             )
         
-        # Filter voices that contain the search term (case insensitive)
-        search_lower = search_term.lower()
-        filtered_voices = [voice for voice in all_voices if search_lower in voice.lower()]
+        search_lower = search_term.strip().lower()
+        if search_lower.startswith("^"):
+            # Prefix search: binary search over the sorted index
+            prefix = search_lower[1:]
+            ordered, keys = catalog.sorted_search_index
+            lo = bisect_left(keys, prefix)
+            hi = bisect_right(keys, prefix + "\uffff")
+            filtered_voices = [voice for _, voice in ordered[lo:hi]]
+        else:
+            filtered_voices = [voice for lower, voice in catalog.search_index if search_lower in lower]
         
         return gr.CheckboxGroup(
             choices=filtered_voices,
@@ -671,23 +908,136 @@ def filter_voices_by_search(search_term, base_url="http://localhost:8880"):
         )
 
 
+# Static HTML fragments for the voice mixer displays (built once, reused per event)
+_NO_MIXED_VOICES_HTML = "<p style='color: #666; font-style: italic;'>No hay voces seleccionadas para mezclar</p>"
+_NO_TEST_VOICES_HTML = "<p style='color: #666; font-style: italic;'>Select voices above to adjust their weights</p>"
+_MIXED_VOICES_HTML_OPEN = "<div style='display: flex; flex-direction: column; gap: 10px;'>"
+_TEST_VOICES_HTML_OPEN = """
+        <div style='display: flex; flex-direction: column; gap: 12px; padding: 15px; background: #1f2937; border-radius: 8px; border: 1px solid #374151;'>
+        <h4 style='margin: 0 0 10px 0; color: #f9fafb; font-size: 1.1em;'>🎚️ Voice Weight Controls</h4>
+    """
+
+# Per-voice templates shared by the Python displays and the browser renderers
+# below; {voice}, {weight}, {index} and {count} are the only placeholders.
+_MIXED_VOICE_HTML = """
+            <div style='background: #f8f9fa; padding: 12px; border-radius: 8px; border-left: 4px solid #007acc; margin-bottom: 8px;'>
+                <div style='display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;'>
+                    <strong style='color: #333; font-size: 0.95em;'>{voice}</strong>
+                    <span style='color: #666; font-size: 0.85em; background: #e9ecef; padding: 2px 8px; border-radius: 4px;'>Peso: {weight}</span>
+                </div>
+                <div style='display: flex; align-items: center; gap: 8px;'>
+                    <span style='font-size: 0.75em; color: #6c757d; min-width: 25px;'>0.1</span>
+                    <input type='range' min='0.1' max='3.0' step='0.1' value='{weight}' 
+                           style='flex: 1; height: 4px; background: #ddd; border-radius: 2px; outline: none; cursor: pointer;'/>
+                    <span style='font-size: 0.75em; color: #6c757d; min-width: 25px;'>3.0</span>
+                </div>
+                <div style='margin-top: 5px; font-size: 0.75em; color: #6c757d;'>
+                    Desliza para ajustar el peso de esta voz en la mezcla
+                </div>
+            </div>
+        """
+_MIXED_VOICES_SUMMARY_HTML = """
+            <div style='margin-top: 10px; padding: 8px; background: #d1ecf1; border-radius: 4px; border-left: 4px solid #17a2b8;'>
+                <strong style='color: #0c5460; font-size: 0.9em;'>🎛️ Mezcla de {count} voces</strong>
+                <div style='font-size: 0.8em; color: #0c5460; margin-top: 2px;'>
+                    Usa el botón "Aplicar Mezcla" para usar esta combinación
+                </div>
+            </div>
+        """
+# gr.HTML does not run <script> tags, so the slider updates its label inline
+_TEST_VOICE_HTML = """
+            <div style='background: #374151; padding: 12px; border-radius: 6px; border: 1px solid #4b5563;'>
+                <div style='display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;'>
+                    <strong style='color: #f9fafb; font-size: 0.95em;'>{voice}</strong>
+                    <span id='weight-display-{index}' style='background: #4b5563; padding: 4px 8px; border-radius: 4px; font-size: 0.85em; color: #d1d5db; min-width: 60px; text-align: center;'>{weight}</span>
+                </div>
+                <div style='display: flex; align-items: center; gap: 10px;'>
+                    <span style='font-size: 0.8em; color: #9ca3af; min-width: 30px;'>0.1</span>
+                    <input 
+                        type='range' 
+                        id='weight-slider-{index}' 
+                        min='0.1' 
+                        max='3.0' 
+                        step='0.1' 
+                        value='{weight}'
+                        style='flex: 1; height: 6px; background: #6b7280; border-radius: 3px; outline: none; cursor: pointer; accent-color: #3b82f6;'
+                        oninput='const d = document.getElementById("weight-display-{index}"); if (d) d.textContent = parseFloat(this.value).toFixed(1);'
+                    />
+                    <span style='font-size: 0.8em; color: #9ca3af; min-width: 30px;'>3.0</span>
+                </div>
+            </div>
+        """
+
+
+# Client-side renderers for the same displays, so toggling a voice checkbox
+# re-renders in the browser instead of round-tripping to Python. They fill the
+# templates above, so their HTML matches update_selected_voices_display and
+# update_test_voice_weights_display, which still serve server-side callers.
+_RENDER_MIXED_VOICES_JS = r"""
+(voices) => {
+    if (!voices || voices.length === 0) {
+        return %(empty)s;
+    }
+    const fill = (template, values) => template.replace(/\{(\w+)\}/g, (_, key) => values[key]);
+    const parts = [%(open)s];
+    voices.forEach((voice, i) => {
+        parts.push(fill(%(voice)s, {voice: voice, weight: (i === 0 ? 1.0 : 0.5).toFixed(1), index: i}));
+    });
+    parts.push("</div>");
+    if (voices.length > 1) {
+        parts.push(fill(%(summary)s, {count: voices.length}));
+    }
+    return parts.join("");
+}
+""" % {"empty": json.dumps(_NO_MIXED_VOICES_HTML), "open": json.dumps(_MIXED_VOICES_HTML_OPEN),
+       "voice": json.dumps(_MIXED_VOICE_HTML), "summary": json.dumps(_MIXED_VOICES_SUMMARY_HTML)}
+
+_RENDER_TEST_VOICES_JS = r"""
+(voices) => {
+    if (!voices || voices.length === 0) {
+        return [%(empty)s, [], ""];
+    }
+    const fill = (template, values) => template.replace(/\{(\w+)\}/g, (_, key) => values[key]);
+    const configs = voices.map((voice, i) => ({voice: voice, weight: i === 0 ? 1.0 : 0.5, index: i}));
+    const parts = [%(open)s];
+    configs.forEach(({voice, weight, index}) => {
+        parts.push(fill(%(voice)s, {voice: voice, weight: weight.toFixed(1), index: index}));
+    });
+    parts.push("</div>");
+    const combination = configs
+        .map(({voice, weight}) => weight !== 1.0 ? `${voice}(${weight.toFixed(1)})` : voice)
+        .join("+");
+    return [parts.join(""), configs, combination];
+}
+""" % {"empty": json.dumps(_NO_TEST_VOICES_HTML), "open": json.dumps(_TEST_VOICES_HTML_OPEN),
+       "voice": json.dumps(_TEST_VOICE_HTML)}
+
+
+def voice_configs_for_selection(selected_voices):
+    """Build the voice configs for a mixer selection (first voice at full strength, others at 50%)"""
+    return [
+        {"voice": voice, "weight": 1.0 if i == 0 else 0.5, "index": i}
+        for i, voice in enumerate(selected_voices or [])
+    ]
+
+
 def clear_voice_selection():
     """Clear all selected voices"""
-    return [], "<p style='color: #666; font-style: italic;'>No hay voces seleccionadas para mezclar</p>", "[]", ""
+    return [], _NO_MIXED_VOICES_HTML, "[]", ""
 
 
 def apply_voice_mix_to_main(voice_config_json, main_voice_field):
-    """Apply the mixed voice combination to the main voice field"""
+    """Apply the mixed voice combination to the main voice field
+
+    voice_config_json is the gr.JSON value (already a list) or its JSON string.
+    """
     try:
-        if not voice_config_json or voice_config_json == "[]":
-            return main_voice_field, "❌ No hay voces seleccionadas para aplicar"
-        
-        voice_configs = json.loads(voice_config_json)
+        voice_configs = _voice_config_list(voice_config_json)
         if not voice_configs:
             return main_voice_field, "❌ No hay voces seleccionadas para aplicar"
         
         # Create combination string
-        combination = create_multi_voice_combination(voice_config_json)
+        combination = create_multi_voice_combination(voice_configs)
         
         return combination, f"✅ Mezcla aplicada: {combination}"
         
@@ -698,10 +1048,10 @@ def apply_voice_mix_to_main(voice_config_json, main_voice_field):
 def update_selected_voices_display(selected_voices):
     """Update the display of selected voices with weight controls"""
     if not selected_voices:
-        return "<p style='color: #666; font-style: italic;'>No hay voces seleccionadas para mezclar</p>", "[]"
+        return _NO_MIXED_VOICES_HTML, "[]"
     
     # Create HTML for selected voices with weight sliders
-    html_parts = ["<div style='display: flex; flex-direction: column; gap: 10px;'>"]
+    html_parts = [_MIXED_VOICES_HTML_OPEN]
     
     voice_configs = []
     
@@ -715,40 +1065,16 @@ def update_selected_voices_display(selected_voices):
         }
         voice_configs.append(voice_config)
         
-        # Create HTML for this voice
-        html_parts.append(f"""
-            <div style='background: #f8f9fa; padding: 12px; border-radius: 8px; border-left: 4px solid #007acc; margin-bottom: 8px;'>
-                <div style='display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;'>
-                    <strong style='color: #333; font-size: 0.95em;'>{voice}</strong>
-                    <span style='color: #666; font-size: 0.85em; background: #e9ecef; padding: 2px 8px; border-radius: 4px;'>Peso: {default_weight}</span>
-                </div>
-                <div style='display: flex; align-items: center; gap: 8px;'>
-                    <span style='font-size: 0.75em; color: #6c757d; min-width: 25px;'>0.1</span>
-                    <input type='range' min='0.1' max='3.0' step='0.1' value='{default_weight}' 
-                           style='flex: 1; height: 4px; background: #ddd; border-radius: 2px; outline: none; cursor: pointer;'/>
-                    <span style='font-size: 0.75em; color: #6c757d; min-width: 25px;'>3.0</span>
-                </div>
-                <div style='margin-top: 5px; font-size: 0.75em; color: #6c757d;'>
-                    Desliza para ajustar el peso de esta voz en la mezcla
-                </div>
-            </div>
-        """)
+        html_parts.append(_MIXED_VOICE_HTML.format(voice=voice, weight=f"{default_weight:.1f}", index=i))
     
     html_parts.append("</div>")
     
     # Add information about the combination
     if len(selected_voices) > 1:
-        html_parts.append(f"""
-            <div style='margin-top: 10px; padding: 8px; background: #d1ecf1; border-radius: 4px; border-left: 4px solid #17a2b8;'>
-                <strong style='color: #0c5460; font-size: 0.9em;'>🎛️ Mezcla de {len(selected_voices)} voces</strong>
-                <div style='font-size: 0.8em; color: #0c5460; margin-top: 2px;'>
-                    Usa el botón "Aplicar Mezcla" para usar esta combinación
-                </div>
-            </div>
-        """)
+        html_parts.append(_MIXED_VOICES_SUMMARY_HTML.format(count=len(selected_voices)))
     
     html_content = "".join(html_parts)
-    voice_configs_json = json.dumps(voice_configs)
+    voice_configs_json = _json_dumps(voice_configs)
     
     return html_content, voice_configs_json
 
@@ -787,14 +1113,10 @@ def save_current_preset(preset_name, combination_string):
 def update_test_voice_weights_display(selected_test_voices):
     """Update weight controls for test voices with sliders"""
     if not selected_test_voices:
-        return ("<p style='color: #666; font-style: italic;'>Select voices above to adjust their weights</p>", 
-                "[]", "")
+        return _NO_TEST_VOICES_HTML, "[]", ""
     
     # Create HTML with weight controls (dark theme)
-    html_parts = ["""
-        <div style='display: flex; flex-direction: column; gap: 12px; padding: 15px; background: #1f2937; border-radius: 8px; border: 1px solid #374151;'>
-        <h4 style='margin: 0 0 10px 0; color: #f9fafb; font-size: 1.1em;'>🎚️ Voice Weight Controls</h4>
-    """]
+    html_parts = [_TEST_VOICES_HTML_OPEN]
     
     voice_configs = []
     
@@ -809,74 +1131,82 @@ def update_test_voice_weights_display(selected_test_voices):
         voice_configs.append(voice_config)
         
         # Create slider control for each voice (dark theme)
-        html_parts.append(f"""
-            <div style='background: #374151; padding: 12px; border-radius: 6px; border: 1px solid #4b5563;'>
-                <div style='display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;'>
-                    <strong style='color: #f9fafb; font-size: 0.95em;'>{voice}</strong>
-                    <span id='weight-display-{i}' style='background: #4b5563; padding: 4px 8px; border-radius: 4px; font-size: 0.85em; color: #d1d5db; min-width: 60px; text-align: center;'>{default_weight}</span>
-                </div>
-                <div style='display: flex; align-items: center; gap: 10px;'>
-                    <span style='font-size: 0.8em; color: #9ca3af; min-width: 30px;'>0.1</span>
-                    <input 
-                        type='range' 
-                        id='weight-slider-{i}' 
-                        min='0.1' 
-                        max='3.0' 
-                        step='0.1' 
-                        value='{default_weight}'
-                        style='flex: 1; height: 6px; background: #6b7280; border-radius: 3px; outline: none; cursor: pointer; accent-color: #3b82f6;'
-                        oninput='updateTestVoiceWeight({i}, this.value, "{voice}")'
-                    />
-                    <span style='font-size: 0.8em; color: #9ca3af; min-width: 30px;'>3.0</span>
-                </div>
-            </div>
-        """)
+        html_parts.append(_TEST_VOICE_HTML.format(voice=voice, weight=f"{default_weight:.1f}", index=i))
     
     html_parts.append("</div>")
     
-    # Add JavaScript for real-time updates
-    html_parts.append(f"""
-        <script>
-        function updateTestVoiceWeight(index, weight, voiceName) {{
-            // Update display
-            const display = document.getElementById('weight-display-' + index);
-            if (display) {{
-                display.textContent = parseFloat(weight).toFixed(1);
-            }}
-            
-            // Trigger Gradio update (this will be handled by the event listener)
-            console.log('Updated', voiceName, 'weight to', weight);
-        }}
-        </script>
-    """)
-    
     html_content = "".join(html_parts)
-    voice_configs_json = json.dumps(voice_configs)
+    voice_configs_json = _json_dumps(voice_configs)
     
     # Generate combination string
-    combination_parts = []
-    for i, config in enumerate(voice_configs):
-        voice = config["voice"]
-        weight = config["weight"]
-        
-        if i == 0:
-            if weight != 1.0:
-                combination_parts.append(f"{voice}({weight})")
-            else:
-                combination_parts.append(voice)
-        else:
-            if weight != 1.0:
-                combination_parts.append(f"+{voice}({weight})")
-            else:
-                combination_parts.append(f"+{voice}")
-    
-    combination_string = "".join(combination_parts)
+    combination_string = "+".join(
+        f"{config['voice']}({config['weight']})" if config["weight"] != 1.0 else config["voice"]
+        for config in voice_configs
+    )
     
     return html_content, voice_configs_json, combination_string
 
 
+# The test voice table shows one page of the catalog at a time; the full
+# selection lives in a hidden JSON component so it survives page changes.
+_VOICE_PAGE_SIZE = 20
+
+
+def voice_selection_page(offset, selected_voices, base_url: str = "http://localhost:8880"):
+    """
+    Build one page of the test voice table
+    
+    Args:
+        offset: Index of the first voice to show (clamped to the catalog)
+        selected_voices: Voices currently selected across all pages
+        base_url: Kokoro server base URL
+        
+    Returns:
+        Tuple of (rows: list, offset: int, page_label: str)
+    """
+    return _voice_page(fetch_kokoro_voices(base_url or "http://localhost:8880"), offset, selected_voices)
+
+
+def _voice_page(voices, offset, selected_voices):
+    last_page = max(len(voices) - 1, 0) // _VOICE_PAGE_SIZE * _VOICE_PAGE_SIZE
+    offset = min(max(int(offset or 0), 0), last_page)
+
+    selected = set(selected_voices or [])
+    rows = [[voice, voice in selected] for voice in voices[offset:offset + _VOICE_PAGE_SIZE]]
+    if not rows:
+        return rows, offset, "No voices available"
+    return rows, offset, f"Voices {offset + 1}-{offset + len(rows)} of {len(voices)}"
+
+
+def load_kokoro_tab(loaded, language_name, selected_voices, base_url):
+    """Fetch the server's voices into the Kokoro tab the first time it is opened.
+
+    The tab is built from the fallback catalog so page load never waits on the
+    Kokoro server; later visits are skipped.
+    """
+    if loaded:
+        return gr.skip(), gr.skip(), gr.skip(), gr.skip(), gr.skip(), True
+    rows, offset, page_label = voice_selection_page(0, selected_voices, base_url)
+    return (
+        kokoro_voices_for_ui(language_name, base_url),
+        gr.update(choices=fetch_kokoro_voices(base_url or "http://localhost:8880")),
+        rows, offset, page_label, True
+    )
+
+
+def merge_voice_page_selection(page_rows, selected_voices):
+    """Fold the checked rows of the visible page into the full selection, keeping pick order"""
+    page_voices = {row[0] for row in page_rows}
+    checked = [row[0] for row in page_rows if row[0] and row[1]]
+    kept = [voice for voice in (selected_voices or []) if voice not in page_voices or voice in checked]
+    return kept + [voice for voice in checked if voice not in kept]
+
+
 def export_voice_configuration(voice_configs_json):
-    """Export voice configuration to JSON file"""
+    """Export voice configuration to JSON file.
+
+    Accepts either a JSON string or the already-decoded list of voice configs.
+    """
     from datetime import datetime
 
     try:
@@ -884,7 +1214,7 @@ def export_voice_configuration(voice_configs_json):
             return None, "❌ No configuration to export"
 
         if isinstance(voice_configs_json, str):
-            voice_configs = json.loads(voice_configs_json)
+            voice_configs = _json_loads(voice_configs_json)
         elif isinstance(voice_configs_json, list):
             voice_configs = voice_configs_json
         else:
@@ -966,13 +1296,19 @@ def import_voice_configuration(config_file):
         # Create display and combination
         html_display, json_config, combination = update_test_voice_weights_display(voice_names)
         
-        return voice_names, html_display, json.dumps(voices), combination
+        return voice_names, html_display, _json_dumps(voices), combination
         
     except Exception as e:
         return [], f"<p style='color: #dc3545;'>❌ Error importando: {str(e)}</p>", "[]", ""
 
 
-def preview_voice_combination(voice_spec: str, language_code: str, base_url: str = "http://localhost:8880"):
+# Previews are throwaway speech clips, so they use Opus independently of the
+# output format chosen for the final audiobook render.
+_PREVIEW_FORMAT = "opus"
+
+
+def preview_voice_combination(voice_spec: str, language_code: str, base_url: str = "http://localhost:8880",
+                              preview_format: str = _PREVIEW_FORMAT):
     """
     Generate a preview audio sample with the voice combination
     
@@ -980,14 +1316,14 @@ def preview_voice_combination(voice_spec: str, language_code: str, base_url: str
         voice_spec: Voice combination string
         language_code: Language code for sample text
         base_url: Kokoro server base URL
+        preview_format: Audio format requested from Kokoro (default: opus)
         
     Returns:
         Tuple of (success: bool, message: str, audio_file: str)
     """
     try:
         # Get sample text for the language
-        sample_texts = get_kokoro_voice_samples()
-        sample_text = sample_texts.get(language_code, sample_texts[""])
+        sample_text = _KOKORO_SAMPLE_TEXTS.get(language_code, _KOKORO_SAMPLE_TEXTS[""])
         
         # Make request to Kokoro
         url = f"{base_url.rstrip('/')}/v1/audio/speech"
@@ -996,7 +1332,7 @@ def preview_voice_combination(voice_spec: str, language_code: str, base_url: str
             "voice": voice_spec,
             "input": sample_text,
             "speed": 1.0,
-            "response_format": "mp3",
+            "response_format": preview_format,
             "stream": False,
             "lang_code": language_code
         }
@@ -1006,12 +1342,12 @@ def preview_voice_combination(voice_spec: str, language_code: str, base_url: str
             "Content-Type": "application/json"
         }
         
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
+        response = _KOKORO_SESSION.post(url, json=payload, headers=headers, timeout=30)
         
         if response.status_code == 200:
             # Save to temporary file
             import tempfile
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
+            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=f".{preview_format}")
             temp_file.write(response.content)
             temp_file.close()
             
@@ -1023,7 +1359,8 @@ def preview_voice_combination(voice_spec: str, language_code: str, base_url: str
         return False, f"❌ Preview failed: {str(e)}", ""
 
 
-def preview_voice_with_language(voice_spec: str, language_name: str, custom_text: str = "", base_url: str = "http://localhost:8880"):
+def preview_voice_with_language(voice_spec: str, language_name: str, custom_text: str = "", base_url: str = "http://localhost:8880",
+                                preview_format: str = _PREVIEW_FORMAT):
     """
     Generate preview with language name conversion
     
@@ -1032,21 +1369,45 @@ def preview_voice_with_language(voice_spec: str, language_name: str, custom_text
         language_name: Language full name (e.g., "Spanish")
         custom_text: Custom text for preview (optional)
         base_url: Kokoro server base URL
+        preview_format: Audio format requested from Kokoro (default: opus)
         
     Returns:
         Tuple of (success: bool, message: str, audio_file: str)
     """
-    # Convert language name to code
-    language_code = ""
-    for code, name in get_kokoro_languages():
-        if name == language_name:
-            language_code = code
-            break
+    return preview_voice_combination_with_text(voice_spec, _kokoro_language_code(language_name), custom_text, base_url,
+                                               preview_format)
+
+
+def _resolve_preview_text(voice_spec: str, language_code: str, custom_text: str):
+    """
+    Pick the text to synthesize for a preview
     
-    return preview_voice_combination_with_text(voice_spec, language_code, custom_text, base_url)
+    Returns:
+        Tuple of (sample_text: str, language_code: str)
+    """
+    if custom_text.strip():
+        return custom_text.strip(), language_code
+
+    # Auto-detect language from voice if not provided
+    if not language_code and voice_spec:
+        # Extract language from voice prefix (e.g., "em_" -> "e" for Spanish), defaulting to English
+        voice_prefix = voice_spec.split('_')[0] if '_' in voice_spec else ''
+        language_code = _VOICE_PREFIX_LANGUAGE.get(voice_prefix, 'a')
+
+    return _KOKORO_SAMPLE_TEXTS.get(language_code, _KOKORO_SAMPLE_TEXTS[""]), language_code
 
 
-def preview_voice_combination_with_text(voice_spec: str, language_code: str, custom_text: str = "", base_url: str = "http://localhost:8880"):
+def _preview_message(voice_spec: str, sample_text: str, custom_text: str) -> str:
+    preview_msg = f"✅ Preview generado con voz: {voice_spec}"
+    if custom_text.strip():
+        preview_msg += f"\n📝 Texto personalizado: '{sample_text[:50]}...'" if len(sample_text) > 50 else f"\n📝 Texto personalizado: '{sample_text}'"
+    else:
+        preview_msg += f"\n📝 Texto de ejemplo: '{sample_text}'"
+    return preview_msg
+
+
+def preview_voice_combination_with_text(voice_spec: str, language_code: str, custom_text: str = "", base_url: str = "http://localhost:8880",
+                                        preview_format: str = _PREVIEW_FORMAT):
     """
     Generate a preview audio sample with custom text or default sample
     
@@ -1055,30 +1416,13 @@ def preview_voice_combination_with_text(voice_spec: str, language_code: str, cus
         language_code: Language code for sample text
         custom_text: Custom text to synthesize (optional)
         base_url: Kokoro server base URL
+        preview_format: Audio format requested from Kokoro (default: opus)
         
     Returns:
         Tuple of (success: bool, message: str, audio_file: str)
     """
     try:
-        # Use custom text or get default sample text
-        if custom_text.strip():
-            sample_text = custom_text.strip()
-        else:
-            # Auto-detect language from voice if not provided
-            if not language_code and voice_spec:
-                # Extract language from voice prefix (e.g., "em_" -> "e" for Spanish)
-                voice_prefix = voice_spec.split('_')[0] if '_' in voice_spec else ''
-                if voice_prefix in ['af', 'am']:
-                    language_code = 'a'  # English
-                elif voice_prefix in ['em', 'ef']:
-                    language_code = 'e'  # Spanish
-                elif voice_prefix in ['fm', 'ff']:
-                    language_code = 'f'  # French
-                else:
-                    language_code = 'a'  # Default to English
-            
-            sample_texts = get_kokoro_voice_samples()
-            sample_text = sample_texts.get(language_code, sample_texts[""])
+        sample_text, language_code = _resolve_preview_text(voice_spec, language_code, custom_text)
         
         # Make request to Kokoro
         url = f"{base_url.rstrip('/')}/v1/audio/speech"
@@ -1087,7 +1431,7 @@ def preview_voice_combination_with_text(voice_spec: str, language_code: str, cus
             "voice": voice_spec,
             "input": sample_text,
             "speed": 1.0,
-            "response_format": "mp3",
+            "response_format": preview_format,
             "stream": False,
             "lang_code": language_code
         }
@@ -1097,22 +1441,16 @@ def preview_voice_combination_with_text(voice_spec: str, language_code: str, cus
             "Content-Type": "application/json"
         }
         
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
+        response = _KOKORO_SESSION.post(url, json=payload, headers=headers, timeout=30)
         
         if response.status_code == 200:
             # Save to temporary file
             import tempfile
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
+            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=f".{preview_format}")
             temp_file.write(response.content)
             temp_file.close()
             
-            preview_msg = f"✅ Preview generado con voz: {voice_spec}"
-            if custom_text.strip():
-                preview_msg += f"\n📝 Texto personalizado: '{sample_text[:50]}...'" if len(sample_text) > 50 else f"\n📝 Texto personalizado: '{sample_text}'"
-            else:
-                preview_msg += f"\n📝 Texto de ejemplo: '{sample_text}'"
-            
-            return True, preview_msg, temp_file.name
+            return True, _preview_message(voice_spec, sample_text, custom_text), temp_file.name
         else:
             return False, f"❌ Error al generar preview: {response.status_code} - {response.text}", ""
             
@@ -1120,22 +1458,246 @@ def preview_voice_combination_with_text(voice_spec: str, language_code: str, cus
         return False, f"❌ Error en preview: {str(e)}", ""
 
 
+# Kokoro streams raw 16-bit mono PCM at 24 kHz; each yielded piece is wrapped
+# in its own WAV header so the streaming gr.Audio can decode it independently.
+_KOKORO_PCM_RATE = 24000
+_PREVIEW_CHUNK_BYTES = _KOKORO_PCM_RATE  # 2 bytes/sample, so ~0.5 s of audio per chunk
+
+
+def _pcm_to_wav(pcm: bytes) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(_KOKORO_PCM_RATE)
+        wav_file.writeframes(pcm)
+    return buffer.getvalue()
+
+
+def stream_voice_preview(voice_spec: str, language_name: str, custom_text: str = "", base_url: str = "http://localhost:8880"):
+    """
+    Stream a preview audio sample as Kokoro generates it
+    
+    Args:
+        voice_spec: Voice combination string
+        language_name: Language full name (e.g., "Spanish")
+        custom_text: Custom text to synthesize (optional)
+        base_url: Kokoro server base URL
+        
+    Yields:
+        Tuples of (message: str, audio_chunk: bytes or None)
+    """
+    try:
+        sample_text, language_code = _resolve_preview_text(voice_spec, _kokoro_language_code(language_name), custom_text)
+
+        url = f"{base_url.rstrip('/')}/v1/audio/speech"
+        payload = {
+            "model": "kokoro",
+            "voice": voice_spec,
+            "input": sample_text,
+            "speed": 1.0,
+            "response_format": "pcm",
+            "stream": True,
+            "lang_code": language_code
+        }
+
+        headers = {
+            "Authorization": "Bearer fake-key",
+            "Content-Type": "application/json"
+        }
+
+        with _KOKORO_SESSION.post(url, json=payload, headers=headers, timeout=30, stream=True) as response:
+            if response.status_code != 200:
+                yield f"❌ Error al generar preview: {response.status_code} - {response.text}", None
+                return
+
+            message = _preview_message(voice_spec, sample_text, custom_text)
+            pending = b""
+            for data in response.iter_content(chunk_size=8192):
+                pending += data
+                if len(pending) >= _PREVIEW_CHUNK_BYTES:
+                    # Keep whole 16-bit samples together across chunk boundaries
+                    cut = len(pending) - len(pending) % 2
+                    yield message, _pcm_to_wav(pending[:cut])
+                    pending = pending[cut:]
+            if len(pending) >= 2:
+                yield message, _pcm_to_wav(pending[:len(pending) - len(pending) % 2])
+
+    except Exception as e:
+        yield f"❌ Error en preview: {str(e)}", None
+
+
+# Per-engine form handling for process_ui_form. Each handler takes the whole form as
+# keyword arguments and only names the fields it uses.
+def _apply_openai_settings(config, *, openai_output_format, voices, model, instructions, speed,
+                           openai_audio_quality, **_):
+    config.tts = "openai"
+    config.output_format = openai_output_format
+    config.voice_name = voices
+    config.model_name = model
+    config.instructions = instructions
+    config.speed = speed
+    # OpenAI audio quality parameters (Note: no prefix because it's base OpenAI)
+    config.sample_rate = openai_audio_quality["sample_rate"]
+    config.audio_bitrate = openai_audio_quality["audio_bitrate"]
+    config.audio_channels = openai_audio_quality["audio_channels"]
+    config.wav_bit_depth = openai_audio_quality["wav_bit_depth"]
+    config.mp3_quality = openai_audio_quality["mp3_quality"]
+    config.enable_limiter = openai_audio_quality["enable_limiter"]
+    config.normalize_volume = openai_audio_quality["normalize_volume"]
+
+
+def _apply_kokoro_settings(config, *, kokoro_base_url, kokoro_language, kokoro_model, kokoro_voice,
+                           kokoro_output_format, kokoro_speed, kokoro_audio_quality,
+                           kokoro_volume_multiplier, kokoro_stream, kokoro_return_timestamps,
+                           kokoro_return_download_link, kokoro_normalize, kokoro_unit_normalization,
+                           kokoro_url_normalization, kokoro_email_normalization,
+                           kokoro_pluralization_normalization, kokoro_phone_normalization,
+                           kokoro_replace_symbols, kokoro_voice_weight_normalization, **_):
+    # Use dedicated Kokoro TTS provider with all advanced features
+    config.tts = "kokoro"
+    
+    # Basic Kokoro settings
+    config.output_format = kokoro_output_format
+    config.voice_name = kokoro_voice
+
+    config.model_name = kokoro_model
+    config.speed = kokoro_speed
+    
+    # Kokoro-specific settings
+    config.kokoro_base_url = kokoro_base_url or "http://localhost:8880"
+    config.kokoro_volume_multiplier = kokoro_volume_multiplier
+    config.kokoro_stream = kokoro_stream
+    config.kokoro_return_timestamps = kokoro_return_timestamps
+    config.kokoro_return_download_link = kokoro_return_download_link
+    
+    # Advanced normalization options
+    config.kokoro_normalize = kokoro_normalize
+    config.kokoro_unit_normalization = kokoro_unit_normalization
+    config.kokoro_url_normalization = kokoro_url_normalization
+    config.kokoro_email_normalization = kokoro_email_normalization
+    config.kokoro_pluralization_normalization = kokoro_pluralization_normalization
+    config.kokoro_phone_normalization = kokoro_phone_normalization
+    config.kokoro_replace_symbols = kokoro_replace_symbols
+    
+    # Voice mixing settings
+    config.kokoro_voice_weight_normalization = kokoro_voice_weight_normalization
+    
+    # Audio quality parameters
+    config.kokoro_sample_rate = kokoro_audio_quality["sample_rate"]
+    config.kokoro_audio_bitrate = kokoro_audio_quality["audio_bitrate"]
+    config.kokoro_audio_channels = kokoro_audio_quality["audio_channels"]
+    config.kokoro_wav_bit_depth = kokoro_audio_quality["wav_bit_depth"]
+    config.kokoro_mp3_quality = kokoro_audio_quality["mp3_quality"]
+    config.kokoro_enable_limiter = kokoro_audio_quality["enable_limiter"]
+    config.kokoro_normalize_volume = kokoro_audio_quality["normalize_volume"]
+    
+    # Convert language name back to code for Kokoro
+    language_code = _KOKORO_NAME_TO_CODE.get(kokoro_language, "")
+    if language_code:
+        config.language = language_code
+
+
+def _apply_azure_settings(config, *, azure_language, azure_voice, azure_output_format, azure_break_duration, **_):
+    config.tts = "azure"
+    config.language = azure_language
+    config.voice_name = azure_voice
+    config.output_format = azure_output_format
+    config.break_duration = azure_break_duration
+
+
+def _apply_edge_settings(config, *, edge_language, edge_voice, edge_output_format, proxy, edge_voice_rate,
+                         edge_volume, edge_pitch, edge_break_duration, **_):
+    config.tts = "edge"
+    config.language = edge_language
+    config.voice_name = edge_voice
+    config.output_format = edge_output_format
+    config.proxy = proxy
+    config.voice_rate = f"{edge_voice_rate:+}%"
+    config.voice_volume = f"{edge_volume:+}%"
+    config.voice_pitch = f"{edge_pitch:+}Hz"
+    config.break_duration = edge_break_duration
+
+
+def _apply_piper_settings(config, *, piper_executable_path, piper_docker_image, piper_language, piper_voice,
+                          piper_quality, piper_speaker, piper_noise_scale, piper_noise_w_scale,
+                          piper_length_scale, piper_sentence_silence, piper_device, piper_audio_quality, **_):
+    config.tts = "piper"
+    config.piper_path = piper_executable_path
+    config.piper_docker_image = piper_docker_image
+    config.model_name = f"{piper_language}-{piper_voice}-{piper_quality}"
+    config.piper_speaker = piper_speaker
+    config.piper_noise_scale = piper_noise_scale
+    config.piper_noise_w_scale = piper_noise_w_scale
+    config.piper_length_scale = piper_length_scale
+    config.piper_sentence_silence = piper_sentence_silence
+    config.piper_device = piper_device
+    # Piper audio quality parameters
+    config.piper_sample_rate = piper_audio_quality["sample_rate"]
+    config.piper_audio_bitrate = piper_audio_quality["audio_bitrate"]
+    config.piper_audio_channels = piper_audio_quality["audio_channels"]
+    config.piper_wav_bit_depth = piper_audio_quality["wav_bit_depth"]
+    config.piper_mp3_quality = piper_audio_quality["mp3_quality"]
+    config.piper_enable_limiter = piper_audio_quality["enable_limiter"]
+    config.piper_normalize_volume = piper_audio_quality["normalize_volume"]
+
+
+def _apply_coqui_settings(config, *, coqui_model_input, coqui_speaker_input, coqui_language_input,
+                          coqui_speaker_wav_input, coqui_path_input, coqui_output_format, coqui_length_scale,
+                          coqui_noise_scale, coqui_noise_w_scale, coqui_device, coqui_audio_quality, **_):
+    config.tts = "coqui"
+    # coqui_model is passed from the Coqui UI dropdown/textbox
+    config.coqui_model = coqui_model_input if coqui_model_input else None
+    # coqui speaker/voice
+    config.coqui_speaker = coqui_speaker_input if coqui_speaker_input else None
+    # coqui language for multilingual models
+    config.coqui_language = coqui_language_input if coqui_language_input else None
+    # coqui speaker wav file for voice cloning
+    config.coqui_speaker_wav = coqui_speaker_wav_input.name if hasattr(coqui_speaker_wav_input, 'name') else (coqui_speaker_wav_input if coqui_speaker_wav_input else None)
+    # coqui_path is provided explicitly by the Coqui UI
+    config.coqui_path = coqui_path_input if coqui_path_input else None
+    # coqui output format
+    config.output_format = coqui_output_format if coqui_output_format else config.output_format
+    # coqui parameters
+    config.coqui_length_scale = coqui_length_scale
+    config.coqui_noise_scale = coqui_noise_scale
+    config.coqui_noise_w_scale = coqui_noise_w_scale
+    config.coqui_device = coqui_device
+    # coqui audio quality parameters (its sample rate/bit depth dropdowns hold strings)
+    config.coqui_sample_rate = int(coqui_audio_quality["sample_rate"])
+    config.coqui_audio_bitrate = coqui_audio_quality["audio_bitrate"]
+    config.coqui_audio_channels = coqui_audio_quality["audio_channels"]
+    config.coqui_wav_bit_depth = int(coqui_audio_quality["wav_bit_depth"])
+    config.coqui_mp3_quality = coqui_audio_quality["mp3_quality"]
+    config.coqui_enable_limiter = coqui_audio_quality["enable_limiter"]
+
+
+_TTS_DISPATCH = {
+    "OpenAI": _apply_openai_settings,
+    "Kokoro": _apply_kokoro_settings,
+    "Azure": _apply_azure_settings,
+    "Edge": _apply_edge_settings,
+    "Piper": _apply_piper_settings,
+    "Coqui": _apply_coqui_settings,
+}
+
+
 def process_ui_form(input_file, output_dir, worker_count, log_level, output_text, preview,
                     search_and_replace_file, title_mode, new_line_mode, chapter_start, chapter_end, remove_endnotes, remove_reference_numbers,
                     model, voices, speed, openai_output_format, instructions,
-                    # OpenAI audio quality inputs
-                    openai_sample_rate, openai_audio_bitrate, openai_audio_channels, openai_wav_bit_depth, openai_mp3_quality, openai_enable_limiter, openai_normalize_volume,
+                    # OpenAI audio quality settings (dict, see _quality_settings)
+                    openai_audio_quality,
                     azure_language, azure_voice, azure_output_format, azure_break_duration,
                     edge_language, edge_voice, edge_output_format, proxy, edge_voice_rate, edge_volume, edge_pitch, edge_break_duration,
                     # Coqui inputs
                     coqui_model_input, coqui_speaker_input, coqui_language_input, coqui_speaker_wav_input, coqui_path_input, coqui_output_format,
                     coqui_length_scale, coqui_noise_scale, coqui_noise_w_scale, coqui_device,
-                    # Coqui audio quality inputs
-                    coqui_sample_rate, coqui_audio_bitrate, coqui_audio_channels, coqui_wav_bit_depth, coqui_mp3_quality, coqui_enable_limiter,
+                    # Coqui audio quality settings (dict)
+                    coqui_audio_quality,
                     # Kokoro inputs
                     kokoro_base_url, kokoro_language, kokoro_model, kokoro_voice, kokoro_output_format, kokoro_speed,
-                    # Kokoro audio quality inputs
-                    kokoro_sample_rate_ui, kokoro_audio_bitrate_ui, kokoro_audio_channels_ui, kokoro_wav_bit_depth_ui, kokoro_mp3_quality_ui, kokoro_enable_limiter_ui, kokoro_normalize_volume_ui,
+                    # Kokoro audio quality settings (dict)
+                    kokoro_audio_quality,
                     # Kokoro advanced features (adding missing parameters)
                     kokoro_volume_multiplier=1.0, kokoro_stream=True, kokoro_return_timestamps=False, kokoro_return_download_link=False,
                     # Kokoro normalization options (adding missing parameters)
@@ -1145,8 +1707,9 @@ def process_ui_form(input_file, output_dir, worker_count, log_level, output_text
                     kokoro_voice_weight_normalization=True,
                     piper_executable_path=None, piper_docker_image=None, piper_language=None, piper_voice=None, piper_quality=None, piper_speaker=None,
                     piper_noise_scale=None, piper_noise_w_scale=None, piper_length_scale=None, piper_sentence_silence=None, piper_device=None,
-                    # Piper audio quality inputs
-                    piper_sample_rate=None, piper_audio_bitrate=None, piper_audio_channels=None, piper_wav_bit_depth=None, piper_mp3_quality=None, piper_enable_limiter=None, piper_normalize_volume=None):
+                    # Piper audio quality settings (dict)
+                    piper_audio_quality=None):
+    form = dict(locals())
 
     config = GeneralConfig(None)
     config.input_file = input_file.name if hasattr(input_file, 'name') else input_file
@@ -1165,132 +1728,11 @@ def process_ui_form(input_file, output_dir, worker_count, log_level, output_text
     config.remove_reference_numbers = remove_reference_numbers
     config.search_and_replace_file = search_and_replace_file.name if hasattr(search_and_replace_file, 'name') else search_and_replace_file
 
-    global selected_tts
-    if selected_tts == "OpenAI":
-        config.tts = "openai"
-        config.output_format = openai_output_format
-        config.voice_name = voices
-        config.model_name = model
-        config.instructions = instructions
-        config.speed = speed
-        # OpenAI audio quality parameters (Note: no prefix because it's base OpenAI)
-        config.sample_rate = int(openai_sample_rate)
-        config.audio_bitrate = openai_audio_bitrate
-        config.audio_channels = openai_audio_channels
-        config.wav_bit_depth = int(openai_wav_bit_depth)
-        config.mp3_quality = openai_mp3_quality
-        config.enable_limiter = openai_enable_limiter
-        config.normalize_volume = openai_normalize_volume
-    elif selected_tts == "Kokoro":
-        # Use dedicated Kokoro TTS provider with all advanced features
-        config.tts = "kokoro"
-        
-        # Basic Kokoro settings
-        config.output_format = kokoro_output_format
-        config.voice_name = kokoro_voice
-
-        config.model_name = kokoro_model
-        config.speed = kokoro_speed
-        
-        # Kokoro-specific settings
-        config.kokoro_base_url = kokoro_base_url or "http://localhost:8880"
-        config.kokoro_volume_multiplier = kokoro_volume_multiplier
-        config.kokoro_stream = kokoro_stream
-        config.kokoro_return_timestamps = kokoro_return_timestamps
-        config.kokoro_return_download_link = kokoro_return_download_link
-        
-        # Advanced normalization options
-        config.kokoro_normalize = kokoro_normalize
-        config.kokoro_unit_normalization = kokoro_unit_normalization
-        config.kokoro_url_normalization = kokoro_url_normalization
-        config.kokoro_email_normalization = kokoro_email_normalization
-        config.kokoro_pluralization_normalization = kokoro_pluralization_normalization
-        config.kokoro_phone_normalization = kokoro_phone_normalization
-        config.kokoro_replace_symbols = kokoro_replace_symbols
-        
-        # Voice mixing settings
-        config.kokoro_voice_weight_normalization = kokoro_voice_weight_normalization
-        
-        # Audio quality parameters
-        config.kokoro_sample_rate = int(kokoro_sample_rate_ui)
-        config.kokoro_audio_bitrate = kokoro_audio_bitrate_ui
-        config.kokoro_audio_channels = kokoro_audio_channels_ui
-        config.kokoro_wav_bit_depth = int(kokoro_wav_bit_depth_ui)
-        config.kokoro_mp3_quality = kokoro_mp3_quality_ui
-        config.kokoro_enable_limiter = kokoro_enable_limiter_ui
-        config.kokoro_normalize_volume = kokoro_normalize_volume_ui
-        
-        # Convert language name back to code for Kokoro
-        language_code = ""
-        for code, name in get_kokoro_languages():
-            if name == kokoro_language:
-                language_code = code
-                break
-        if language_code:
-            config.language = language_code
-    elif selected_tts == "Azure":
-        config.tts = "azure"
-        config.language = azure_language
-        config.voice_name = azure_voice
-        config.output_format = azure_output_format
-        config.break_duration = azure_break_duration
-    elif selected_tts == "Edge":
-        config.tts = "edge"
-        config.language = edge_language
-        config.voice_name = edge_voice
-        config.output_format = edge_output_format
-        config.proxy = proxy
-        config.voice_rate = f"{edge_voice_rate:+}%"
-        config.voice_volume = f"{edge_volume:+}%"
-        config.voice_pitch = f"{edge_pitch:+}Hz"
-        config.break_duration = edge_break_duration
-    elif selected_tts == "Piper":
-        config.tts = "piper"
-        config.piper_path = piper_executable_path
-        config.piper_docker_image = piper_docker_image
-        config.model_name = f"{piper_language}-{piper_voice}-{piper_quality}"
-        config.piper_speaker = piper_speaker
-        config.piper_noise_scale = piper_noise_scale
-        config.piper_noise_w_scale = piper_noise_w_scale
-        config.piper_length_scale = piper_length_scale
-        config.piper_sentence_silence = piper_sentence_silence
-        config.piper_device = piper_device
-        # Piper audio quality parameters
-        config.piper_sample_rate = int(piper_sample_rate)
-        config.piper_audio_bitrate = piper_audio_bitrate
-        config.piper_audio_channels = piper_audio_channels
-        config.piper_wav_bit_depth = int(piper_wav_bit_depth)
-        config.piper_mp3_quality = piper_mp3_quality
-        config.piper_enable_limiter = piper_enable_limiter
-        config.piper_normalize_volume = piper_normalize_volume
-    elif selected_tts == "Coqui":
-        config.tts = "coqui"
-        # coqui_model is passed from the Coqui UI dropdown/textbox
-        config.coqui_model = coqui_model_input if coqui_model_input else None
-        # coqui speaker/voice
-        config.coqui_speaker = coqui_speaker_input if coqui_speaker_input else None
-        # coqui language for multilingual models
-        config.coqui_language = coqui_language_input if coqui_language_input else None
-        # coqui speaker wav file for voice cloning
-        config.coqui_speaker_wav = coqui_speaker_wav_input.name if hasattr(coqui_speaker_wav_input, 'name') else (coqui_speaker_wav_input if coqui_speaker_wav_input else None)
-        # coqui_path is provided explicitly by the Coqui UI
-        config.coqui_path = coqui_path_input if coqui_path_input else None
-        # coqui output format
-        config.output_format = coqui_output_format if coqui_output_format else config.output_format
-        # coqui parameters
-        config.coqui_length_scale = coqui_length_scale
-        config.coqui_noise_scale = coqui_noise_scale
-        config.coqui_noise_w_scale = coqui_noise_w_scale
-        config.coqui_device = coqui_device
-        # coqui audio quality parameters
-        config.coqui_sample_rate = int(coqui_sample_rate)
-        config.coqui_audio_bitrate = coqui_audio_bitrate
-        config.coqui_audio_channels = coqui_audio_channels
-        config.coqui_wav_bit_depth = int(coqui_wav_bit_depth)
-        config.coqui_mp3_quality = coqui_mp3_quality
-        config.coqui_enable_limiter = coqui_enable_limiter
-    else:
-        raise ValueError("Unsupported TTS provider selected")
+    try:
+        apply_tts_settings = _TTS_DISPATCH[selected_tts]
+    except KeyError:
+        raise ValueError("Unsupported TTS provider selected") from None
+    apply_tts_settings(config, **form)
 
     launch_audiobook_generator(config)
 
@@ -1301,7 +1743,7 @@ def launch_audiobook_generator(config):
         print("Audiobook generator already running")
         return
 
-    running_process = Process(target=main, args=(config, str(webui_log_file.absolute())))
+    running_process = _MP_CTX.Process(target=main, args=(config, str(webui_log_file.absolute())))
     running_process.start()
 
 
@@ -1357,8 +1799,9 @@ def host_ui(config):
 
 
         gr.Markdown("---")
-        with gr.Tabs(selected="edge_tab_id"):
-            with gr.Tab("OpenAI", id="openai_tab_id") as open_ai_tab:
+        with gr.Tabs(selected="edge_tab_id") as provider_tabs:
+            provider_tabs.select(on_tab_change, inputs=None, outputs=None)
+            with gr.Tab("OpenAI", id="openai_tab_id"):
                 gr.Markdown("It is expected that user configured: `OPENAI_API_KEY` in the environment variables. Optionally `OPENAI_API_BASE` can be set to overwrite OpenAI API endpoint.")
                 with gr.Row(equal_height=True):
                     model = gr.Dropdown(get_openai_supported_models(), label="Model", interactive=True, allow_custom_value=True)
@@ -1422,14 +1865,14 @@ def host_ui(config):
                             label="Normalización de Volumen", 
                             info="Volumen consistente"
                         )
-                
-                open_ai_tab.select(on_tab_change, inputs=None, outputs=None)
-            with gr.Tab("Azure", id="azure_tab_id") as azure_tab:
+            with gr.Tab("Azure", id="azure_tab_id"):
                 gr.Markdown("It is expected that user configured: `MS_TTS_KEY` and `MS_TTS_REGION` in the environment variables.")
                 with gr.Row(equal_height=True):
                     azure_language = gr.Dropdown(get_azure_supported_languages(), value="en-US", label="Language",
                                                interactive=True, info="Select source language")
-                    azure_voice = get_azure_voices_by_language(azure_language.value)
+                    azure_voices = _voices_for_language("azure", azure_language.value)
+                    azure_voice = gr.Dropdown(azure_voices, value=azure_voices[0] if azure_voices else None, label="Voice",
+                                              interactive=True, info="Select the voice")
                     azure_output_format = gr.Dropdown(get_azure_supported_output_formats(), label="Output Format", interactive=True,
                                                 value="audio-24khz-48kbitrate-mono-mp3", info="Select output format")
                     azure_break_duration = gr.Slider(minimum=0, maximum=5000, step=1, label="Break Duration", value=1250,
@@ -1438,14 +1881,19 @@ def host_ui(config):
                         fn=get_azure_voices_by_language,
                         inputs=azure_language,
                         outputs=azure_voice,
+                        # always_last: only the latest of several rapid changes rebuilds the
+                        # dependent list (same on the other catalog dropdowns below)
+                        trigger_mode="always_last",
+                        show_progress="hidden",
                     )
-                azure_tab.select(on_tab_change, inputs=None, outputs=None)
 
-            with gr.Tab("Edge", id="edge_tab_id") as edge_tab:
+            with gr.Tab("Edge", id="edge_tab_id"):
                 with gr.Row(equal_height=True):
                     edge_language = gr.Dropdown(get_edge_tts_supported_language(), value="en-US", label="Language",
                                            interactive=True, info="Select source language")
-                    edge_voice = get_edge_voices_by_language(edge_language.value)
+                    edge_voices = _voices_for_language("edge", edge_language.value)
+                    edge_voice = gr.Dropdown(edge_voices, value=edge_voices[0] if edge_voices else None, label="Voice",
+                                              interactive=True, info="Select the voice")
                     edge_output_format = gr.Dropdown(get_edge_tts_supported_output_formats(), label="Output Format",
                                                       interactive=True, info="Select output format")
                     proxy = gr.Textbox(label="Proxy", value="", interactive=True, info="Optional proxy server for the TTS provider")
@@ -1462,11 +1910,11 @@ def host_ui(config):
                         fn=get_edge_voices_by_language,
                         inputs=edge_language,
                         outputs=edge_voice,
+                        trigger_mode="always_last",
+                        show_progress="hidden",
                     )
-                edge_tab.select(on_tab_change, inputs=None, outputs=None)
 
-            with gr.Tab("Piper", id="piper_tab_id") as piper_tab:
-                piper_tab.select(on_tab_change, inputs=None, outputs=None)
+            with gr.Tab("Piper", id="piper_tab_id"):
                 with gr.Row(equal_height=True):
                     piper_device = gr.Dropdown(["cpu", "cuda"], label="Device", value="cpu", interactive=True, info="Select device for Piper (cpu/gpu)")
                     with gr.Column():
@@ -1475,19 +1923,13 @@ def host_ui(config):
 
                         local_group = gr.Group(visible=True)
                         with local_group:
-                            # Set default path to local piper executable
-                            try:
-                                from audiobook_generator.utils.resource_path import resource_path
-                                default_piper_path = str(resource_path("piper_tts/piper.exe"))
-                            except Exception:
-                                default_piper_path = str(Path(__file__).parent.parent.parent / "piper_tts" / "piper.exe")
                             piper_executable_path = gr.Textbox(label="Piper executable path", 
-                                                             value=default_piper_path, 
+                                                             value=_DEFAULT_PIPER_PATH, 
                                                              interactive=True)
                             piper_file_upload = gr.File(label="Upload Piper executable", 
                                                       file_count="single", interactive=True)
                             piper_file_upload.change(
-                                fn=lambda x: x.name if x else "",
+                                fn=_uploaded_file_path,
                                 inputs=piper_file_upload,
                                 outputs=piper_executable_path
                             )
@@ -1497,7 +1939,7 @@ def host_ui(config):
                             piper_docker_image = gr.Textbox(label="Piper Docker Image", value="lscr.io/linuxserver/piper:latest", interactive=True)
 
                     piper_deployment.change(
-                        fn=lambda x: (gr.update(visible=x == "Local"), gr.update(visible=x == "Docker")),
+                        fn=_PIPER_DEPLOY_STATES.get,
                         inputs=piper_deployment,
                         outputs=[local_group, docker_group]
                     )
@@ -1514,18 +1956,24 @@ def host_ui(config):
                         fn=get_piper_supported_voices_gui,
                         inputs=piper_language,
                         outputs=piper_voice,
+                        trigger_mode="always_last",
+                        show_progress="hidden",
                     )
 
                     piper_voice.change(
                         fn=get_piper_supported_qualities_gui,
                         inputs=[piper_language, piper_voice],
                         outputs=piper_quality,
+                        trigger_mode="always_last",
+                        show_progress="hidden",
                     )
 
                     piper_quality.change(
                         fn=get_piper_supported_speakers_gui,
                         inputs=[piper_language, piper_voice, piper_quality],
                         outputs=piper_speaker,
+                        trigger_mode="always_last",
+                        show_progress="hidden",
                     )
 
                     with gr.Column():
@@ -1590,7 +2038,7 @@ def host_ui(config):
                         )
 
             with gr.Tab("Coqui TTS", id="coqui_tab_id") as coqui_tab:
-                coqui_tab.select(on_tab_change, inputs=None, outputs=None)
+                coqui_tab_loaded = gr.State(False)
                 gr.Markdown("**🐸 Coqui TTS** - Síntesis de voz neuronal avanzada con soporte completo para español. Incluye XTTS-v2 para clonación de voz y modelos específicos de español.")
                 
                 # Selección de modelo y configuración básica
@@ -1629,8 +2077,9 @@ def host_ui(config):
                 
                 # Selección de voz y idioma (se actualiza dinámicamente según el modelo)
                 with gr.Row(equal_height=True):
+                    # Filled in by load_coqui_tab when the tab is first opened
                     coqui_speaker = gr.Dropdown(
-                        get_coqui_supported_voices("tts_models/multilingual/multi-dataset/xtts_v2"),
+                        ["Ana Florence"],
                         label="🎤 Voz/Locutor",
                         value="Ana Florence",  # Default Spanish-friendly voice
                         interactive=True,
@@ -1772,13 +2221,22 @@ def host_ui(config):
                     fn=get_coqui_models_by_language_gui,
                     inputs=coqui_language_filter,
                     outputs=coqui_model,
+                    trigger_mode="always_last",
+                    show_progress="hidden",
                 )
                 
                 # Update voice and language options when model changes
                 coqui_model.change(
                     fn=update_coqui_model_options,
                     inputs=coqui_model,
-                    outputs=[coqui_speaker, coqui_language, coqui_speaker_wav, coqui_model_info]
+                    outputs=[coqui_speaker, coqui_language, coqui_speaker_wav, coqui_model_info],
+                    trigger_mode="always_last",
+                    show_progress="hidden",
+                )
+                coqui_tab.select(
+                    fn=load_coqui_tab,
+                    inputs=[coqui_tab_loaded, coqui_model],
+                    outputs=[coqui_speaker, coqui_tab_loaded]
                 )
                 
                 # Connect preset buttons
@@ -1799,62 +2257,40 @@ def host_ui(config):
                     outputs=[coqui_length_scale, coqui_noise_scale, coqui_noise_w_scale]
                 )
                 
-                # Connect quality preset buttons
-                preset_quality_mobile.click(
-                    fn=apply_mobile_quality_preset,
-                    outputs=[coqui_sample_rate, coqui_audio_bitrate, coqui_audio_channels, coqui_wav_bit_depth, coqui_mp3_quality, coqui_enable_limiter]
-                )
-                preset_quality_desktop.click(
-                    fn=apply_desktop_quality_preset,
-                    outputs=[coqui_sample_rate, coqui_audio_bitrate, coqui_audio_channels, coqui_wav_bit_depth, coqui_mp3_quality, coqui_enable_limiter]
-                )
-                preset_quality_high.click(
-                    fn=apply_high_quality_preset,
-                    outputs=[coqui_sample_rate, coqui_audio_bitrate, coqui_audio_channels, coqui_wav_bit_depth, coqui_mp3_quality, coqui_enable_limiter]
-                )
-                preset_quality_max.click(
-                    fn=apply_max_quality_preset,
-                    outputs=[coqui_sample_rate, coqui_audio_bitrate, coqui_audio_channels, coqui_wav_bit_depth, coqui_mp3_quality, coqui_enable_limiter]
-                )
+                # Connect quality preset buttons; the engine's quality State follows its widgets
+                coqui_quality_widgets = [coqui_sample_rate, coqui_audio_bitrate, coqui_audio_channels, coqui_wav_bit_depth, coqui_mp3_quality, coqui_enable_limiter]
+                coqui_audio_quality = gr.State(_quality_settings(*(w.value for w in coqui_quality_widgets)))
+                _bind_quality_state("coqui", coqui_quality_widgets, coqui_audio_quality, {
+                    "mobile": preset_quality_mobile,
+                    "desktop": preset_quality_desktop,
+                    "high": preset_quality_high,
+                    "max": preset_quality_max,
+                })
                 
                 # Connect OpenAI quality preset buttons
-                openai_mobile_quality.click(
-                    fn=apply_openai_mobile_quality_preset,
-                    outputs=[openai_sample_rate, openai_audio_bitrate, openai_audio_channels, openai_wav_bit_depth, openai_mp3_quality, openai_enable_limiter, openai_normalize_volume]
-                )
-                openai_desktop_quality.click(
-                    fn=apply_openai_desktop_quality_preset,
-                    outputs=[openai_sample_rate, openai_audio_bitrate, openai_audio_channels, openai_wav_bit_depth, openai_mp3_quality, openai_enable_limiter, openai_normalize_volume]
-                )
-                openai_high_quality.click(
-                    fn=apply_openai_high_quality_preset,
-                    outputs=[openai_sample_rate, openai_audio_bitrate, openai_audio_channels, openai_wav_bit_depth, openai_mp3_quality, openai_enable_limiter, openai_normalize_volume]
-                )
-                openai_max_quality.click(
-                    fn=apply_openai_max_quality_preset,
-                    outputs=[openai_sample_rate, openai_audio_bitrate, openai_audio_channels, openai_wav_bit_depth, openai_mp3_quality, openai_enable_limiter, openai_normalize_volume]
-                )
+                openai_quality_widgets = [openai_sample_rate, openai_audio_bitrate, openai_audio_channels, openai_wav_bit_depth, openai_mp3_quality, openai_enable_limiter, openai_normalize_volume]
+                openai_audio_quality = gr.State(_quality_settings(*(w.value for w in openai_quality_widgets)))
+                _bind_quality_state("openai", openai_quality_widgets, openai_audio_quality, {
+                    "mobile": openai_mobile_quality,
+                    "desktop": openai_desktop_quality,
+                    "high": openai_high_quality,
+                    "max": openai_max_quality,
+                })
                 
                 # Connect Piper quality preset buttons
-                piper_mobile_quality.click(
-                    fn=apply_piper_mobile_quality_preset,
-                    outputs=[piper_sample_rate, piper_audio_bitrate, piper_audio_channels, piper_wav_bit_depth, piper_mp3_quality, piper_enable_limiter, piper_normalize_volume]
-                )
-                piper_desktop_quality.click(
-                    fn=apply_piper_desktop_quality_preset,
-                    outputs=[piper_sample_rate, piper_audio_bitrate, piper_audio_channels, piper_wav_bit_depth, piper_mp3_quality, piper_enable_limiter, piper_normalize_volume]
-                )
-                piper_high_quality.click(
-                    fn=apply_piper_high_quality_preset,
-                    outputs=[piper_sample_rate, piper_audio_bitrate, piper_audio_channels, piper_wav_bit_depth, piper_mp3_quality, piper_enable_limiter, piper_normalize_volume]
-                )
-                piper_max_quality.click(
-                    fn=apply_piper_max_quality_preset,
-                    outputs=[piper_sample_rate, piper_audio_bitrate, piper_audio_channels, piper_wav_bit_depth, piper_mp3_quality, piper_enable_limiter, piper_normalize_volume]
-                )
+                piper_quality_widgets = [piper_sample_rate, piper_audio_bitrate, piper_audio_channels, piper_wav_bit_depth, piper_mp3_quality, piper_enable_limiter, piper_normalize_volume]
+                piper_audio_quality = gr.State(_quality_settings(*(w.value for w in piper_quality_widgets)))
+                _bind_quality_state("piper", piper_quality_widgets, piper_audio_quality, {
+                    "mobile": piper_mobile_quality,
+                    "desktop": piper_desktop_quality,
+                    "high": piper_high_quality,
+                    "max": piper_max_quality,
+                })
                 
             with gr.Tab("Kokoro", id="kokoro_tab_id") as kokoro_tab:
-                kokoro_tab.select(on_tab_change, inputs=None, outputs=None)
+                # Voice lists start from the fallback catalog; load_kokoro_tab fetches the
+                # server's catalog the first time the tab is opened
+                kokoro_tab_loaded = gr.State(False)
                 gr.Markdown("**Kokoro TTS** - OpenAI-compatible local server with multi-language support. Configure custom host/port if needed.")
                 
                 with gr.Row(equal_height=True):
@@ -1864,7 +2300,7 @@ def host_ui(config):
                         info="Base URL for Kokoro server (without /v1)"
                     )
                     kokoro_language = gr.Dropdown(
-                        choices=[name for code, name in get_kokoro_languages()],
+                        choices=_KOKORO_LANGUAGE_NAMES,
                         value="Auto-detect",
                         label="Language",
                         interactive=True,
@@ -1880,9 +2316,13 @@ def host_ui(config):
                         info="Kokoro model (fixed)"
                     )
                     # Standard voice selector (restored original)
-                    kokoro_voice = get_kokoro_voices_gui(
-                        os.environ.get('OPENAI_BASE_URL', 'http://localhost:8880').replace('/v1', ''), 
-                        ""
+                    kokoro_voice = gr.Dropdown(
+                        choices=list(_FALLBACK_KOKORO_CATALOG.voices),
+                        value=_FALLBACK_KOKORO_CATALOG.voices[0],
+                        label="Kokoro Voice",
+                        interactive=True,
+                        allow_custom_value=True,
+                        info="Select a Kokoro voice"
                     )
                     
                     # Advanced Voice Mixer (collapsible section)
@@ -1894,12 +2334,12 @@ def host_ui(config):
                                 # Search and multi-select interface
                                 voice_search_input = gr.Textbox(
                                     label="Buscar Voces",
-                                    placeholder="Escribe para buscar voces...",
+                                    placeholder="Escribe para buscar voces... (^ para buscar por prefijo)",
                                     interactive=True
                                 )
                                 
                                 available_voices_for_mixing = gr.CheckboxGroup(
-                                    choices=fetch_kokoro_voices(),
+                                    choices=list(_FALLBACK_KOKORO_CATALOG.voices),
                                     label="Voces Disponibles",
                                     info="Selecciona múltiples voces para mezclar",
                                     interactive=True,
@@ -1929,7 +2369,7 @@ def host_ui(config):
                         
                         # Selected voices display with weight controls
                         selected_voices_display = gr.HTML(
-                            value="<p style='color: #666; font-style: italic;'>No hay voces seleccionadas para mezclar</p>",
+                            value=_NO_MIXED_VOICES_HTML,
                             label="Voces Seleccionadas para Mezcla"
                         )
                         
@@ -1964,26 +2404,26 @@ def host_ui(config):
                         label="Speed", 
                         info="Speech speed"
                     )
+                    def handle_refresh_voices(language_name, url):
+                        _VOICES_CACHE.clear()
+                        return kokoro_voices_for_ui(language_name, url)
+
                     gr.Button("🔄 Refresh Voices", size="sm").click(
-                        fn=lambda url, lang: update_kokoro_voices_by_language(lang, url),
-                        inputs=[kokoro_base_url, kokoro_language],
+                        fn=handle_refresh_voices,
+                        inputs=[kokoro_language, kokoro_base_url],
                         outputs=kokoro_voice
+                    ).then(
+                        fn=refresh_voice_search_index,
+                        inputs=[kokoro_base_url]
                     )
                 
                 # Update voices when language changes
-                def handle_language_change(selected_language_name, base_url):
-                    # Convert language name back to code
-                    language_code = ""
-                    for code, name in get_kokoro_languages():
-                        if name == selected_language_name:
-                            language_code = code
-                            break
-                    return update_kokoro_voices_by_language(language_code, base_url)
-                
                 kokoro_language.change(
-                    fn=handle_language_change,
+                    fn=kokoro_voices_for_ui,
                     inputs=[kokoro_language, kokoro_base_url],
-                    outputs=kokoro_voice
+                    outputs=kokoro_voice,
+                    trigger_mode="always_last",
+                    show_progress="hidden",
                 )
 
                 # === KOKORO AUDIO QUALITY CONTROLS ===
@@ -2021,7 +2461,8 @@ def host_ui(config):
                             choices=[16, 24, 32], 
                             value=16, 
                             label="Profundidad de Bits (WAV)", 
-                            info="16=Estándar, 24/32=Audio profesional"
+                            info="16=Estándar, 24/32=Audio profesional",
+                            visible=False  # shown by _kokoro_format_visibility for WAV output
                         )
                         kokoro_mp3_quality_ui = gr.Slider(
                             minimum=0, maximum=9, step=1, value=2, 
@@ -2124,13 +2565,26 @@ def host_ui(config):
                     
                     with gr.Row():
                         with gr.Column(scale=2):
-                            # Multi-voice selector for testing
-                            test_voices_selector = gr.CheckboxGroup(
-                                choices=fetch_kokoro_voices(),
-                                label="Select Voices to Test",
-                                info="Choose multiple voices (up to 6 recommended)",
+                            # Multi-voice selector for testing, paged so only one page
+                            # of the catalog is rendered and sent per event
+                            first_voice_page, _, first_page_label = _voice_page(_FALLBACK_KOKORO_CATALOG.voices, 0, [])
+                            test_voices_page = gr.Dataframe(
+                                value=first_voice_page,
+                                headers=["Voice", "Select"],
+                                datatype=["str", "bool"],
+                                col_count=(2, "fixed"),
+                                row_count=(len(first_voice_page), "dynamic"),
+                                static_columns=[0],
+                                type="array",
+                                label="Select Voices to Test (up to 6 recommended)",
                                 interactive=True
                             )
+                            with gr.Row(equal_height=True):
+                                prev_voice_page_btn = gr.Button("◀", size="sm")
+                                voice_page_label = gr.Markdown(first_page_label)
+                                next_voice_page_btn = gr.Button("▶", size="sm")
+                            test_voices_offset = gr.State(0)
+                            test_voices_selector = gr.JSON(value=[], visible=False)
                         
                         with gr.Column(scale=1):
                             gr.Markdown("**JSON Configuration**")
@@ -2153,7 +2607,7 @@ def host_ui(config):
                     
                     # Dynamic weight controls for selected test voices
                     test_voice_weights_display = gr.HTML(
-                        value="<p style='color: #666; font-style: italic;'>Select voices above to adjust their weights</p>",
+                        value=_NO_TEST_VOICES_HTML,
                         label="Weight Controls"
                     )
                     
@@ -2202,12 +2656,29 @@ def host_ui(config):
                     preview_audio_output = gr.Audio(
                         label="Preview de Voz",
                         interactive=False,
-                        visible=True
+                        visible=True,
+                        streaming=True,
+                        autoplay=True
+                    )
+
+                # Test voice table paging; selection changes feed the renderer below
+                test_voices_page.input(
+                    fn=merge_voice_page_selection,
+                    inputs=[test_voices_page, test_voices_selector],
+                    outputs=[test_voices_selector]
+                )
+
+                for page_btn, step in ((prev_voice_page_btn, -_VOICE_PAGE_SIZE), (next_voice_page_btn, _VOICE_PAGE_SIZE)):
+                    page_btn.click(
+                        fn=lambda offset, selected, url, step=step: voice_selection_page(offset + step, selected, url),
+                        inputs=[test_voices_offset, test_voices_selector, kokoro_base_url],
+                        outputs=[test_voices_page, test_voices_offset, voice_page_label]
                     )
 
                 # Test voice selector events
                 test_voices_selector.change(
-                    fn=update_test_voice_weights_display,
+                    fn=None,
+                    js=_RENDER_TEST_VOICES_JS,
                     inputs=[test_voices_selector],
                     outputs=[test_voice_weights_display, test_voice_weights_json, generated_combination]
                 )
@@ -2216,23 +2687,19 @@ def host_ui(config):
                 def handle_export_config(voice_configs_json):
                     """Handle export configuration - saves to voice_presets folder"""
                     try:
-                        print(f"DEBUG: Received voice_configs_json: {voice_configs_json}")
+                        logger.debug("Received voice_configs_json: %s", voice_configs_json)
 
                         if not voice_configs_json:
                             return "❌ No configuration to export"
 
-                        if isinstance(voice_configs_json, str):
-                            payload = voice_configs_json
-                        else:
-                            payload = json.dumps(voice_configs_json)
-
-                        file_path, message = export_voice_configuration(payload)
-                        print(f"DEBUG: Export result - file_path: {file_path}, message: {message}")
+                        # gr.JSON already delivers a list; export accepts it as-is
+                        file_path, message = export_voice_configuration(voice_configs_json)
+                        logger.debug("Export result - file_path: %s, message: %s", file_path, message)
 
                         return message
                     except Exception as e:
                         error_msg = f"❌ Error in handle_export_config: {str(e)}"
-                        print(f"DEBUG: {error_msg}")
+                        logger.error(error_msg)
                         return error_msg
                 
                 export_config_btn.click(
@@ -2246,25 +2713,36 @@ def host_ui(config):
                     outputs=[config_file_input]
                 )
                 
+                kokoro_tab.select(
+                    fn=load_kokoro_tab,
+                    inputs=[kokoro_tab_loaded, kokoro_language, test_voices_selector, kokoro_base_url],
+                    outputs=[kokoro_voice, available_voices_for_mixing, test_voices_page, test_voices_offset,
+                             voice_page_label, kokoro_tab_loaded]
+                )
+                
                 config_file_input.change(
                     fn=import_voice_configuration,
                     inputs=[config_file_input],
                     outputs=[test_voices_selector, test_voice_weights_display, test_voice_weights_json, generated_combination]
+                ).then(
+                    fn=voice_selection_page,
+                    inputs=[test_voices_offset, test_voices_selector, kokoro_base_url],
+                    outputs=[test_voices_page, test_voices_offset, voice_page_label]
                 )
                 
                 # Connect advanced Kokoro functions
                 validate_combination_btn.click(
-                    fn=lambda combo, url: validate_voice_combination(combo, url)[1],
+                    fn=validate_voice_combination_msg,
                     inputs=[generated_combination, kokoro_base_url],
                     outputs=combination_result
                 )
                 
-                def apply_voice_combination(combo):
+                def apply_voice_combination(combo, base_url):
                     """Apply validated combination to main voice field"""
                     if not combo or combo.strip() == "":
                         return gr.update(), "❌ No hay combinación para aplicar"
                     
-                    is_valid, message = validate_voice_combination(combo, "http://localhost:8880")
+                    is_valid, message = validate_voice_combination(combo, base_url or "http://localhost:8880")
                     if is_valid:
                         return combo, f"✅ Applied: {combo}"
                     else:
@@ -2272,19 +2750,25 @@ def host_ui(config):
                 
                 apply_combination_btn.click(
                     fn=apply_voice_combination,
-                    inputs=[generated_combination],
+                    inputs=[generated_combination, kokoro_base_url],
                     outputs=[kokoro_voice, combination_result]
                 )
                 
+                def handle_test_connection(url):
+                    connected, message = test_kokoro_connection(url)
+                    if connected:
+                        _VALIDATION_CACHE.clear()
+                        _VOICES_CACHE.clear()
+                    return message
+                
                 test_connection_btn.click(
-                    fn=lambda url: test_kokoro_connection(url)[1],
+                    fn=handle_test_connection,
                     inputs=[kokoro_base_url],
                     outputs=connection_status
                 )
                 
                 def handle_voice_preview(voice, lang_name, custom_text, url):
-                    success, message, audio_file = preview_voice_with_language(voice, lang_name, custom_text, url)
-                    return message, audio_file if success else None
+                    yield from stream_voice_preview(voice, lang_name, custom_text, url)
                 
                 preview_voice_btn.click(
                     fn=handle_voice_preview,
@@ -2295,15 +2779,16 @@ def host_ui(config):
                 # Voice search filtering
                 voice_search_input.change(
                     fn=filter_voices_by_search,
-                    inputs=[voice_search_input],
+                    inputs=[voice_search_input, kokoro_base_url],
                     outputs=[available_voices_for_mixing]
                 )
                 
                 # Advanced Voice Mixer Events
                 available_voices_for_mixing.change(
-                    fn=update_selected_voices_display,
+                    fn=None,
+                    js=_RENDER_MIXED_VOICES_JS,
                     inputs=[available_voices_for_mixing],
-                    outputs=[selected_voices_display, voice_weights_config]
+                    outputs=[selected_voices_display]
                 )
                 
                 # Clear selection
@@ -2313,7 +2798,12 @@ def host_ui(config):
                 )
                 
                 # Apply mix to main voice field
+                # The mixer display is rendered client-side, so the config is built here
                 apply_mix_btn.click(
+                    fn=voice_configs_for_selection,
+                    inputs=[available_voices_for_mixing],
+                    outputs=[voice_weights_config]
+                ).then(
                     fn=apply_voice_mix_to_main,
                     inputs=[voice_weights_config, kokoro_voice],
                     outputs=[kokoro_voice, mix_status]
@@ -2334,24 +2824,52 @@ def host_ui(config):
                 )
 
                 # Connect Kokoro quality preset buttons
-                kokoro_mobile_quality.click(
-                    fn=apply_kokoro_mobile_quality_preset,
-                    outputs=[kokoro_sample_rate_ui, kokoro_audio_bitrate_ui, kokoro_audio_channels_ui, kokoro_wav_bit_depth_ui, kokoro_mp3_quality_ui, kokoro_enable_limiter_ui, kokoro_normalize_volume_ui]
-                )
-                kokoro_desktop_quality.click(
-                    fn=apply_kokoro_desktop_quality_preset,
-                    outputs=[kokoro_sample_rate_ui, kokoro_audio_bitrate_ui, kokoro_audio_channels_ui, kokoro_wav_bit_depth_ui, kokoro_mp3_quality_ui, kokoro_enable_limiter_ui, kokoro_normalize_volume_ui]
-                )
-                kokoro_high_quality.click(
-                    fn=apply_kokoro_high_quality_preset,
-                    outputs=[kokoro_sample_rate_ui, kokoro_audio_bitrate_ui, kokoro_audio_channels_ui, kokoro_wav_bit_depth_ui, kokoro_mp3_quality_ui, kokoro_enable_limiter_ui, kokoro_normalize_volume_ui]
-                )
-                kokoro_max_quality.click(
-                    fn=apply_kokoro_max_quality_preset,
-                    outputs=[kokoro_sample_rate_ui, kokoro_audio_bitrate_ui, kokoro_audio_channels_ui, kokoro_wav_bit_depth_ui, kokoro_mp3_quality_ui, kokoro_enable_limiter_ui, kokoro_normalize_volume_ui]
+                kokoro_quality_widgets = [kokoro_sample_rate_ui, kokoro_audio_bitrate_ui, kokoro_audio_channels_ui, kokoro_wav_bit_depth_ui, kokoro_mp3_quality_ui, kokoro_enable_limiter_ui, kokoro_normalize_volume_ui]
+                kokoro_audio_quality = gr.State(_quality_settings(*(w.value for w in kokoro_quality_widgets)))
+                kokoro_output_format.change(
+                    fn=_kokoro_format_visibility,
+                    inputs=[kokoro_output_format],
+                    outputs=[kokoro_audio_bitrate_ui, kokoro_wav_bit_depth_ui, kokoro_mp3_quality_ui]
                 )
+                _bind_quality_state("kokoro", kokoro_quality_widgets, kokoro_audio_quality, {
+                    "mobile": kokoro_mobile_quality,
+                    "desktop": kokoro_desktop_quality,
+                    "high": kokoro_high_quality,
+                    "max": kokoro_max_quality,
+                })
 
         gr.Markdown("---")
+        # Every component process_ui_form reads, in signature order; built once per UI
+        start_inputs = [
+            input_file, output_dir, worker_count, log_level, output_text, preview,
+            search_and_replace_file, title_mode, new_line_mode, chapter_start, chapter_end, remove_endnotes, remove_reference_numbers,
+            model, voices, speed, openai_output_format, instructions,
+            # OpenAI audio quality settings
+            openai_audio_quality,
+            azure_language, azure_voice, azure_output_format, azure_break_duration,
+            edge_language, edge_voice, edge_output_format, proxy, edge_voice_rate, edge_volume, edge_pitch, edge_break_duration,
+            # Coqui inputs (must appear before Piper inputs in the handler signature)
+            coqui_model, coqui_speaker, coqui_language, coqui_speaker_wav, coqui_path, coqui_output_format,
+            coqui_length_scale, coqui_noise_scale, coqui_noise_w_scale, coqui_device,
+            # Coqui audio quality settings
+            coqui_audio_quality,
+            # Kokoro inputs
+            kokoro_base_url, kokoro_language, kokoro_model, kokoro_voice, kokoro_output_format, kokoro_speed,
+            # Kokoro audio quality settings
+            kokoro_audio_quality,
+            # Kokoro advanced features
+            kokoro_volume_multiplier, kokoro_stream, kokoro_return_timestamps, kokoro_return_download_link,
+            # Kokoro normalization options
+            kokoro_normalize, kokoro_unit_normalization, kokoro_url_normalization, kokoro_email_normalization, 
+            kokoro_pluralization_normalization, kokoro_phone_normalization, kokoro_replace_symbols,
+            # Kokoro voice mixing
+            kokoro_voice_weight_normalization,
+            piper_executable_path, piper_docker_image, piper_language, piper_voice, piper_quality, piper_speaker,
+            piper_noise_scale, piper_noise_w_scale, piper_length_scale, piper_sentence_silence, piper_device,
+            # Piper audio quality settings
+            piper_audio_quality
+        ]
+
         with gr.Row(equal_height=True):
             gr.Button("Stop").click(
                 fn=terminate_audiobook_generator,
@@ -2359,42 +2877,13 @@ def host_ui(config):
                 outputs=None)
             gr.Button("Start", variant="primary").click(
                 fn=process_ui_form,
-                inputs=[
-                    input_file, output_dir, worker_count, log_level, output_text, preview,
-                    search_and_replace_file, title_mode, new_line_mode, chapter_start, chapter_end, remove_endnotes, remove_reference_numbers,
-                    model, voices, speed, openai_output_format, instructions,
-                    # OpenAI audio quality inputs
-                    openai_sample_rate, openai_audio_bitrate, openai_audio_channels, openai_wav_bit_depth, openai_mp3_quality, openai_enable_limiter, openai_normalize_volume,
-                    azure_language, azure_voice, azure_output_format, azure_break_duration,
-                    edge_language, edge_voice, edge_output_format, proxy, edge_voice_rate, edge_volume, edge_pitch, edge_break_duration,
-                    # Coqui inputs (must appear before Piper inputs in the handler signature)
-                    coqui_model, coqui_speaker, coqui_language, coqui_speaker_wav, coqui_path, coqui_output_format,
-                    coqui_length_scale, coqui_noise_scale, coqui_noise_w_scale, coqui_device,
-                    # Coqui audio quality inputs
-                    coqui_sample_rate, coqui_audio_bitrate, coqui_audio_channels, coqui_wav_bit_depth, coqui_mp3_quality, coqui_enable_limiter,
-                    # Kokoro inputs
-                    kokoro_base_url, kokoro_language, kokoro_model, kokoro_voice, kokoro_output_format, kokoro_speed,
-                    # Kokoro audio quality inputs
-                    kokoro_sample_rate_ui, kokoro_audio_bitrate_ui, kokoro_audio_channels_ui, kokoro_wav_bit_depth_ui, kokoro_mp3_quality_ui, kokoro_enable_limiter_ui, kokoro_normalize_volume_ui,
-                    # Kokoro advanced features
-                    kokoro_volume_multiplier, kokoro_stream, kokoro_return_timestamps, kokoro_return_download_link,
-                    # Kokoro normalization options
-                    kokoro_normalize, kokoro_unit_normalization, kokoro_url_normalization, kokoro_email_normalization, 
-                    kokoro_pluralization_normalization, kokoro_phone_normalization, kokoro_replace_symbols,
-                    # Kokoro voice mixing
-                    kokoro_voice_weight_normalization,
-                    piper_executable_path, piper_docker_image, piper_language, piper_voice, piper_quality, piper_speaker,
-                    piper_noise_scale, piper_noise_w_scale, piper_length_scale, piper_sentence_silence, piper_device,
-                    # Piper audio quality inputs
-                    piper_sample_rate, piper_audio_bitrate, piper_audio_channels, piper_wav_bit_depth, piper_mp3_quality, piper_enable_limiter, piper_normalize_volume
-                ],
+                inputs=start_inputs,
                 outputs=None)
         with gr.Row():
             global webui_log_file
             webui_log_file = generate_unique_log_path("EtA_WebUI")
-            # Create the log file with UTF-8 encoding
-            with open(webui_log_file, 'w', encoding='utf-8') as f:
-                f.write("")  # Create empty file with UTF-8 encoding
+            # Log needs the file to exist; the worker opens it for UTF-8 writes itself
+            webui_log_file.touch(exist_ok=True)
             Log(str(webui_log_file.absolute()), dark=True, xterm_font_size=12)
 
     ui.launch(
@@ -3,15 +3,334 @@ Audio quality utilities for TTS providers
 Shared audio processing functions for high quality output
 """
 
+import functools
+import importlib
 import logging
+import wave
 from pathlib import Path
-from pydub import AudioSegment
+from types import MappingProxyType
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+_PCM_CODECS = {16: "pcm_s16le", 24: "pcm_s24le", 32: "pcm_s32le"}
+_SAMPLE_FORMATS = {2: ("s16", np.int16), 4: ("s32", np.int32)}
+_FF_QP2LAMBDA = 118  # ffmpeg's scale for global_quality, as applied by its -q:a option
+_LAME_VBR_DEFAULT = 4  # LAME's vbr_default (vbr_mtrh), the mode ffmpeg's -q:a selects
+_SAMPLE_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+_TARGET_DBFS = -20.0  # normalize_audio_level's target level
+
+
+@functools.lru_cache(maxsize=None)
+def _optional_module(name):
+    """Import an optional accelerator on first use; None when it is not installed.
+
+    - av (PyAV) encodes in-process; without it every export goes through an ffmpeg
+      subprocess via pydub. Importing it loads the libav* libraries, which is why
+      none of these is imported with this module.
+    - lameenc binds libmp3lame directly; MP3 exports use it when PyAV is missing.
+    - soxr is a polyphase resampler; without it resampling uses pydub's audioop.ratecv.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def _as_ndarray(audio_segment):
+    """Interleaved samples of a segment as a read-only view of its raw data (None for 24-bit)."""
+    dtype = _SAMPLE_DTYPES.get(audio_segment.sample_width)
+    if dtype is None:
+        return None
+    return np.frombuffer(audio_segment.raw_data, dtype=dtype)
+
+
+def _measure(samples, max_amplitude):
+    """(RMS, peak) of integer samples in dBFS, like AudioSegment.dBFS and max_dBFS; -inf for silence."""
+    if not samples.size:
+        return -np.inf, -np.inf
+    mean_square = np.mean(np.square(samples, dtype=np.float32), dtype=np.float64)
+    peak = max(int(samples.max()), -int(samples.min()))
+    with np.errstate(divide="ignore"):
+        return (float(10 * np.log10(mean_square) - 20 * np.log10(max_amplitude)),
+                float(20 * np.log10(peak / max_amplitude)))
+
+
+def _from_ndarray(samples, audio_segment):
+    """New segment with the same format as ``audio_segment`` holding ``samples``."""
+    return audio_segment._spawn(samples.tobytes())
+
+
+def _scale_samples(samples, gain):
+    """Multiply samples by a gain (scalar or per-sample), saturating like audioop.mul."""
+    info = np.iinfo(samples.dtype)
+    work_dtype = np.float32 if samples.dtype.itemsize <= 2 else np.float64
+    scaled = np.multiply(samples, gain, dtype=work_dtype)
+    np.clip(scaled, info.min, info.max, out=scaled)
+    return np.floor(scaled, out=scaled).astype(samples.dtype)
+
+
+def _ensure_channels(audio_segment, target_channels):
+    """Convert between mono and stereo with numpy (pydub's set_channels for anything else)."""
+    channels = audio_segment.channels
+    if channels == target_channels:
+        return audio_segment
+    samples = _as_ndarray(audio_segment)
+    if samples is None or {channels, target_channels} != {1, 2}:
+        return audio_segment.set_channels(target_channels)
+
+    if target_channels == 2:
+        converted = np.repeat(samples, 2)
+    else:
+        # Average in int64 so the sum cannot overflow; >> 1 floors like audioop.tomono
+        converted = (samples.reshape(-1, 2).sum(axis=1, dtype=np.int64) >> 1).astype(samples.dtype)
+    overrides = {"channels": target_channels, "frame_width": audio_segment.sample_width * target_channels}
+    return audio_segment._spawn(converted.tobytes(), overrides=overrides)
+
+
+def _export_pyav(audio_segment, output_path, fmt, codec, bitrate=None, options=None, quality=None):
+    """Encode an AudioSegment with PyAV instead of an ffmpeg subprocess.
+
+    Returns False (writing nothing) when PyAV is unavailable or the segment's
+    sample width has no matching packed sample format.
+    """
+    av = _optional_module("av")
+    if av is None or audio_segment.sample_width not in _SAMPLE_FORMATS:
+        return False
+
+    sample_format, dtype = _SAMPLE_FORMATS[audio_segment.sample_width]
+    layout = "mono" if audio_segment.channels == 1 else "stereo"
+    # pydub's raw data is interleaved, which is what a packed frame expects: (1, samples * channels)
+    samples = np.frombuffer(audio_segment.raw_data, dtype=dtype).reshape(1, -1)
+    frame = av.AudioFrame.from_ndarray(samples, format=sample_format, layout=layout)
+    frame.sample_rate = audio_segment.frame_rate
+
+    with av.open(str(output_path), mode="w", format=fmt) as container:
+        stream = container.add_stream(codec, rate=audio_segment.frame_rate, layout=layout)
+        if bitrate:
+            stream.bit_rate = int(str(bitrate).rstrip("k")) * 1000
+        if options:
+            stream.options = options
+        if quality is not None:
+            # Same as ffmpeg's -q:a (for libmp3lame this selects VBR at that quality)
+            stream.codec_context.qscale = int(quality) * _FF_QP2LAMBDA
+        # PyAV converts the frame to the encoder's sample format/layout as needed
+        for packet in stream.encode(frame):
+            container.mux(packet)
+        for packet in stream.encode(None):
+            container.mux(packet)
+    return True
+
+def _export_wave(audio_segment, output_path, bit_depth):
+    """Write PCM WAV with the stdlib wave module; False when the sample format is not handled."""
+    samples = _as_ndarray(audio_segment)
+    if samples is None or bit_depth not in _PCM_CODECS:
+        return False
+
+    # Left-align every sample to 32 bits and keep the top bit_depth bits, like ffmpeg's PCM encoders
+    wide = samples.astype(np.int32) << (32 - 8 * samples.itemsize)
+    if bit_depth == 16:
+        data = (wide >> 16).astype("<i2").tobytes()
+    elif bit_depth == 24:
+        data = (wide >> 8).astype("<i4").view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+    else:
+        data = wide.astype("<i4").tobytes()
+
+    with wave.open(str(output_path), "wb") as w:
+        w.setnchannels(audio_segment.channels)
+        w.setsampwidth(bit_depth // 8)
+        w.setframerate(audio_segment.frame_rate)
+        w.writeframes(data)
+    return True
+
+def _export_lameenc(audio_segment, output_path, quality):
+    """Encode an AudioSegment to VBR MP3 in-process with lameenc.
+
+    ``quality`` is the VBR quality (0 = best) that ffmpeg's -q:a sets, so the file is
+    encoded the same way as on the PyAV and ffmpeg paths. Returns False when lameenc
+    is unavailable or too old to expose VBR.
+    """
+    lameenc = _optional_module("lameenc")
+    if lameenc is None or not hasattr(lameenc.Encoder, "set_vbr_quality") or audio_segment.channels > 2:
+        return False
+
+    # lameenc takes interleaved 16-bit PCM
+    if audio_segment.sample_width != 2:
+        audio_segment = audio_segment.set_sample_width(2)
+    encoder = lameenc.Encoder()
+    encoder.set_vbr(_LAME_VBR_DEFAULT)
+    encoder.set_vbr_quality(int(quality))
+    encoder.set_in_sample_rate(audio_segment.frame_rate)
+    encoder.set_channels(audio_segment.channels)
+    # Best algorithm quality lameenc accepts, as "-compression_level 0" asks of ffmpeg
+    encoder.set_quality(2)
+    mp3_data = encoder.encode(audio_segment.raw_data) + encoder.flush()
+    with open(output_path, "wb") as f:
+        f.write(mp3_data)
+    return True
+
+def _resample(audio_segment, target_rate):
+    """Resample with soxr (HQ), falling back to pydub's set_frame_rate."""
+    samples = _as_ndarray(audio_segment)
+    soxr = _optional_module("soxr")
+    if soxr is None or samples is None or samples.dtype == np.int8:
+        return audio_segment.set_frame_rate(target_rate)
+
+    info = np.iinfo(samples.dtype)
+    scale = float(audio_segment.max_possible_amplitude)
+    frames = samples.reshape(-1, audio_segment.channels).astype(np.float32) / scale
+    resampled = soxr.resample(frames, audio_segment.frame_rate, target_rate, quality="HQ")
+
+    # Back to integers with TPDF dither (+/-1 LSB) to decorrelate the rounding error
+    rng = np.random.default_rng()
+    requantized = resampled * scale + (rng.random(resampled.shape) - rng.random(resampled.shape))
+    np.clip(np.rint(requantized, out=requantized), info.min, info.max, out=requantized)
+    return audio_segment._spawn(requantized.astype(samples.dtype).tobytes(), overrides={"frame_rate": target_rate})
+
+
+def _attenuation_ramp_python(max_attenuation, attack_frames, release_frames):
+    """compress_dynamic_range's per-frame attenuation (dB), stepping towards each frame's maximum."""
+    ramp = []
+    attenuation = 0.0
+    for max_att in max_attenuation.tolist():
+        if max_att > 0.0 and attenuation <= max_att:
+            attenuation = min(attenuation + max_att / attack_frames, max_att)
+        else:
+            # Below the threshold max_att is 0, so the attenuation holds (as in pydub)
+            attenuation = max(attenuation - max_att / release_frames, 0.0)
+        ramp.append(attenuation)
+    return np.array(ramp)
+
+
+@functools.lru_cache(maxsize=1)
+def _attenuation_ramp():
+    """The attenuation ramp compiled with numba when it is installed, else the Python loop.
+
+    Both run the same float operations in the same order, so they return the same values.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return _attenuation_ramp_python
+
+    @njit(cache=True)
+    def attenuation_ramp(max_attenuation, attack_frames, release_frames):
+        ramp = np.empty(max_attenuation.size)
+        attenuation = 0.0
+        for i in range(max_attenuation.size):
+            max_att = max_attenuation[i]
+            if max_att > 0.0 and attenuation <= max_att:
+                attenuation = min(attenuation + max_att / attack_frames, max_att)
+            else:
+                attenuation = max(attenuation - max_att / release_frames, 0.0)
+            ramp[i] = attenuation
+        return ramp
+
+    return attenuation_ramp
+
+
+def _compressor_gain(samples, channels, frame_rate, max_amplitude, threshold, ratio, attack, release):
+    """Per-sample gain of pydub's compress_dynamic_range, or None when nothing is attenuated.
+
+    Follows pydub frame by frame: the RMS of the preceding ``attack`` ms (truncated
+    to an integer like audioop.rms when the samples are integers) sets the frame's
+    maximum attenuation, which is approached over ``attack`` ms and left over
+    ``release`` ms. The RMS of every frame comes from one cumulative sum; only the
+    attenuation ramp is a loop. ``samples`` are interleaved and may be integers
+    (``max_amplitude`` = full scale) or floats (1.0).
+    """
+    frames = samples.size // channels
+    if frames == 0:
+        return None
+
+    # The RMS never exceeds the peak, so audio peaking below the threshold is never attenuated
+    thresh_rms = max_amplitude * 10 ** (threshold / 20)
+    if max(float(samples.max()), -float(samples.min())) <= thresh_rms:
+        return None
+
+    # Sum of squares over frames [i - look_frames, i) for every frame i; exact in int64 up to 16 bits
+    integer = np.issubdtype(samples.dtype, np.integer)
+    accumulator = np.int64 if integer and samples.itemsize <= 2 else np.float64
+    frame_squares = np.square(samples[:frames * channels], dtype=accumulator).reshape(frames, channels).sum(axis=1)
+    cumulative = np.concatenate((np.zeros(1, dtype=accumulator), np.cumsum(frame_squares)))
+    end = np.arange(frames)
+    start = np.maximum(end - int(attack * (frame_rate / 1000.0)), 0)
+    counts = np.maximum((end - start) * channels, 1)  # an empty window sums to 0 anyway
+    rms = np.sqrt((cumulative[end] - cumulative[start]) / counts)
+    if integer:
+        rms = np.floor(rms)
+
+    over = rms > thresh_rms
+    if not over.any():
+        return None
+    with np.errstate(divide="ignore"):
+        db_over = np.where(over, 20 * np.log10(rms / thresh_rms), 0.0)
+    max_attenuation = (1 - (1.0 / ratio)) * db_over
+
+    attenuation = _attenuation_ramp()(max_attenuation, attack * (frame_rate / 1000.0),
+                                      release * (frame_rate / 1000.0))
+    if not attenuation.any():
+        return None
+    return np.repeat(10 ** (-attenuation / 20), channels)[:samples.size]
+
+
+def _compress_samples(samples, audio_segment, threshold, ratio, attack, release):
+    """numpy version of pydub's compress_dynamic_range for a segment's integer samples."""
+    gain = _compressor_gain(samples, audio_segment.channels, audio_segment.frame_rate,
+                            audio_segment.max_possible_amplitude, threshold, ratio, attack, release)
+    if gain is None:
+        return samples
+    return _scale_samples(samples, gain)
+
+
+# Predefined quality presets, by name; read-only since every caller shares them
+_QUALITY_PRESETS = MappingProxyType({name: MappingProxyType(preset) for name, preset in {
+    "mobile": {
+        "sample_rate": 16000,
+        "audio_bitrate": "128k", 
+        "audio_channels": 1,
+        "wav_bit_depth": 16,
+        "mp3_quality": 4,
+        "enable_limiter": True,
+        "normalize_volume": True
+    },
+    "desktop": {
+        "sample_rate": 22050,
+        "audio_bitrate": "192k",
+        "audio_channels": 1, 
+        "wav_bit_depth": 16,
+        "mp3_quality": 2,
+        "enable_limiter": True,
+        "normalize_volume": True
+    },
+    "high": {
+        "sample_rate": 44100,
+        "audio_bitrate": "256k",
+        "audio_channels": 1,
+        "wav_bit_depth": 24,
+        "mp3_quality": 1,
+        "enable_limiter": True,
+        "normalize_volume": True
+    },
+    "max": {
+        "sample_rate": 44100,
+        "audio_bitrate": "320k",
+        "audio_channels": 2,
+        "wav_bit_depth": 24,
+        "mp3_quality": 0,
+        "enable_limiter": True,
+        "normalize_volume": True
+    }
+}.items()})
+
+
 class AudioQualityProcessor:
     """
     Shared audio quality processing for all TTS providers
+
+    Settings are resolved from the config when the processor is created, so a
+    provider should create one processor and reuse it for every chapter.
     """
     
     def __init__(self, config, provider_prefix=""):
@@ -23,65 +342,157 @@ class AudioQualityProcessor:
             provider_prefix: Prefix for config attributes (e.g., 'coqui_', 'piper_', 'kokoro_')
         """
         self.config = config
-        self.prefix = provider_prefix
+        self.prefix = provider_prefix or ""
+
+        # Resolve the settings once; they are read for every exported segment
+        self.target_channels = int(self._get_config_value('audio_channels', 1))
+        self.target_rate = int(self._get_config_value('sample_rate', 22050))
+        self.normalize = bool(self._get_config_value('normalize_volume', True))
+        self.limiter = bool(self._get_config_value('enable_limiter', True))
+        self.bitrate = self._get_config_value('audio_bitrate', '192k')
+        self.bit_depth = int(self._get_config_value('wav_bit_depth', 16))
+        self.mp3_quality = self._get_config_value('mp3_quality', 2)
         
     def _get_config_value(self, setting_name, default_value):
         """Get configuration value with provider prefix"""
         full_name = f"{self.prefix}{setting_name}"
         return getattr(self.config, full_name, default_value)
     
-    def normalize_audio_level(self, audio_segment):
-        """Normaliza el nivel de audio para evitar diferencias de volumen"""
-        if not self._get_config_value('normalize_volume', True):
+    def normalize_audio_level(self, audio_segment, current_dBFS=None):
+        """Normaliza el nivel de audio para evitar diferencias de volumen
+
+        ``current_dBFS`` is the segment's RMS level when the caller already measured it.
+        """
+        if not self.normalize:
             return audio_segment
             
-        target_dBFS = -20.0  # Nivel target en dBFS
-        current_dBFS = audio_segment.dBFS
+        target_dBFS = _TARGET_DBFS  # Nivel target en dBFS
+        samples = _as_ndarray(audio_segment)
+        if samples is None:
+            current_dBFS = audio_segment.dBFS
+            if current_dBFS < -50.0:  # Audio muy silencioso
+                return audio_segment
+            return audio_segment.apply_gain(target_dBFS - current_dBFS)
+
+        if current_dBFS is None:
+            current_dBFS = _measure(samples, audio_segment.max_possible_amplitude)[0]
         
-        if current_dBFS < -50.0:  # Audio muy silencioso
+        if current_dBFS < -50.0:  # Audio muy silencioso (o silencio total)
             return audio_segment
         
-        change_in_dBFS = target_dBFS - current_dBFS
-        return audio_segment.apply_gain(change_in_dBFS)
+        gain = 10 ** ((target_dBFS - current_dBFS) / 20)
+        return _from_ndarray(_scale_samples(samples, gain), audio_segment)
 
-    def apply_soft_limiter(self, audio_segment):
-        """Aplica un limiter suave para evitar distorsión"""
-        if not self._get_config_value('enable_limiter', True):
+    def apply_soft_limiter(self, audio_segment, peak_dBFS=None):
+        """Aplica un limiter suave para evitar distorsión
+
+        ``peak_dBFS`` is the segment's peak level when the caller already knows it.
+        """
+        if not self.limiter:
             return audio_segment
+        if peak_dBFS is None:
+            peak_dBFS = audio_segment.max_dBFS
             
         # Comprimir picos suavemente
-        if audio_segment.max_dBFS > -3.0:
-            return audio_segment.compress_dynamic_range(
-                threshold=-12.0,
-                ratio=4.0,
-                attack=5.0,
-                release=50.0
-            )
+        if peak_dBFS > -3.0:
+            samples = _as_ndarray(audio_segment)
+            if samples is None:
+                return audio_segment.compress_dynamic_range(
+                    threshold=-12.0,
+                    ratio=4.0,
+                    attack=5.0,
+                    release=50.0
+                )
+            return _from_ndarray(_compress_samples(samples, audio_segment, threshold=-12.0, ratio=4.0,
+                                                   attack=5.0, release=50.0), audio_segment)
         return audio_segment
 
     def apply_audio_quality_settings(self, audio_segment):
         """Apply quality settings to audio segment"""
+        samples = _as_ndarray(audio_segment)
+        if (audio_segment.frame_rate != self.target_rate and samples is not None
+                and samples.dtype != np.int8 and _optional_module("soxr") is not None):
+            return self._apply_quality_settings_float(audio_segment, samples)
         
         # Convert to mono/stereo
-        target_channels = self._get_config_value('audio_channels', 1)
+        target_channels = self.target_channels
         if target_channels == 1 and audio_segment.channels > 1:
-            audio_segment = audio_segment.set_channels(1)
+            audio_segment = _ensure_channels(audio_segment, 1)
         elif target_channels == 2 and audio_segment.channels == 1:
             # Convert mono to stereo by duplicating channel
-            audio_segment = audio_segment.set_channels(2)
+            audio_segment = _ensure_channels(audio_segment, 2)
         
         # Set sample rate
-        target_rate = int(self._get_config_value('sample_rate', 22050))
+        target_rate = self.target_rate
         if audio_segment.frame_rate != target_rate:
-            audio_segment = audio_segment.set_frame_rate(target_rate)
+            audio_segment = _resample(audio_segment, target_rate)
         
-        # Apply volume normalization if enabled
-        audio_segment = self.normalize_audio_level(audio_segment)
-        
-        # Apply limiter if enabled
-        audio_segment = self.apply_soft_limiter(audio_segment)
-        
-        return audio_segment
+        samples = _as_ndarray(audio_segment)
+        if samples is None or not (self.normalize or self.limiter):
+            # Apply volume normalization if enabled
+            audio_segment = self.normalize_audio_level(audio_segment)
+
+            # Apply limiter if enabled
+            return self.apply_soft_limiter(audio_segment)
+
+        # Measure once; after normalization the peak moves by the applied gain
+        rms_dBFS, peak_dBFS = _measure(samples, audio_segment.max_possible_amplitude)
+        normalized = self.normalize_audio_level(audio_segment, rms_dBFS)
+        if normalized is not audio_segment:
+            peak_dBFS = min(peak_dBFS + _TARGET_DBFS - rms_dBFS, 0.0)
+        return self.apply_soft_limiter(normalized, peak_dBFS)
+
+    def _apply_quality_settings_float(self, audio_segment, samples):
+        """Same stages as apply_audio_quality_settings on one float buffer, quantized once at the end.
+
+        Resampling needs float samples, and the segment-based chain converts back
+        to integers after it and again after each gain stage. Here the samples
+        are mixed, resampled, normalized and limited in a single float buffer
+        (kept in integer units) and dithered back to the original sample width once.
+        """
+        channels = audio_segment.channels
+        work_dtype = np.float32 if samples.itemsize <= 2 else np.float64
+        full_scale = float(audio_segment.max_possible_amplitude)
+        frames = samples.reshape(-1, channels).astype(work_dtype)
+
+        # Convert to mono/stereo
+        if self.target_channels == 1 and channels > 1:
+            frames = frames.mean(axis=1, keepdims=True, dtype=work_dtype)
+            channels = 1
+        elif self.target_channels == 2 and channels == 1:
+            frames = np.repeat(frames, 2, axis=1)
+            channels = 2
+
+        # Set sample rate
+        frame_rate = self.target_rate
+        frames = _optional_module("soxr").resample(frames, audio_segment.frame_rate, frame_rate, quality="HQ")
+        frames = frames.astype(work_dtype, copy=False)
+
+        # Volume normalization to -20 dBFS, skipping silence and near-silence
+        if self.normalize and frames.size:
+            mean_square = float(np.mean(np.square(frames, dtype=np.float64)))
+            if mean_square > 0.0:
+                current_dBFS = 10 * np.log10(mean_square) - 20 * np.log10(full_scale)
+                if current_dBFS >= -50.0:
+                    frames *= work_dtype(10 ** ((_TARGET_DBFS - current_dBFS) / 20))
+
+        # Soft limiter when the peak is above -3 dBFS
+        if self.limiter and frames.size and np.max(np.abs(frames)) > full_scale * 10 ** (-3.0 / 20):
+            interleaved = frames.reshape(-1)
+            gain = _compressor_gain(interleaved, channels, frame_rate, full_scale, threshold=-12.0, ratio=4.0,
+                                    attack=5.0, release=50.0)
+            if gain is not None:
+                interleaved *= gain.astype(work_dtype)
+
+        # Back to integers with TPDF dither (+/-1 LSB) to decorrelate the rounding error
+        info = np.iinfo(samples.dtype)
+        rng = np.random.default_rng()
+        frames += rng.random(frames.shape, dtype=work_dtype)
+        frames -= rng.random(frames.shape, dtype=work_dtype)
+        np.clip(np.rint(frames, out=frames), info.min, info.max, out=frames)
+        overrides = {"channels": channels, "frame_rate": frame_rate,
+                     "frame_width": audio_segment.sample_width * channels}
+        return audio_segment._spawn(frames.astype(samples.dtype).tobytes(), overrides=overrides)
 
     def export_with_high_quality(self, audio_segment, output_path):
         """Export audio with high quality settings"""
@@ -94,100 +505,80 @@ class AudioQualityProcessor:
         
         if format_type == "mp3":
             # High quality MP3 export
-            bitrate = self._get_config_value('audio_bitrate', '192k')
-            mp3_quality = self._get_config_value('mp3_quality', 2)
+            bitrate = self.bitrate
+            mp3_quality = self.mp3_quality
             
             # Use high quality parameters
-            audio_segment.export(
-                output_path, 
-                format="mp3",
-                bitrate=bitrate,
-                parameters=[
-                    "-q:a", str(mp3_quality),      # Quality (0=best)
-                    "-compression_level", "0",      # No compression
-                    "-joint_stereo", "0",          # No joint stereo
-                    "-reservoir", "1",             # Enable bit reservoir
-                    "-abr", "1" if "k" in bitrate else "0"  # Enable ABR
-                ]
-            )
+            lame_options = {
+                "compression_level": "0",               # No compression
+                "joint_stereo": "0",                    # No joint stereo
+                "reservoir": "1",                       # Enable bit reservoir
+                "abr": "1" if "k" in bitrate else "0",  # Enable ABR
+            }
+            # Every encoder below writes VBR at mp3_quality, like ffmpeg's -q:a
+            if not (self._try_export_pyav(audio_segment, output_path, "mp3", "libmp3lame", bitrate, lame_options,
+                                          quality=mp3_quality)
+                    or self._try_export_lameenc(audio_segment, output_path, mp3_quality)):
+                audio_segment.export(
+                    output_path, 
+                    format="mp3",
+                    bitrate=bitrate,
+                    parameters=[
+                        "-q:a", str(mp3_quality),      # Quality (0=best)
+                        "-compression_level", "0",      # No compression
+                        "-joint_stereo", "0",          # No joint stereo
+                        "-reservoir", "1",             # Enable bit reservoir
+                        "-abr", "1" if "k" in bitrate else "0"  # Enable ABR
+                    ]
+                )
         elif format_type == "wav":
             # High quality WAV export
-            bit_depth = self._get_config_value('wav_bit_depth', 16)
-            sample_rate = self._get_config_value('sample_rate', 22050)
+            bit_depth = self.bit_depth
+            sample_rate = self.target_rate
             
-            if bit_depth == 16:
-                codec = "pcm_s16le"
-            elif bit_depth == 24:
-                codec = "pcm_s24le" 
-            elif bit_depth == 32:
-                codec = "pcm_s32le"
-            else:
-                codec = "pcm_s16le"  # Default to 16-bit for compatibility
+            codec = _PCM_CODECS.get(bit_depth, "pcm_s16le")  # Default to 16-bit for compatibility
                 
-            audio_segment.export(
-                output_path,
-                format="wav",
-                parameters=[
-                    "-acodec", codec, 
-                    "-ar", str(sample_rate),
-                    "-ac", str(audio_segment.channels)
-                ]
-            )
+            if not (_export_wave(audio_segment, output_path, bit_depth)
+                    or self._try_export_pyav(audio_segment, output_path, "wav", codec)):
+                audio_segment.export(
+                    output_path,
+                    format="wav",
+                    parameters=[
+                        "-acodec", codec, 
+                        "-ar", str(sample_rate),
+                        "-ac", str(audio_segment.channels)
+                    ]
+                )
         else:
             # For other formats, use default high quality
-            bitrate = self._get_config_value('audio_bitrate', '192k')
-            audio_segment.export(output_path, format=format_type, bitrate=bitrate)
+            audio_segment.export(output_path, format=format_type, bitrate=self.bitrate)
         
         # Log quality information
-        sample_rate = self._get_config_value('sample_rate', 22050)
-        bit_depth = self._get_config_value('wav_bit_depth', 16)
-        bitrate = self._get_config_value('audio_bitrate', '192k')
-        
         logger.info(f"🎵 Exported {self.prefix.upper()}audio with HIGH QUALITY: {format_type.upper()}, "
-                   f"{sample_rate}Hz, {bit_depth}-bit, {bitrate}")
+                   f"{self.target_rate}Hz, {self.bit_depth}-bit, {self.bitrate}")
         
         return True
 
-    def get_quality_preset_configs(self):
-        """Get predefined quality preset configurations"""
-        return {
-            "mobile": {
-                "sample_rate": 16000,
-                "audio_bitrate": "128k", 
-                "audio_channels": 1,
-                "wav_bit_depth": 16,
-                "mp3_quality": 4,
-                "enable_limiter": True,
-                "normalize_volume": True
-            },
-            "desktop": {
-                "sample_rate": 22050,
-                "audio_bitrate": "192k",
-                "audio_channels": 1, 
-                "wav_bit_depth": 16,
-                "mp3_quality": 2,
-                "enable_limiter": True,
-                "normalize_volume": True
-            },
-            "high": {
-                "sample_rate": 44100,
-                "audio_bitrate": "256k",
-                "audio_channels": 1,
-                "wav_bit_depth": 24,
-                "mp3_quality": 1,
-                "enable_limiter": True,
-                "normalize_volume": True
-            },
-            "max": {
-                "sample_rate": 44100,
-                "audio_bitrate": "320k",
-                "audio_channels": 2,
-                "wav_bit_depth": 24,
-                "mp3_quality": 0,
-                "enable_limiter": True,
-                "normalize_volume": True
-            }
-        }
+    def _try_export_lameenc(self, audio_segment, output_path, quality):
+        """Export MP3 through lameenc when possible; False means the caller should try the next encoder."""
+        try:
+            return _export_lameenc(audio_segment, output_path, quality)
+        except Exception as e:
+            logger.warning(f"lameenc export failed, falling back: {e}")
+            return False
+
+    def _try_export_pyav(self, audio_segment, output_path, fmt, codec, bitrate=None, options=None, quality=None):
+        """Export through PyAV when possible; False means the caller should use pydub."""
+        try:
+            return _export_pyav(audio_segment, output_path, fmt, codec, bitrate, options, quality)
+        except Exception as e:
+            logger.warning(f"PyAV export failed, falling back to ffmpeg: {e}")
+            return False
+
+    @staticmethod
+    def get_quality_preset_configs():
+        """Get predefined quality preset configurations (read-only mappings)"""
+        return _QUALITY_PRESETS
 
 def apply_preset_to_config(config, preset_name, provider_prefix):
     """
@@ -198,8 +589,7 @@ def apply_preset_to_config(config, preset_name, provider_prefix):
         preset_name: Name of preset ('mobile', 'desktop', 'high', 'max')
         provider_prefix: Provider prefix ('coqui_', 'piper_', 'kokoro_')
     """
-    processor = AudioQualityProcessor(config, provider_prefix)
-    presets = processor.get_quality_preset_configs()
+    presets = AudioQualityProcessor.get_quality_preset_configs()
     
     if preset_name not in presets:
         logger.warning(f"Unknown preset '{preset_name}', using 'desktop'")
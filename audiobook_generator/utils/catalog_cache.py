@@ -0,0 +1,73 @@
+import functools
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate every cached entry when a cached getter changes its result shape
+CACHE_SCHEMA_VERSION = 1
+
+_TTL_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def _cache_dir() -> Path:
+    """Return the per-user catalog cache directory.
+
+    Example: %LOCALAPPDATA%/EpubToAudiobook/catalog_cache
+    Fallback to ~/.epub_to_audiobook/catalog_cache if LOCALAPPDATA is not set.
+    """
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA")
+        if base:
+            return Path(base) / "EpubToAudiobook" / "catalog_cache"
+    return Path.home() / ".epub_to_audiobook" / "catalog_cache"
+
+
+def _ttl_seconds(ttl) -> float:
+    """Accept a number of seconds or a string such as "45s", "30m", "24h" or "7d"."""
+    if isinstance(ttl, str):
+        return float(ttl[:-1]) * _TTL_UNITS[ttl[-1]]
+    return float(ttl)
+
+
+def disk_cached(ttl="24h"):
+    """Cache a function's JSON-serializable result on disk across runs.
+
+    Entries are keyed by the function and its positional arguments and store
+    {"created_at", "ttl", "value"}; an entry older than ``ttl`` is refreshed on
+    the next call. Exceptions are not cached, and an unreadable or unwritable
+    cache just falls through to calling the function. Delete the cache
+    directory or bump CACHE_SCHEMA_VERSION to invalidate everything.
+    """
+    max_age = _ttl_seconds(ttl)
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args):
+            key = json.dumps([CACHE_SCHEMA_VERSION, func.__module__, func.__qualname__, args], default=str)
+            path = _cache_dir() / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+            try:
+                entry = json.loads(path.read_text(encoding="utf-8"))
+                if time.time() - entry["created_at"] < max_age:
+                    return entry["value"]
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+
+            value = func(*args)
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                tmp_path.write_text(json.dumps({"created_at": time.time(), "ttl": max_age, "value": value}),
+                                    encoding="utf-8")
+                os.replace(tmp_path, path)
+            except (OSError, TypeError, ValueError) as e:
+                logger.debug(f"Could not write catalog cache for {func.__qualname__}: {e}")
+            return value
+
+        return wrapper
+
+    return decorator
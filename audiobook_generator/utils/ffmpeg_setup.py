@@ -1,24 +1,36 @@
+import functools
+import io
 import os
 import sys
 import logging
 import tempfile
 from pathlib import Path
 
-import requests
 from zipfile import ZipFile
 import shutil
-from pydub import AudioSegment
-from pydub.utils import which
+import struct
+import zlib
+from typing import TYPE_CHECKING
+# requests and pydub are imported where they are used: most runs find FFmpeg on
+# PATH and never download anything, and importing them costs ~100 ms at startup
 from .resource_path import resource_path
 
+if TYPE_CHECKING:
+    import requests
+
 logger = logging.getLogger(__name__)
 
+# Set once FFmpeg has been found or installed, so later calls return immediately
+_ffmpeg_configured: bool = False
+
 
+@functools.lru_cache(maxsize=1)
 def _embedded_ffmpeg_bin_dir() -> Path:
     # When frozen, resources live under _MEIPASS; in dev, under project root
     return resource_path("third_party/ffmpeg/bin")
 
 
+@functools.lru_cache(maxsize=1)
 def _user_ffmpeg_bin_dir() -> Path:
     """Return a writable per-user directory for FFmpeg binaries on Windows.
 
@@ -34,6 +46,8 @@ def _user_ffmpeg_bin_dir() -> Path:
 
 
 def _set_pydub_ffmpeg(bin_dir: Path) -> None:
+    from pydub import AudioSegment
+
     ffmpeg = bin_dir / ("ffmpeg.exe" if os.name == "nt" else "ffmpeg")
     ffprobe = bin_dir / ("ffprobe.exe" if os.name == "nt" else "ffprobe")
     # Prepend to PATH so subprocesses can see it
@@ -54,9 +68,144 @@ def _try_configure_from_embedded() -> bool:
     return False
 
 
+# Zip records used to fetch single members with HTTP Range requests
+_ZIP_EOCD = struct.Struct("<4s4H2LH")
+_ZIP_CENTRAL_ENTRY = struct.Struct("<4s6H3L5H2L")
+_ZIP_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_ZIP_EOCD_SEARCH = _ZIP_EOCD.size + 0xFFFF  # the record plus the longest possible archive comment
+_FFMPEG_MEMBERS = ("/bin/ffmpeg.exe", "/bin/ffprobe.exe")
+
+
+def _download_session() -> "requests.Session":
+    """Session for the FFmpeg download: one connection pool for the release redirect and
+    every following request, with retries and backoff for transient failures."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(max_retries=Retry(total=3, backoff_factor=1)))
+    return session
+
+
+def _get_range(session: "requests.Session", url: str, byte_range: str) -> "requests.Response":
+    # Streamed, so nothing is read when a server answers with the whole file instead
+    r = session.get(url, stream=True, timeout=60,
+                     headers={"Range": f"bytes={byte_range}", "Accept-Encoding": "identity"})
+    r.raise_for_status()
+    if r.status_code != 206:
+        r.close()
+        raise ValueError("server ignored the Range header")
+    return r
+
+
+def _install_from_zip_ranges(session: "requests.Session", url: str, target_bin: Path) -> None:
+    """Fetch only ffmpeg.exe and ffprobe.exe out of the remote zip with Range requests.
+
+    Reads the end of central directory record from the tail of the archive, finds the
+    two members in the central directory and streams just their compressed data
+    through zlib. Raises if the server or the archive layout does not allow it.
+    """
+    with _get_range(session, url, f"-{_ZIP_EOCD_SEARCH}") as r:
+        tail = r.content
+        url = r.url  # skip the release redirect on the following requests
+        archive_size = int(r.headers["Content-Range"].rsplit("/", 1)[1])
+
+    eocd_at = tail.rfind(b"PK\x05\x06")
+    if eocd_at < 0:
+        raise ValueError("end of central directory not found")
+    _, _, _, _, entry_count, cd_size, cd_offset, _ = _ZIP_EOCD.unpack_from(tail, eocd_at)
+    if cd_offset == 0xFFFFFFFF:
+        raise ValueError("zip64 archives are not supported")
+
+    tail_offset = archive_size - len(tail)
+    if cd_offset >= tail_offset:
+        central_dir = tail[cd_offset - tail_offset:cd_offset - tail_offset + cd_size]
+    else:
+        with _get_range(session, url, f"{cd_offset}-{cd_offset + cd_size - 1}") as r:
+            central_dir = r.content
+
+    # name -> (method, crc, compressed size, local header offset)
+    entries = {}
+    pos = 0
+    for _ in range(entry_count):
+        (_, _, _, _, method, _, _, crc, comp_size, _, name_len, extra_len, comment_len,
+         _, _, _, local_offset) = _ZIP_CENTRAL_ENTRY.unpack_from(central_dir, pos)
+        pos += _ZIP_CENTRAL_ENTRY.size
+        name = central_dir[pos:pos + name_len].decode("utf-8", "replace")
+        pos += name_len + extra_len + comment_len
+        entries[name] = (method, crc, comp_size, local_offset)
+
+    members = {name: entry for name, entry in entries.items() if name.lower().endswith(_FFMPEG_MEMBERS)}
+    if len(members) != len(_FFMPEG_MEMBERS):
+        raise ValueError("FFmpeg binaries not found in the archive")
+
+    for name, (method, crc, comp_size, local_offset) in members.items():
+        if method not in (0, 8):
+            raise ValueError(f"unsupported compression method {method} for {name}")
+        # The local header's extra field can differ from the central one, so read its length first
+        with _get_range(session, url, f"{local_offset}-{local_offset + _ZIP_LOCAL_HEADER.size - 1}") as r:
+            header = _ZIP_LOCAL_HEADER.unpack(r.content)
+        data_start = local_offset + _ZIP_LOCAL_HEADER.size + header[-2] + header[-1]
+
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS) if method == 8 else None
+        written_crc = 0
+        with _get_range(session, url, f"{data_start}-{data_start + comp_size - 1}") as r, \
+                open(target_bin / Path(name).name, 'wb') as dst:
+            for chunk in r.iter_content(chunk_size=1 << 20):
+                if decompressor:
+                    chunk = decompressor.decompress(chunk)
+                written_crc = zlib.crc32(chunk, written_crc)
+                dst.write(chunk)
+            if decompressor:
+                chunk = decompressor.flush()
+                written_crc = zlib.crc32(chunk, written_crc)
+                dst.write(chunk)
+        if written_crc != crc:
+            raise ValueError(f"CRC mismatch for {name}")
+
+
+def _install_from_full_archive(session: "requests.Session", url: str, target_bin: Path) -> bool:
+    # The zip is already compressed; keep the response body as-is and buffer it in memory
+    buf = io.BytesIO()
+    with session.get(url, stream=True, timeout=60, headers={"Accept-Encoding": "identity"}) as r:
+        r.raise_for_status()
+        r.raw.decode_content = True
+        shutil.copyfileobj(r.raw, buf, length=16 << 20)
+    buf.seek(0)
+
+    with ZipFile(buf, 'r') as z:
+        # Extract only the bin/ffmpeg.exe and bin/ffprobe.exe
+        members = [
+            name for name in z.namelist()
+            if name.lower().endswith('/bin/ffmpeg.exe') or name.lower().endswith('/bin/ffprobe.exe')
+        ]
+        if members:
+            # Copy only the needed binaries from the archive
+            for m in members:
+                filename = Path(m).name
+                with z.open(m) as src, open(target_bin / filename, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, length=1 << 20)
+        else:
+            # Fall back to extracting entire zip to a temp dir, then copy binaries
+            extract_root = Path(tempfile.mkdtemp(prefix="ffmpeg_extract_"))
+            z.extractall(extract_root)
+            ffmpeg_candidates = list(extract_root.rglob("ffmpeg.exe"))
+            ffprobe_candidates = list(extract_root.rglob("ffprobe.exe"))
+            if not ffmpeg_candidates or not ffprobe_candidates:
+                logger.error("FFmpeg download extracted but binaries not found")
+                return False
+            shutil.copyfile(ffmpeg_candidates[0], target_bin / "ffmpeg.exe")
+            shutil.copyfile(ffprobe_candidates[0], target_bin / "ffprobe.exe")
+    return True
+
+
 def _download_and_install_ffmpeg() -> bool:
     """Download a Windows x64 static FFmpeg build and place ffmpeg/ffprobe into a user-writable folder.
 
+    Only the two binaries are fetched when the server supports Range requests;
+    otherwise the whole archive is downloaded.
+
     Returns True on success, False otherwise.
     """
     if os.name != "nt":
@@ -67,44 +216,19 @@ def _download_and_install_ffmpeg() -> bool:
         "ffmpeg-master-latest-win64-gpl.zip"
     )
 
-    tmp_path: Path | None = None
     try:
         logger.info("Downloading FFmpeg (Windows x64 static build)...")
-        with requests.get(url, stream=True, timeout=60) as r:
-            r.raise_for_status()
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".zip") as tmp:
-                for chunk in r.iter_content(chunk_size=1024 * 1024):
-                    if chunk:
-                        tmp.write(chunk)
-                tmp_path = Path(tmp.name)
-
         # Install into a user-writable location
         target_bin = _user_ffmpeg_bin_dir()
         target_bin.mkdir(parents=True, exist_ok=True)
 
-        with ZipFile(tmp_path, 'r') as z:
-            # Extract only the bin/ffmpeg.exe and bin/ffprobe.exe
-            members = [
-                name for name in z.namelist()
-                if name.lower().endswith('/bin/ffmpeg.exe') or name.lower().endswith('/bin/ffprobe.exe')
-            ]
-            if members:
-                # Copy only the needed binaries from the archive
-                for m in members:
-                    filename = Path(m).name
-                    with z.open(m) as src, open(target_bin / filename, 'wb') as dst:
-                        dst.write(src.read())
-            else:
-                # Fall back to extracting entire zip to a temp dir, then copy binaries
-                extract_root = Path(tempfile.mkdtemp(prefix="ffmpeg_extract_"))
-                z.extractall(extract_root)
-                ffmpeg_candidates = list(extract_root.rglob("ffmpeg.exe"))
-                ffprobe_candidates = list(extract_root.rglob("ffprobe.exe"))
-                if not ffmpeg_candidates or not ffprobe_candidates:
-                    logger.error("FFmpeg download extracted but binaries not found")
+        with _download_session() as session:
+            try:
+                _install_from_zip_ranges(session, url, target_bin)
+            except Exception as e:
+                logger.info(f"Could not fetch the FFmpeg binaries alone ({e}), downloading the whole archive")
+                if not _install_from_full_archive(session, url, target_bin):
                     return False
-                shutil.copyfile(ffmpeg_candidates[0], target_bin / "ffmpeg.exe")
-                shutil.copyfile(ffprobe_candidates[0], target_bin / "ffprobe.exe")
 
         # Configure pydub to use the newly installed binaries
         _set_pydub_ffmpeg(target_bin)
@@ -113,12 +237,6 @@ def _download_and_install_ffmpeg() -> bool:
     except Exception as e:
         logger.warning(f"Failed to download/install FFmpeg: {e}")
         return False
-    finally:
-        if tmp_path and tmp_path.exists():
-            try:
-                tmp_path.unlink()
-            except Exception:
-                pass
 
 
 def ensure_ffmpeg_available() -> None:
@@ -130,16 +248,20 @@ def ensure_ffmpeg_available() -> None:
     3) On Windows, try auto-download and configure.
     4) Otherwise, log instruction.
     """
+    global _ffmpeg_configured
+    if _ffmpeg_configured:
+        return
+
+    from pydub.utils import which
     ffmpeg_path = which("ffmpeg")
     ffprobe_path = which("ffprobe")
     if ffmpeg_path and ffprobe_path:
         logger.info(f"Found FFmpeg on PATH: ffmpeg={ffmpeg_path}, ffprobe={ffprobe_path}")
+        _ffmpeg_configured = True
         return
 
-    if _try_configure_from_embedded():
-        return
-
-    if _download_and_install_ffmpeg():
+    if _try_configure_from_embedded() or _download_and_install_ffmpeg():
+        _ffmpeg_configured = True
         return
 
     logger.warning(
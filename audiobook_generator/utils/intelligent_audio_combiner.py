@@ -3,16 +3,173 @@ Sistema Avanzado de Combinación de Audio con Prevención de Duplicación
 y Transiciones Inteligentes para TTS Locales
 """
 
+import bisect
+import functools
 import logging
+import math
+import os
 import numpy as np
 from pydub import AudioSegment
 from typing import List, Tuple, Optional, Dict, Any
 import hashlib
-import json
+import struct
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from audiobook_generator.utils.audio_quality import _compress_samples, _compressor_gain, _scale_samples
 
 logger = logging.getLogger(__name__)
 
+_SAMPLE_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+_HASH_SAMPLES = 4096  # muestras de cada chunk que entran en su hash
+_FAST_HASH_BYTES = 4096  # bytes del inicio y del final que entran en el hash rápido
+# Tipo de transición según la diferencia de volumen (dB): la etiqueta i cubre [umbral[i-1], umbral[i])
+_TRANSITION_THRESHOLDS = (3.0, 8.0)
+_TRANSITION_TYPES = ('smooth', 'moderate', 'sharp')
+# Clasificadores por umbrales: la etiqueta i cubre (umbral[i-1], umbral[i]], como una cadena de `>`
+_VOLUME_THRESHOLDS = (-40.0, -25.0, -15.0)  # dBFS
+_VOLUME_LABELS = ('very_quiet', 'quiet', 'medium', 'loud')
+_CONTENT_THRESHOLDS = (5.0, 10.0, 20.0)  # rango dinámico (pico - RMS) en dB
+_CONTENT_LABELS = (
+    'near_silence',     # Casi silencio
+    'monotone_speech',  # Habla monótona
+    'normal_speech',    # Habla normal
+    'dynamic_speech',   # Habla con mucha variación
+)
+_SPLICE_WINDOW_MS, _SPLICE_HOP_MS = 32, 8  # ventanas del análisis espectral del empalme
+_SPLICE_TRIM_PENALTY = 0.01  # similitud (coseno) que cuesta cada salto recortado
+_SPLICE_MAX_TRIM_HOPS = 3  # como mucho 24 ms recortados por lado
+_SPLICE_SILENCE_DBFS = -50.0  # solo se recorta audio por debajo de este nivel (el de _is_silence)
+
+
+def _raw_np(audio: AudioSegment) -> np.ndarray:
+    """Muestras intercaladas del audio como vista de solo lectura de raw_data"""
+    return np.frombuffer(audio.raw_data, dtype=_SAMPLE_DTYPES[audio.sample_width])
+
+
+def _hash_format(audio: AudioSegment) -> bytes:
+    """Duración y formato del audio empaquetados para su hash"""
+    return struct.pack('<IHI', len(audio), audio.channels, audio.frame_rate)
+
+
+def _ms_to_frame(audio: AudioSegment, ms: float) -> int:
+    """Índice de frame de una posición en ms, como al cortar audio[a:b]"""
+    return int(ms * audio.frame_rate / 1000)
+
+
+def _levels_dbfs(samples: np.ndarray, max_amplitude: float) -> Tuple[float, float]:
+    """(RMS, pico) en dBFS como AudioSegment.dBFS / max_dBFS; -inf para silencio
+
+    Como audioop.rms, el RMS se trunca a entero, así que un audio casi mudo da -inf igual que en pydub.
+    """
+    if not samples.size:
+        return -np.inf, -np.inf
+    rms = np.floor(np.sqrt(np.mean(np.square(samples, dtype=np.float64))))
+    peak = max(int(samples.max()), -int(samples.min()))
+    with np.errstate(divide="ignore"):
+        return float(20 * np.log10(rms / max_amplitude)), float(20 * np.log10(peak / max_amplitude))
+
+
+@functools.lru_cache(maxsize=64)
+def _fade_curves(frames: int, equal_power: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """(fade_out, fade_in) para un crossfade de `frames` frames; compartidas, de solo lectura
+
+    De igual potencia (cos/sin) o lineales. Los crossfades solo usan unas pocas duraciones,
+    así que cada curva se calcula una vez.
+    """
+    if equal_power:
+        t = np.linspace(0, np.pi / 2, frames)
+        fade_out, fade_in = np.cos(t), np.sin(t)
+    else:
+        fade_in = np.linspace(0.0, 1.0, frames)
+        fade_out = 1.0 - fade_in
+    fade_out.setflags(write=False)
+    fade_in.setflags(write=False)
+    return fade_out, fade_in
+
+
+def _crossfade_mix_numpy(tail: np.ndarray, head: np.ndarray, fade_out: np.ndarray, fade_in: np.ndarray,
+                         out: np.ndarray) -> None:
+    """Escribe en `out` (frames, canales) la mezcla tail*fade_out + head*fade_in redondeada y saturada"""
+    limits = np.iinfo(out.dtype)
+    mixed = tail * fade_out[:, None] + head * fade_in[:, None]
+    np.clip(np.rint(mixed), limits.min, limits.max, out=mixed)
+    out[:] = mixed
+
+
+@functools.lru_cache(maxsize=1)
+def _crossfade_mixer():
+    """Kernel de mezcla del crossfade: compilado con numba si está instalado, si no la versión numpy
+
+    numba se importa aquí y no al cargar el módulo porque importarlo y compilar cuesta segundos.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return _crossfade_mix_numpy
+
+    @njit(cache=True, fastmath=True)
+    def crossfade_mix(tail, head, fade_out, fade_in, out):
+        # Un solo recorrido sin temporales: multiplica-suma, redondea y satura cada muestra
+        low, high = np.iinfo(out.dtype).min, np.iinfo(out.dtype).max
+        for i in range(out.shape[0]):
+            for c in range(out.shape[1]):
+                value = np.rint(tail[i, c] * fade_out[i] + head[i, c] * fade_in[i])
+                out[i, c] = min(max(value, low), high)
+
+    return crossfade_mix
+
+
+def _compress(audio: AudioSegment, threshold: float, ratio: float, attack: float, release: float) -> AudioSegment:
+    """compress_dynamic_range de pydub calculado con numpy (pydub para anchos sin dtype)"""
+    if audio.sample_width not in _SAMPLE_DTYPES:
+        return audio.compress_dynamic_range(threshold=threshold, ratio=ratio, attack=attack, release=release)
+    samples = _raw_np(audio)
+    compressed = _compress_samples(samples, audio, threshold, ratio, attack, release)
+    return audio if compressed is samples else audio._spawn(compressed.tobytes())
+
+
+def _best_splice(tail: np.ndarray, head: np.ndarray, frame_rate: int, silence_amplitude: float) -> Tuple[int, int]:
+    """Punto de empalme más parecido entre el final de un audio y el inicio del siguiente
+
+    Compara espectros de ventanas Hann de 32 ms de `tail` y `head` (mono) desplazadas en saltos de 8 ms
+    y devuelve (ms a recortar del final del primero, ms a saltar al inicio del segundo) para que el
+    cruce empiece en el par de ventanas espectralmente más similar. Lo recortado se elimina del
+    resultado, así que solo se recortan hasta _SPLICE_MAX_TRIM_HOPS saltos y solo si todos ellos
+    tienen un RMS por debajo de `silence_amplitude`: el empalme se desplaza sobre silencio y nunca
+    corta voz. (0, 0) si no hay nada que se pueda recortar.
+    """
+    window, hop = int(frame_rate * _SPLICE_WINDOW_MS / 1000), int(frame_rate * _SPLICE_HOP_MS / 1000)
+    if hop <= 0 or min(len(tail), len(head)) < window + hop:
+        return 0, 0
+    max_trims = min(_SPLICE_MAX_TRIM_HOPS, (len(tail) - window) // hop, (len(head) - window) // hop)
+
+    def silent_hops(x: np.ndarray) -> int:
+        # Saltos seguidos en silencio desde el inicio de x
+        blocks = x[:max_trims * hop].reshape(max_trims, hop)
+        quiet = np.sqrt(np.mean(np.square(blocks), axis=1)) < silence_amplitude
+        return int(np.logical_and.accumulate(quiet).sum())
+
+    tail_trims, head_trims = silent_hops(tail[::-1]), silent_hops(head)
+    if not (tail_trims or head_trims):
+        return 0, 0
+    hann = np.hanning(window)
+
+    def spectra(x: np.ndarray, starts: np.ndarray) -> np.ndarray:
+        frames = x[starts[:, None] + np.arange(window)] * hann
+        power = np.log1p(np.abs(np.fft.rfft(frames, axis=1)) ** 2)
+        # Normalizado por ventana: se busca la forma del espectro, no la ventana más fuerte
+        return power / np.maximum(np.linalg.norm(power, axis=1, keepdims=True), 1e-12)
+
+    # Fila k: ventana que acaba k saltos antes del final de tail; columna k: la que empieza k saltos dentro de head
+    tail_spectra = spectra(tail, len(tail) - window - hop * np.arange(tail_trims + 1))
+    head_spectra = spectra(head, hop * np.arange(head_trims + 1))
+    similarity = tail_spectra @ head_spectra.T
+    # Cada salto recortado penaliza un poco: solo se mueve el empalme si el parecido mejora de verdad
+    similarity -= _SPLICE_TRIM_PENALTY * (np.arange(tail_trims + 1)[:, None] + np.arange(head_trims + 1)[None, :])
+    t, s = np.unravel_index(np.argmax(similarity), similarity.shape)
+    return int(t) * _SPLICE_HOP_MS, int(s) * _SPLICE_HOP_MS
+
 
 class IntelligentAudioCombiner:
     """
@@ -23,11 +180,25 @@ class IntelligentAudioCombiner:
     - Validación de integridad
     """
     
+    # Transición hacia o desde un silencio: ni crossfade ni pausa, no hace falta medir nada
+    _SILENCE_TRANSITION = {
+        'type': 'silence',
+        'volume_difference': 0.0,
+        'crossfade_duration': 0,
+        'splice_offsets': (0, 0),
+        'needs_pause': False,
+        'pause_duration': 0,
+        'compatibility_score': 1.0
+    }
+    
     def __init__(self, tts_type: str = "default"):
         self.tts_type = tts_type
         self.processed_chunks = {}  # Cache de chunks procesados
-        self.chunk_hashes = set()   # Para detectar duplicación
-        self.transition_cache = {}  # Cache de análisis de transiciones
+        self.chunk_hashes = set()   # Para detectar duplicación (MD5 de los chunks con hash rápido repetido)
+        self._fast_hashes = {}      # hash rápido -> primer chunk con él (None una vez resuelto por MD5)
+        self.transition_cache = {}  # Cache de análisis de transiciones: (hash1, hash2) -> transición
+        self._bucket_plans = {}     # (bucket1, bucket2) -> (necesita pausa, duración de la pausa, ajuste del score)
+        # processed_chunks: id(audio) -> (audio, estadísticas); se guarda el audio para que su id no se reutilice
         
         # Configuraciones por tipo de TTS
         self.configs = {
@@ -73,6 +244,8 @@ class IntelligentAudioCombiner:
         if not audio_segments:
             raise ValueError("No audio segments provided")
         
+        audio_segments = self._unify_formats(audio_segments)
+        
         # 1. Filtrar y validar segmentos
         validated_segments = self._validate_and_filter_segments(
             audio_segments, chunk_texts, validate_integrity
@@ -98,39 +271,61 @@ class IntelligentAudioCombiner:
         
         return combined_audio
     
+    @staticmethod
+    def _unify_formats(audio_segments: List[AudioSegment]) -> List[AudioSegment]:
+        """Lleva todos los segmentos al formato común una sola vez, antes de combinarlos
+
+        Es el mismo formato al que pydub sincroniza en cada suma (máximo de canales, frecuencia y
+        ancho de muestra); con formatos mezclados, sincronizar al combinar re-convertía el resultado
+        entero en cada transición.
+        """
+        formats = {(audio.channels, audio.frame_rate, audio.sample_width) for audio in audio_segments}
+        if len(formats) <= 1:
+            return audio_segments
+        channels, frame_rate, sample_width = (max(values) for values in zip(*formats))
+        logger.debug(f"Converting {len(audio_segments)} audio segments to {frame_rate} Hz, "
+                     f"{channels} channel(s), {sample_width * 8}-bit")
+        return [audio.set_channels(channels).set_frame_rate(frame_rate).set_sample_width(sample_width)
+                for audio in audio_segments]
+    
     def _validate_and_filter_segments(self, audio_segments: List[AudioSegment], 
                                     chunk_texts: List[str] = None,
                                     validate_integrity: bool = True) -> List[Dict[str, Any]]:
         """Valida segmentos y detecta duplicación"""
         validated = []
         
+        # El análisis de cada chunk es independiente y numpy suelta el GIL en sus pasadas, así que
+        # se reparte en hilos; la detección de duplicados depende del orden y se hace aquí después
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+            analyses = [pool.submit(self._analyze_chunk, audio) for audio in audio_segments]
+        
         for i, audio in enumerate(audio_segments):
             try:
+                is_silence, properties = analyses[i].result()
                 # Información del chunk
                 chunk_info = {
                     'audio': audio,
                     'index': i,
                     'text': chunk_texts[i] if chunk_texts and i < len(chunk_texts) else "",
                     'duration': len(audio),
-                    'is_silence': self._is_silence(audio)
+                    'is_silence': is_silence
                 }
                 
                 # Skip chunks muy cortos o inválidos
-                if len(audio) < 10:  # Menos de 10ms
-                    logger.debug(f"Skipping chunk {i}: too short ({len(audio)}ms)")
+                if chunk_info['duration'] < 10:  # Menos de 10ms
+                    logger.debug(f"Skipping chunk {i}: too short ({chunk_info['duration']}ms)")
                     continue
                 
                 # Detección de duplicación si está habilitada
                 if self.config.get('duplicate_detection', True) and validate_integrity:
-                    chunk_hash = self._calculate_audio_hash(audio)
-                    if chunk_hash in self.chunk_hashes:
+                    chunk_hash = self._register_chunk_hash(audio)
+                    if chunk_hash is None:
                         logger.warning(f"Detected duplicate chunk {i}, skipping")
                         continue
-                    self.chunk_hashes.add(chunk_hash)
                     chunk_info['hash'] = chunk_hash
                 
                 # Análisis adicional del chunk
-                chunk_info.update(self._analyze_chunk_properties(audio))
+                chunk_info.update(properties)
                 
                 validated.append(chunk_info)
                 
@@ -141,50 +336,104 @@ class IntelligentAudioCombiner:
         logger.info(f"Validated {len(validated)} out of {len(audio_segments)} audio segments")
         return validated
     
+    def _analyze_chunk(self, audio: AudioSegment) -> Tuple[bool, Dict[str, Any]]:
+        """(es silencio, propiedades) de un chunk; no depende de los demás chunks"""
+        return self._is_silence(audio), self._analyze_chunk_properties(audio)
+    
+    def _register_chunk_hash(self, audio: AudioSegment) -> Optional[str]:
+        """Registra el chunk para la detección de duplicados; devuelve su hash o None si está repetido
+
+        El hash de Python (SipHash) del inicio y el final de los bytes descarta casi todos los chunks
+        nuevos; el MD5 de _calculate_audio_hash solo se calcula cuando ese hash rápido coincide.
+        """
+        raw = audio.raw_data
+        fast_hash = hash((raw[:_FAST_HASH_BYTES], raw[-_FAST_HASH_BYTES:], len(raw),
+                          audio.channels, audio.frame_rate))
+        if fast_hash not in self._fast_hashes:
+            self._fast_hashes[fast_hash] = audio
+            return format(fast_hash & 0xFFFFFFFFFFFFFFFF, '016x')
+        
+        first = self._fast_hashes[fast_hash]
+        if first is not None:
+            # Primera coincidencia: desde ahora este hash rápido se resuelve con MD5
+            self.chunk_hashes.add(self._calculate_audio_hash(first))
+            self._fast_hashes[fast_hash] = None
+        chunk_hash = self._calculate_audio_hash(audio)
+        if chunk_hash in self.chunk_hashes:
+            return None
+        self.chunk_hashes.add(chunk_hash)
+        return chunk_hash
+    
     def _calculate_audio_hash(self, audio: AudioSegment) -> str:
         """Calcula hash del audio para detectar duplicación"""
         try:
-            # Usar propiedades del audio para generar hash
-            audio_data = {
-                'duration': len(audio),
-                'channels': audio.channels,
-                'frame_rate': audio.frame_rate,
-                'max_dBFS': round(audio.max_dBFS, 2) if audio.max_dBFS > -60 else -60,
-                'dBFS': round(audio.dBFS, 2) if audio.dBFS > -60 else -60,
-            }
-            
-            # También usar una muestra del audio para mayor precisión
-            if len(audio) > 100:
-                # Tomar muestra del medio del audio
-                sample_start = len(audio) // 2 - 50
-                sample_end = len(audio) // 2 + 50
-                sample = audio[sample_start:sample_end]
-                
-                # Añadir propiedades de la muestra
-                audio_data.update({
-                    'sample_max_dBFS': round(sample.max_dBFS, 2) if sample.max_dBFS > -60 else -60,
-                    'sample_dBFS': round(sample.dBFS, 2) if sample.dBFS > -60 else -60,
-                })
-            
-            # Generar hash
-            data_string = json.dumps(audio_data, sort_keys=True)
-            return hashlib.md5(data_string.encode()).hexdigest()[:16]
+            # Hash del contenido: unas 4096 muestras repartidas por todo el audio más su formato
+            samples = _raw_np(audio)
+            step = max(1, samples.size // _HASH_SAMPLES)
+            h = hashlib.md5(samples[::step].tobytes())
+            h.update(_hash_format(audio))
+            return h.hexdigest()[:16]
             
         except Exception as e:
             logger.debug(f"Could not calculate audio hash: {e}")
             # Fallback a hash simple
-            return hashlib.md5(f"{len(audio)}_{audio.channels}_{audio.frame_rate}".encode()).hexdigest()[:16]
+            return hashlib.md5(_hash_format(audio)).hexdigest()[:16]
+    
+    def _segment_stats(self, audio: AudioSegment) -> Dict[str, Any]:
+        """Niveles del segmento medidos una sola vez sobre sus muestras y reutilizados después
+
+        Incluye el nivel total, el pico y el de los primeros/últimos 100 ms (silencio en
+        los bordes) y 150 ms (análisis de transiciones), cada uno como audio.dBFS del corte.
+        """
+        cached = self.processed_chunks.get(id(audio))
+        if cached is not None and cached[0] is audio:
+            return cached[1]
+        
+        samples = _raw_np(audio)
+        duration = len(audio)
+        channels = audio.channels
+        max_amplitude = audio.max_possible_amplitude
+        
+        def section_dbfs(section_ms: int, at_start: bool) -> float:
+            if at_start:
+                start, end = 0, section_ms
+            else:
+                # audio[-0:] es el audio completo
+                start, end = (duration - section_ms if section_ms else 0), duration
+            first, last = _ms_to_frame(audio, start) * channels, _ms_to_frame(audio, end) * channels
+            section = samples[first:last]
+            if section.size < last - first:
+                # pydub rellena con silencio el final de un corte que pasa del último frame
+                section = np.concatenate([section, np.zeros(last - first - section.size, section.dtype)])
+            return _levels_dbfs(section, max_amplitude)[0]
+        
+        dbfs, max_dbfs = _levels_dbfs(samples, max_amplitude)
+        boundary = min(100, duration // 4)
+        edge = min(150, duration // 4)
+        stats = {
+            'samples': samples,
+            'dBFS': dbfs,
+            'max_dBFS': max_dbfs,
+            'head100_dBFS': section_dbfs(boundary, at_start=True),
+            'tail100_dBFS': section_dbfs(boundary, at_start=False),
+            'head150_dBFS': section_dbfs(edge, at_start=True),
+            'tail150_dBFS': section_dbfs(edge, at_start=False),
+        }
+        self.processed_chunks[id(audio)] = (audio, stats)
+        return stats
     
     def _analyze_chunk_properties(self, audio: AudioSegment) -> Dict[str, Any]:
         """Analiza propiedades del chunk para tomar decisiones inteligentes"""
         try:
+            stats = self._segment_stats(audio)
             properties = {
-                'volume_level': self._categorize_volume_level(audio.dBFS),
-                'dynamic_range': audio.max_dBFS - audio.dBFS if audio.dBFS > -60 else 0,
+                'volume_level': self._categorize_volume_level(stats['dBFS']),
+                'dynamic_range': stats['max_dBFS'] - stats['dBFS'] if stats['dBFS'] > -60 else 0,
                 'has_leading_silence': self._has_boundary_silence(audio, at_start=True),
                 'has_trailing_silence': self._has_boundary_silence(audio, at_start=False),
                 'content_type': self._classify_content_type(audio)
             }
+            properties['bucket'] = self._bucket(properties, self._is_silence(audio))
             
             return properties
             
@@ -198,28 +447,23 @@ class IntelligentAudioCombiner:
                 'content_type': 'speech'
             }
     
+    @staticmethod
+    def _bucket(properties: Dict[str, Any], is_silence: bool) -> Tuple:
+        """Clase del chunk según las propiedades de las que dependen las pausas y el score entre chunks"""
+        return (properties['volume_level'], properties['content_type'],
+                properties['has_leading_silence'], properties['has_trailing_silence'], is_silence)
+    
     def _categorize_volume_level(self, dBFS: float) -> str:
         """Categoriza el nivel de volumen"""
-        if dBFS > -15:
-            return 'loud'
-        elif dBFS > -25:
-            return 'medium'
-        elif dBFS > -40:
-            return 'quiet'
-        else:
-            return 'very_quiet'
+        return _VOLUME_LABELS[bisect.bisect_left(_VOLUME_THRESHOLDS, dBFS)]
     
     def _has_boundary_silence(self, audio: AudioSegment, at_start: bool) -> bool:
         """Detecta si hay silencio significativo al inicio o final"""
         try:
-            check_duration = min(100, len(audio) // 4)  # Revisar hasta 100ms
-            
-            if at_start:
-                check_section = audio[:check_duration]
-            else:
-                check_section = audio[-check_duration:]
-            
-            return check_section.dBFS < -45.0  # Umbral de silencio
+            # Revisar hasta 100ms
+            stats = self._segment_stats(audio)
+            section_dbfs = stats['head100_dBFS'] if at_start else stats['tail100_dBFS']
+            return section_dbfs < -45.0  # Umbral de silencio
             
         except Exception:
             return False
@@ -228,23 +472,16 @@ class IntelligentAudioCombiner:
         """Clasifica el tipo de contenido del audio"""
         try:
             # Análisis simple basado en características
-            dynamic_range = audio.max_dBFS - audio.dBFS
-            
-            if dynamic_range > 20:
-                return 'dynamic_speech'  # Habla con mucha variación
-            elif dynamic_range > 10:
-                return 'normal_speech'   # Habla normal
-            elif dynamic_range > 5:
-                return 'monotone_speech' # Habla monótona
-            else:
-                return 'near_silence'    # Casi silencio
+            stats = self._segment_stats(audio)
+            dynamic_range = stats['max_dBFS'] - stats['dBFS']
+            return _CONTENT_LABELS[bisect.bisect_left(_CONTENT_THRESHOLDS, dynamic_range)]
                 
         except Exception:
             return 'speech'
     
     def _is_silence(self, audio: AudioSegment) -> bool:
         """Detecta si un segmento es principalmente silencio"""
-        return audio.dBFS < -50.0 or len(audio) < 50
+        return self._segment_stats(audio)['dBFS'] < -50.0 or len(audio) < 50
     
     def _analyze_all_transitions(self, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Analiza todas las transiciones entre segmentos consecutivos"""
@@ -254,14 +491,15 @@ class IntelligentAudioCombiner:
             current_segment = segments[i]
             next_segment = segments[i + 1]
             
-            # Crear clave para cache
-            cache_key = f"{current_segment.get('hash', i)}_{next_segment.get('hash', i+1)}"
+            # Solo se cachea con el hash de ambos chunks: un índice no identifica el audio entre llamadas
+            cache_key = (current_segment.get('hash'), next_segment.get('hash'))
             
             if cache_key in self.transition_cache:
                 transition = self.transition_cache[cache_key]
             else:
                 transition = self._analyze_single_transition(current_segment, next_segment)
-                self.transition_cache[cache_key] = transition
+                if None not in cache_key:
+                    self.transition_cache[cache_key] = transition
             
             transitions.append(transition)
         
@@ -270,50 +508,66 @@ class IntelligentAudioCombiner:
     def _analyze_single_transition(self, segment1: Dict[str, Any], 
                                  segment2: Dict[str, Any]) -> Dict[str, Any]:
         """Analiza una transición específica entre dos segmentos"""
-        audio1 = segment1['audio']
-        audio2 = segment2['audio']
+        # Con silencio a un lado (o sin análisis de transiciones) los segmentos se concatenan sin más
+        if segment1['is_silence'] or segment2['is_silence'] or not self.config.get('transition_analysis', True):
+            return dict(self._SILENCE_TRANSITION)
         
-        # Analizar final del primer segmento
-        end_section_duration = min(150, len(audio1) // 4)
-        end_section = audio1[-end_section_duration:] if len(audio1) > end_section_duration else audio1
-        
-        # Analizar inicio del segundo segmento
-        start_section_duration = min(150, len(audio2) // 4)
-        start_section = audio2[:start_section_duration] if len(audio2) > start_section_duration else audio2
+        # Niveles del final del primer segmento y del inicio del segundo (hasta 150 ms)
+        end_section_dbfs = self._segment_stats(segment1['audio'])['tail150_dBFS']
+        start_section_dbfs = self._segment_stats(segment2['audio'])['head150_dBFS']
         
         # Análisis de compatibilidad
-        volume_difference = abs(end_section.dBFS - start_section.dBFS)
+        volume_difference = abs(end_section_dbfs - start_section_dbfs)
         
         # Determinar tipo de transición
-        if segment1['is_silence'] or segment2['is_silence']:
-            transition_type = 'silence'
-        elif volume_difference < 3:
-            transition_type = 'smooth'
-        elif volume_difference < 8:
-            transition_type = 'moderate'
-        else:
-            transition_type = 'sharp'
+        transition_type = _TRANSITION_TYPES[bisect.bisect_right(_TRANSITION_THRESHOLDS, volume_difference)]
         
         # Calcular crossfade óptimo
         crossfade_duration = self._calculate_optimal_crossfade(
             segment1, segment2, transition_type, volume_difference
         )
         
-        # Determinar si necesita pausa adicional
-        needs_pause = self._needs_additional_pause(segment1, segment2)
-        pause_duration = self._calculate_pause_duration(segment1, segment2) if needs_pause else 0
+        # Buscar el empalme dentro de la zona que el crossfade mezcla de todos modos
+        splice_offsets = (0, 0)
+        if crossfade_duration > 0:
+            splice_offsets = self._find_splice(segment1['audio'], segment2['audio'], crossfade_duration)
+        
+        # Pausa adicional y ajuste del score: dependen solo del bucket de cada segmento,
+        # así que se deciden una vez por par de buckets
+        buckets = (segment1.get('bucket'), segment2.get('bucket'))
+        bucket_plan = self._bucket_plans.get(buckets)
+        if bucket_plan is None:
+            needs_pause = self._needs_additional_pause(segment1, segment2)
+            bucket_plan = (needs_pause,
+                           self._calculate_pause_duration(segment1, segment2) if needs_pause else 0,
+                           self._compatibility_adjustment(segment1, segment2))
+            if None not in buckets:
+                self._bucket_plans[buckets] = bucket_plan
+        needs_pause, pause_duration, score_adjustment = bucket_plan
         
         return {
             'type': transition_type,
             'volume_difference': volume_difference,
             'crossfade_duration': crossfade_duration,
+            'splice_offsets': splice_offsets,
             'needs_pause': needs_pause,
             'pause_duration': pause_duration,
-            'compatibility_score': self._calculate_compatibility_score(
-                volume_difference, segment1, segment2
-            )
+            'compatibility_score': self._calculate_compatibility_score(volume_difference, score_adjustment)
         }
     
+    def _find_splice(self, audio1: AudioSegment, audio2: AudioSegment, duration: int) -> Tuple[int, int]:
+        """Empalme (ms recortados al final de audio1, ms saltados al inicio de audio2) en los últimos/primeros `duration` ms"""
+        if (audio1.frame_rate, audio1.channels) != (audio2.frame_rate, audio2.channels):
+            return 0, 0
+        channels = audio1.channels
+        frames = _ms_to_frame(audio1, duration) * channels
+        samples1 = self._segment_stats(audio1)['samples']
+        samples2 = self._segment_stats(audio2)['samples']
+        tail = samples1[max(len(samples1) - frames, 0):].reshape(-1, channels).mean(axis=1)
+        head = samples2[:frames].reshape(-1, channels).mean(axis=1)
+        return _best_splice(tail, head, audio1.frame_rate,
+                            audio1.max_possible_amplitude * 10 ** (_SPLICE_SILENCE_DBFS / 20))
+    
     def _calculate_optimal_crossfade(self, segment1: Dict[str, Any], segment2: Dict[str, Any],
                                    transition_type: str, volume_difference: float) -> int:
         """Calcula la duración óptima de crossfade"""
@@ -329,7 +583,7 @@ class IntelligentAudioCombiner:
         adjusted_duration = int(base_duration * volume_factor)
         
         # Limitar según duración de los segmentos
-        min_segment_duration = min(len(segment1['audio']), len(segment2['audio']))
+        min_segment_duration = min(segment1['duration'], segment2['duration'])
         max_allowed = min_segment_duration // 4  # Máximo 25% del segmento más corto
         
         return max(0, min(adjusted_duration, max_allowed))
@@ -361,22 +615,24 @@ class IntelligentAudioCombiner:
         else:
             return base_pause
     
-    def _calculate_compatibility_score(self, volume_difference: float, 
-                                     segment1: Dict[str, Any], segment2: Dict[str, Any]) -> float:
-        """Calcula un score de compatibilidad entre segmentos (0.0 a 1.0)"""
-        score = 1.0
-        
-        # Penalizar diferencias de volumen
-        score -= min(0.4, volume_difference / 20.0)
+    def _compatibility_adjustment(self, segment1: Dict[str, Any], segment2: Dict[str, Any]) -> float:
+        """Parte del score de compatibilidad que depende del tipo de los segmentos y no del volumen"""
+        adjustment = 0.0
         
         # Penalizar cambios de tipo de contenido
         if segment1['content_type'] != segment2['content_type']:
-            score -= 0.1
+            adjustment -= 0.1
         
         # Bonus por silencios naturales
         if segment1['has_trailing_silence'] or segment2['has_leading_silence']:
-            score += 0.1
+            adjustment += 0.1
         
+        return adjustment
+    
+    def _calculate_compatibility_score(self, volume_difference: float, adjustment: float) -> float:
+        """Calcula un score de compatibilidad entre segmentos (0.0 a 1.0)"""
+        # Penalizar diferencias de volumen
+        score = 1.0 - min(0.4, volume_difference / 20.0) + adjustment
         return max(0.0, min(1.0, score))
     
     def _intelligent_combine(self, segments: List[Dict[str, Any]], 
@@ -387,6 +643,19 @@ class IntelligentAudioCombiner:
         
         result = segments[0]['audio']
         
+        # Los crossfades solo tocan el final del resultado, así que se trabaja sobre una ventana
+        # y lo anterior se aparta en `committed` (se une una sola vez al final) en vez de copiar
+        # todo el resultado en cada suma. Se recorta en múltiplos exactos de ms para que los cortes
+        # de pydub caigan en los mismos frames. combine_audio_segments ya unificó los formatos; si aun así
+        # llegan mezclados (o más pobres que el silencio de pydub) cada suma re-sincroniza todo el
+        # resultado y no se recorta.
+        formats = {(s['audio'].frame_rate, s['audio'].channels, s['audio'].sample_width) for s in segments}
+        can_trim = len(formats) == 1 and result.frame_rate >= 11025 and result.sample_width >= 2
+        trim_step = result.frame_rate // math.gcd(result.frame_rate, 1000)
+        reach = max((2 * t['crossfade_duration'] + t.get('splice_offsets', (0, 0))[0] for t in transitions), default=0)
+        keep_frames = _ms_to_frame(result, reach + 10)
+        committed = []
+        
         for i, transition in enumerate(transitions):
             next_segment = segments[i + 1]['audio']
             
@@ -407,7 +676,17 @@ class IntelligentAudioCombiner:
             logger.debug(f"Applied {transition['type']} transition "
                         f"(crossfade: {transition['crossfade_duration']}ms, "
                         f"pause: {transition['pause_duration']}ms)")
-        
+            
+            if can_trim:
+                excess = (int(result.frame_count()) - keep_frames) // trim_step * trim_step
+                if excess > 0:
+                    cut = excess * result.frame_width
+                    committed.append(result.raw_data[:cut])
+                    result = result._spawn(result.raw_data[cut:])
+        
+        if committed:
+            committed.append(result.raw_data)
+            result = result._spawn(committed)
         return result
     
     def _apply_intelligent_crossfade(self, audio1: AudioSegment, audio2: AudioSegment,
@@ -417,6 +696,12 @@ class IntelligentAudioCombiner:
         transition_type = transition['type']
         
         try:
+            trim_end, trim_start = transition.get('splice_offsets', (0, 0))
+            if trim_end:
+                audio1 = audio1[:-trim_end]
+            if trim_start:
+                audio2 = audio2[trim_start:]
+            
             if (crossfade_duration <= 0 or 
                 len(audio1) < crossfade_duration or 
                 len(audio2) < crossfade_duration):
@@ -424,7 +709,7 @@ class IntelligentAudioCombiner:
             
             if transition_type == 'smooth':
                 # Crossfade lineal para transiciones suaves
-                return audio1.append(audio2, crossfade=crossfade_duration)
+                return self._curved_crossfade(audio1, audio2, crossfade_duration, equal_power=False)
             
             elif transition_type == 'moderate':
                 # Crossfade con curva suave
@@ -442,22 +727,26 @@ class IntelligentAudioCombiner:
             logger.warning(f"Crossfade failed: {e}, using simple concatenation")
             return audio1 + audio2
     
-    def _curved_crossfade(self, audio1: AudioSegment, audio2: AudioSegment, duration: int) -> AudioSegment:
-        """Crossfade con curva de atenuación suave"""
+    def _curved_crossfade(self, audio1: AudioSegment, audio2: AudioSegment, duration: int,
+                          equal_power: bool = True) -> AudioSegment:
+        """Crossfade con curva de atenuación suave (de igual potencia, o lineal con equal_power=False)"""
         try:
-            # Preparar secciones para crossfade
-            fade_out_section = audio1[-duration:]
-            fade_in_section = audio2[:duration]
-            
-            # Aplicar fades con curva exponencial
-            fade_out_section = fade_out_section.fade_out(duration)
-            fade_in_section = fade_in_section.fade_in(duration)
+            audio1, audio2 = AudioSegment._sync(audio1, audio2)
+            samples1, samples2 = _raw_np(audio1), _raw_np(audio2)
+            channels = audio1.channels
+            frames = min(_ms_to_frame(audio1, duration), len(samples1) // channels, len(samples2) // channels)
+            split1, split2 = len(samples1) - frames * channels, frames * channels
             
-            # Combinar con overlay balanceado
-            combined_section = fade_out_section.overlay(fade_in_section)
+            # Un solo búfer de salida en lugar de fades, overlay y tres concatenaciones de pydub
+            out = np.empty(split1 + len(samples2), dtype=samples1.dtype)
+            out[:split1] = samples1[:split1]
+            out[split1 + split2:] = samples2[split2:]
             
-            # Reconstruir audio completo
-            return audio1[:-duration] + combined_section + audio2[duration:]
+            # Curvas de igual potencia (cos/sin): el volumen percibido se mantiene durante el cruce
+            fade_out, fade_in = _fade_curves(frames, equal_power)
+            _crossfade_mixer()(samples1[split1:].reshape(-1, channels), samples2[:split2].reshape(-1, channels),
+                               fade_out, fade_in, out[split1:split1 + split2].reshape(-1, channels))
+            return audio1._spawn(out.tobytes())
             
         except Exception:
             return audio1.append(audio2, crossfade=duration)
@@ -472,18 +761,16 @@ class IntelligentAudioCombiner:
             # Aplicar compresión suave en las zonas de transición
             if len(transition_zone1) > 0:
                 try:
-                    transition_zone1 = transition_zone1.compress_dynamic_range(
-                        threshold=-20.0, ratio=2.0, attack=5.0, release=50.0
-                    )
+                    transition_zone1 = _compress(transition_zone1, threshold=-20.0, ratio=2.0,
+                                                 attack=5.0, release=50.0)
                     audio1 = audio1[:-duration * 2] + transition_zone1 + audio1[-duration:]
                 except:
                     pass  # Si falla la compresión, usar audio original
             
             if len(transition_zone2) > 0:
                 try:
-                    transition_zone2 = transition_zone2.compress_dynamic_range(
-                        threshold=-20.0, ratio=2.0, attack=5.0, release=50.0
-                    )
+                    transition_zone2 = _compress(transition_zone2, threshold=-20.0, ratio=2.0,
+                                                 attack=5.0, release=50.0)
                     audio2 = audio2[:duration] + transition_zone2 + audio2[duration * 2:]
                 except:
                     pass
@@ -495,12 +782,57 @@ class IntelligentAudioCombiner:
             return audio1.append(audio2, crossfade=duration)
     
     def _final_post_processing(self, audio: AudioSegment) -> AudioSegment:
-        """Post-procesamiento final del audio combinado"""
+        """Post-procesamiento final del audio combinado
+
+        Ganancia, limiter y fades se reúnen en una envolvente y se aplican en una sola pasada;
+        los anchos de muestra sin dtype de numpy (24 bits) siguen el camino de pydub.
+        """
+        if audio.sample_width not in _SAMPLE_DTYPES:
+            return self._final_post_processing_segment(audio)
+        try:
+            samples = _raw_np(audio)
+            channels, max_amplitude = audio.channels, audio.max_possible_amplitude
+            dBFS, max_dBFS = _levels_dbfs(samples, max_amplitude)
+            
+            # 1. Normalización final muy suave: solo con contenido real y sin cambios drásticos
+            gain_db = 0.0
+            if dBFS > -50 and abs(-18.0 - dBFS) <= 6.0:
+                gain_db = -18.0 - dBFS
+            envelope = 10 ** (gain_db / 20)
+            
+            # 2. Limiter final suave, medido sobre el audio ya normalizado
+            if max_dBFS + gain_db > -3.0:
+                limiter = _compressor_gain(samples, channels, audio.frame_rate, max_amplitude / envelope,
+                                           threshold=-10.0, ratio=3.0, attack=1.0, release=20.0)
+                if limiter is not None:
+                    envelope = envelope * limiter
+            
+            # 3. Fades muy sutiles en los extremos
+            duration = len(audio)
+            if duration > 100:
+                envelope = np.broadcast_to(envelope, samples.shape).copy()
+                fade = min(_ms_to_frame(audio, 20), len(samples) // channels) * channels
+                ramp = np.repeat(np.linspace(0.0, 1.0, fade // channels, endpoint=False), channels)
+                envelope[:fade] *= ramp
+                envelope[len(samples) - fade:] *= ramp[::-1]
+            
+            if not np.isscalar(envelope) or envelope != 1.0:
+                audio = audio._spawn(_scale_samples(samples, envelope).tobytes())
+            
+            logger.debug(f"Final post-processing completed (duration: {duration}ms)")
+            return audio
+            
+        except Exception as e:
+            logger.warning(f"Final post-processing failed: {e}")
+            return audio
+    
+    def _final_post_processing_segment(self, audio: AudioSegment) -> AudioSegment:
+        """Post-procesamiento final con operaciones de pydub"""
         try:
             # 1. Normalización final muy suave
-            if audio.dBFS > -50:  # Solo si hay contenido real
+            current_dBFS = audio.dBFS
+            if current_dBFS > -50:  # Solo si hay contenido real
                 target_dBFS = -18.0
-                current_dBFS = audio.dBFS
                 gain_change = target_dBFS - current_dBFS
                 
                 # Limitar cambios drásticos
@@ -508,7 +840,8 @@ class IntelligentAudioCombiner:
                     audio = audio.apply_gain(gain_change)
             
             # 2. Limiter final suave para evitar clipping
-            if audio.max_dBFS > -3.0:
+            peak_dBFS = audio.max_dBFS
+            if peak_dBFS > -3.0:
                 try:
                     audio = audio.compress_dynamic_range(
                         threshold=-10.0,
@@ -518,15 +851,15 @@ class IntelligentAudioCombiner:
                     )
                 except:
                     # Si falla la compresión, aplicar gain simple
-                    if audio.max_dBFS > -1.0:
-                        reduction = -1.0 - audio.max_dBFS
-                        audio = audio.apply_gain(reduction)
+                    if peak_dBFS > -1.0:
+                        audio = audio.apply_gain(-1.0 - peak_dBFS)
             
             # 3. Fades muy sutiles en los extremos
-            if len(audio) > 100:
+            duration = len(audio)
+            if duration > 100:
                 audio = audio.fade_in(20).fade_out(20)
             
-            logger.debug(f"Final post-processing completed (duration: {len(audio)}ms)")
+            logger.debug(f"Final post-processing completed (duration: {duration}ms)")
             return audio
             
         except Exception as e:
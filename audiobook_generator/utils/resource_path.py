@@ -1,6 +1,12 @@
 import sys
 from pathlib import Path
 
+# Resolved once at import: sys._MEIPASS and this file's location never change during a run
+if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
+    _BASE_PATH = Path(sys._MEIPASS)
+else:
+    _BASE_PATH = Path(__file__).resolve().parents[2]
+
 
 def resource_path(relative_path: str) -> Path:
     """Get absolute path to resource, works for dev and for PyInstaller bundles.
@@ -8,9 +14,4 @@ def resource_path(relative_path: str) -> Path:
     - In dev: relative to project root (two parents up from this file)
     - In frozen: from sys._MEIPASS base directory
     """
-    base_path = None
-    if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
-        base_path = Path(sys._MEIPASS)
-    else:
-        base_path = Path(__file__).resolve().parents[2]
-    return base_path / relative_path
+    return _BASE_PATH / relative_path
@@ -4,7 +4,11 @@ Este módulo resuelve automáticamente problemas de certificados SSL
 que ocurren en PC nuevos al descargar modelos de Hugging Face.
 """
 
+import functools
+import inspect
 import os
+import random
+import re
 import ssl
 import warnings
 import logging
@@ -12,13 +16,250 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Palabras que delatan un error SSL/certificado, en un solo patrón que recorre el mensaje una vez
+_SSL_ERROR_PATTERN = re.compile(
+    '|'.join(map(re.escape, [
+        'ssl', 'certificate', 'handshake', 'tls',
+        'cert', 'connection reset', 'connection aborted',
+        'max retries exceeded', 'certificate verify failed'
+    ])),
+    re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _jitter_retry_class():
+    """urllib3 Retry with exponential backoff plus random jitter.
+
+    The stock backoff sleeps the same fixed intervals everywhere, so clients
+    failing together (e.g. on a Hugging Face 503) also retry together. Each
+    retry here waits 0.5 * 2**(n - 1) s plus up to 0.5 s of jitter, capped at
+    the Retry's backoff maximum. Defined on first use because urllib3 is optional.
+    """
+    from urllib3.util.retry import Retry
+
+    class JitterRetry(Retry):
+        def get_backoff_time(self):
+            retries = len(self.history)
+            if retries == 0:
+                return 0
+            backoff = min(getattr(self, 'backoff_max', 120),
+                          0.5 * 2 ** (retries - 1) + random.uniform(0, 0.5))
+            logger.debug(f"Retry {retries}: backing off {backoff:.2f}s")
+            return backoff
+
+    return JitterRetry
+
+
+@functools.lru_cache(maxsize=1)
+def _retry_method_kwargs():
+    """Retry kwarg naming the retried methods for the installed urllib3.
+
+    urllib3 2.x only knows allowed_methods and versions before 1.26 only
+    method_whitelist. Picked once from the version, falling back to the
+    constructor signature when the version is unparseable or pre-2.0.
+    """
+    import urllib3
+    from urllib3.util.retry import Retry
+
+    methods = frozenset(["HEAD", "GET", "OPTIONS"])
+    try:
+        if int(urllib3.__version__.split(".")[0]) >= 2:
+            return {'allowed_methods': methods}
+    except (AttributeError, ValueError):
+        pass
+    parameters = inspect.signature(Retry.__init__).parameters
+    for name in ('allowed_methods', 'method_whitelist'):
+        if name in parameters:
+            return {name: methods}
+    return {}
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_tls_adapter_class():
+    """HTTPAdapter whose connection pools all share one SSLContext.
+
+    Without an ssl_context urllib3 builds a new context and loads the system CA
+    store for every connection it opens; sharing one context does that once and
+    keeps TLS session tickets enabled on a single context. Defined on first use
+    because requests is optional.
+    """
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.ssl_ import create_urllib3_context
+
+    class SharedTLSAdapter(HTTPAdapter):
+        def __init__(self, *args, **kwargs):
+            # HTTPAdapter.__init__ calls init_poolmanager, so the context must exist first
+            self.ssl_context = create_urllib3_context()
+            # urllib3 sets verify_mode per request (CERT_NONE with verify=False), which
+            # requires check_hostname off; it matches hostnames itself when verifying
+            self.ssl_context.check_hostname = False
+            self.ssl_context.load_default_certs()
+            super().__init__(*args, **kwargs)
+
+        def init_poolmanager(self, *args, **kwargs):
+            kwargs['ssl_context'] = self.ssl_context
+            super().init_poolmanager(*args, **kwargs)
+
+    return SharedTLSAdapter
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_adapter():
+    """Adaptador con reintentos y pool amplio, compartido por todas las sessions del proceso
+
+    Un HTTPAdapter (su PoolManager) se puede usar desde varios hilos; lo que no es
+    seguro entre hilos es la Session. None si requests no está disponible.
+    """
+    try:
+        # Configurar retry strategy (allowed_methods o method_whitelist según la versión de urllib3)
+        # Backoff exponencial con jitter para no reintentar todos a la vez
+        retry_strategy = _jitter_retry_class()(
+            total=5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            **_retry_method_kwargs()
+        )
+        
+        # Pool amplio: las descargas de modelos piden varios archivos en paralelo y con el
+        # tamaño por defecto (10) las conexiones sobrantes se cierran y se vuelven a abrir
+        return _shared_tls_adapter_class()(pool_connections=32, pool_maxsize=32, pool_block=False,
+                                           max_retries=retry_strategy)
+        
+    except ImportError:
+        # requests no disponible
+        return None
+    except Exception as e:
+        logger.debug(f"Error configurando requests: {e}")
+        return None
+
+
+def _new_session():
+    """requests.Session nueva sin verificación SSL, montada sobre el adaptador compartido
+
+    No se cachea: cada llamada devuelve una Session propia (p. ej. una por hilo) que
+    reutiliza el pool, los reintentos y el contexto TLS comunes. None si requests no
+    está disponible.
+    """
+    adapter = _shared_adapter()
+    if adapter is None:
+        return None
+    import requests
+    
+    # SSL deshabilitado
+    session = requests.Session()
+    session.verify = False
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    
+    # Headers estándar
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    })
+    return session
+
+
+@functools.lru_cache(maxsize=1)
+def _build_session():
+    """requests.Session sin verificación SSL y con reintentos, compartida por todo el proceso
+
+    Se construye la primera vez que se pide (ssl_manager.session): así importar este
+    módulo no carga requests ni urllib3. None si requests no está disponible.
+    """
+    return _new_session()
+
+
+@functools.lru_cache(maxsize=1)
+def share_session_with_hf_hub() -> bool:
+    """Hacer que huggingface_hub descargue con el adaptador compartido de este módulo
+
+    huggingface_hub llama a la factory en cada hilo, así que cada llamada crea su propia
+    Session (una Session no es segura entre hilos), pero todas usan el mismo pool,
+    reintentos y contexto TLS. Solo se registra una vez. False si huggingface_hub no
+    está instalado o es una versión sin configure_http_backend (>= 1.0 usa httpx).
+    """
+    try:
+        from huggingface_hub import configure_http_backend
+    except ImportError:
+        return False
+    if _shared_adapter() is None:
+        return False
+    configure_http_backend(backend_factory=_new_session)
+    return True
+
+
+# Avisos (UserWarning) que se silencian, como regex de warnings.filterwarnings; se registra una sola vez
+_SSL_WARNING_MESSAGES = r'.*(?:SSL|certificate|unverified)'
+_INSECURE_REQUEST_MESSAGE = 'Unverified HTTPS request'
+_ssl_warnings_suppressed = False
+
+# Variables de entorno que fija setup_ssl_environment
+_SSL_ENV_VARS = (
+    ('PYTHONHTTPSVERIFY', '0'),
+    ('CURL_CA_BUNDLE', ''),
+    ('REQUESTS_CA_BUNDLE', ''),
+    ('SSL_VERIFY', 'false'),
+    ('HF_HUB_DISABLE_TELEMETRY', '1'),
+    ('HF_HUB_DISABLE_PROGRESS_BARS', '1'),
+    ('TRANSFORMERS_VERBOSITY', 'error'),
+    ('TF_CPP_MIN_LOG_LEVEL', '2'),
+    ('TOKENIZERS_PARALLELISM', 'false'),
+    # Variables para licencia Coqui automática
+    ('COQUI_TOS', 'AGREED'),
+    ('TTS_AGREE_LICENSE', 'yes'),
+    ('COQUI_AGREE_LICENSE', '1'),
+)
+
+
+# Guía mostrada ante un error SSL; un solo registro de log con el error técnico al final
+_TROUBLESHOOTING_BANNER = "\n".join([
+    "🚨 ERROR DE CERTIFICADO SSL DETECTADO 🚨",
+    "=" * 60,
+    "Este error es común en PC nuevos o redes corporativas.",
+    "",
+    "SOLUCIONES AUTOMÁTICAS APLICADAS:",
+    "✅ Configuración SSL permisiva activada",
+    "✅ Variables de entorno SSL configuradas",
+    "✅ Warnings SSL suprimidos",
+    "",
+    "SI EL PROBLEMA PERSISTE:",
+    "",
+    "1. 🌐 VERIFICAR INTERNET:",
+    "   - Prueba abrir https://huggingface.co en el navegador",
+    "",
+    "2. 🔥 FIREWALL/ANTIVIRUS:",
+    "   - Deshabilitar temporalmente",
+    "   - Agregar excepción para Python",
+    "",
+    "3. 🏢 RED CORPORATIVA:",
+    "   - Configurar proxy si es necesario",
+    "   - Contactar IT para acceso a huggingface.co",
+    "",
+    "4. 📱 HOTSPOT MÓVIL (último recurso):",
+    "   - Usar datos móviles para la primera descarga",
+    "",
+    "5. 🔄 REINSTALAR CERTIFICADOS:",
+    "   - Ejecutar: scripts/install_coqui_ssl_fix.ps1",
+    "",
+    "Error técnico: %s",
+    "=" * 60,
+])
+
+
 class SSLConfigManager:
     """Gestor de configuración SSL para evitar errores de certificado"""
     
+    __slots__ = ('original_ssl_context', 'ssl_configured')
+    
     def __init__(self):
         self.original_ssl_context = None
         self.ssl_configured = False
     
+    @property
+    def session(self):
+        """requests.Session sin verificación SSL para reutilizar en descargas (se crea al pedirla)"""
+        return _build_session()
+    
     def setup_ssl_environment(self) -> bool:
         """
         Configura el entorno SSL para evitar errores de certificado.
@@ -26,26 +267,15 @@ class SSLConfigManager:
         Returns:
             bool: True si la configuración fue exitosa
         """
+        # Ya configurado (p. ej. al importar el módulo): no repetir el trabajo
+        if self.ssl_configured:
+            return True
+        
         try:
-            # 1. Configurar variables de entorno SSL/TLS
-            ssl_env_vars = {
-                'PYTHONHTTPSVERIFY': '0',
-                'CURL_CA_BUNDLE': '',
-                'REQUESTS_CA_BUNDLE': '',
-                'SSL_VERIFY': 'false',
-                'HF_HUB_DISABLE_TELEMETRY': '1',
-                'HF_HUB_DISABLE_PROGRESS_BARS': '1',
-                'TRANSFORMERS_VERBOSITY': 'error',
-                'TF_CPP_MIN_LOG_LEVEL': '2',
-                'TOKENIZERS_PARALLELISM': 'false',
-                # Variables para licencia Coqui automática
-                'COQUI_TOS': 'AGREED',
-                'TTS_AGREE_LICENSE': 'yes',
-                'COQUI_AGREE_LICENSE': '1'
-            }
-            
-            for key, value in ssl_env_vars.items():
-                os.environ[key] = value
+            # 1. Configurar variables de entorno SSL/TLS (solo las que no tienen ya su valor)
+            for key, value in _SSL_ENV_VARS:
+                if os.environ.get(key) != value:
+                    os.environ[key] = value
             
             # 2. Configurar SSL context global
             if not self.original_ssl_context:
@@ -56,9 +286,6 @@ class SSLConfigManager:
             # 3. Configurar warnings
             self._suppress_ssl_warnings()
             
-            # 4. Configurar requests si está disponible
-            self._configure_requests()
-            
             self.ssl_configured = True
             logger.info("🔧 Configuración SSL aplicada correctamente")
             return True
@@ -69,74 +296,15 @@ class SSLConfigManager:
     
     def _suppress_ssl_warnings(self):
         """Suprimir warnings relacionados con SSL"""
-        try:
-            import urllib3
-            from urllib3.exceptions import InsecureRequestWarning
-            
-            urllib3.disable_warnings(InsecureRequestWarning)
-            
-            # Suprimir warnings específicos
-            warnings.filterwarnings('ignore', category=urllib3.exceptions.InsecureRequestWarning)
-            warnings.filterwarnings('ignore', message='.*SSL.*', category=UserWarning)
-            warnings.filterwarnings('ignore', message='.*certificate.*', category=UserWarning)
-            warnings.filterwarnings('ignore', message='.*unverified.*', category=UserWarning)
-            
-        except ImportError:
-            # urllib3 no disponible
-            pass
-    
-    def _configure_requests(self):
-        """Configurar requests para ignorar verificación SSL"""
-        try:
-            import requests
-            from requests.adapters import HTTPAdapter
-            from urllib3.util.retry import Retry
-            import urllib3
-            
-            # Crear session global con SSL deshabilitado
-            session = requests.Session()
-            session.verify = False
-            
-            # Configurar retry strategy (adaptado para nuevas versiones de urllib3)
-            try:
-                # Nuevo formato para urllib3 2.0+
-                retry_strategy = Retry(
-                    total=3,
-                    status_forcelist=[429, 500, 502, 503, 504],
-                    allowed_methods=["HEAD", "GET", "OPTIONS"],  # Nuevo parámetro
-                    backoff_factor=1
-                )
-            except TypeError:
-                try:
-                    # Formato anterior para urllib3 1.x
-                    retry_strategy = Retry(
-                        total=3,
-                        status_forcelist=[429, 500, 502, 503, 504],
-                        method_whitelist=["HEAD", "GET", "OPTIONS"],  # Formato anterior
-                        backoff_factor=1
-                    )
-                except TypeError:
-                    # Fallback sin métodos específicos
-                    retry_strategy = Retry(
-                        total=3,
-                        status_forcelist=[429, 500, 502, 503, 504],
-                        backoff_factor=1
-                    )
-            
-            adapter = HTTPAdapter(max_retries=retry_strategy)
-            session.mount("http://", adapter)
-            session.mount("https://", adapter)
-            
-            # Headers estándar
-            session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
-            
-        except ImportError:
-            # requests no disponible
-            pass
-        except Exception as e:
-            logger.debug(f"Error configurando requests: {e}")
+        global _ssl_warnings_suppressed
+        if _ssl_warnings_suppressed:
+            return
+        
+        # Un solo filtro para los avisos SSL/certificado/no verificado (filterwarnings ignora mayúsculas)
+        warnings.filterwarnings('ignore', message=_SSL_WARNING_MESSAGES, category=UserWarning)
+        # InsecureRequestWarning de urllib3, por su mensaje para no tener que importar urllib3
+        warnings.filterwarnings('ignore', message=_INSECURE_REQUEST_MESSAGE)
+        _ssl_warnings_suppressed = True
     
     def restore_ssl_context(self):
         """Restaurar configuración SSL original"""
@@ -146,47 +314,12 @@ class SSLConfigManager:
     
     def is_ssl_error(self, error: Exception) -> bool:
         """Detectar si un error está relacionado con SSL/certificados"""
-        error_msg = str(error).lower()
-        ssl_keywords = [
-            'ssl', 'certificate', 'handshake', 'tls', 
-            'cert', 'connection reset', 'connection aborted',
-            'max retries exceeded', 'certificate verify failed'
-        ]
-        
-        return any(keyword in error_msg for keyword in ssl_keywords)
+        return _SSL_ERROR_PATTERN.search(str(error)) is not None
     
     def provide_troubleshooting_info(self, error: Exception):
         """Proporcionar información de troubleshooting para errores SSL"""
-        logger.error("🚨 ERROR DE CERTIFICADO SSL DETECTADO 🚨")
-        logger.error("=" * 60)
-        logger.error("Este error es común en PC nuevos o redes corporativas.")
-        logger.error("")
-        logger.error("SOLUCIONES AUTOMÁTICAS APLICADAS:")
-        logger.error("✅ Configuración SSL permisiva activada")
-        logger.error("✅ Variables de entorno SSL configuradas")
-        logger.error("✅ Warnings SSL suprimidos")
-        logger.error("")
-        logger.error("SI EL PROBLEMA PERSISTE:")
-        logger.error("")
-        logger.error("1. 🌐 VERIFICAR INTERNET:")
-        logger.error("   - Prueba abrir https://huggingface.co en el navegador")
-        logger.error("")
-        logger.error("2. 🔥 FIREWALL/ANTIVIRUS:")
-        logger.error("   - Deshabilitar temporalmente")
-        logger.error("   - Agregar excepción para Python")
-        logger.error("")
-        logger.error("3. 🏢 RED CORPORATIVA:")
-        logger.error("   - Configurar proxy si es necesario")
-        logger.error("   - Contactar IT para acceso a huggingface.co")
-        logger.error("")
-        logger.error("4. 📱 HOTSPOT MÓVIL (último recurso):")
-        logger.error("   - Usar datos móviles para la primera descarga")
-        logger.error("")
-        logger.error("5. 🔄 REINSTALAR CERTIFICADOS:")
-        logger.error("   - Ejecutar: scripts/install_coqui_ssl_fix.ps1")
-        logger.error("")
-        logger.error(f"Error técnico: {error}")
-        logger.error("=" * 60)
+        # Un único registro: el bloque sale entero y sin intercalarse con otros mensajes
+        logger.error(_TROUBLESHOOTING_BANNER, error)
 
 
 # Instancia global del gestor SSL
@@ -198,11 +331,11 @@ def auto_configure_ssl():
 
 def is_ssl_error(error: Exception) -> bool:
     """Detectar errores SSL (función de conveniencia)"""
-    return ssl_manager.is_ssl_error(error)
+    return _SSL_ERROR_PATTERN.search(str(error)) is not None
 
 def provide_ssl_help(error: Exception):
     """Mostrar ayuda para errores SSL (función de conveniencia)"""
-    ssl_manager.provide_troubleshooting_info(error)
+    logger.error(_TROUBLESHOOTING_BANNER, error)
 
 # Configurar SSL automáticamente al importar este módulo
 if __name__ != "__main__":
@@ -6,10 +6,17 @@ This module converts numbers, dates, times, currencies, percentages, and common
 into their spoken form in Spanish.
 """
 
+import functools
 import re
 import logging
 from typing import Dict, List, Optional
 
+# pyahocorasick finds every abbreviation in one automaton walk; without it they are matched by regex
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 # Spanish months mapping
@@ -18,6 +25,52 @@ SPANISH_MONTHS = {
     7: "julio", 8: "agosto", 9: "septiembre", 10: "octubre", 11: "noviembre", 12: "diciembre"
 }
 
+ENGLISH_MONTHS = {
+    1: "January", 2: "February", 3: "March", 4: "April", 5: "May", 6: "June",
+    7: "July", 8: "August", 9: "September", 10: "October", 11: "November", 12: "December"
+}
+
+# Currency names per language: (plural, singular, sub_plural, sub_singular)
+CURRENCY_TERMS = {
+    'es': {
+        'dollars': ('dólares', 'dólar', 'centavos', 'centavo'),
+        'euros': ('euros', 'euro', 'céntimos', 'céntimo'),
+        'pounds': ('libras', 'libra', 'peniques', 'penique'),
+        'pesos': ('pesos', 'peso', 'centavos', 'centavo')
+    },
+    'en': {
+        'dollars': ('dollars', 'dollar', 'cents', 'cent'),
+        'euros': ('euros', 'euro', 'cents', 'cent'),
+        'pounds': ('pounds', 'pound', 'pence', 'penny'),
+        'pesos': ('pesos', 'peso', 'cents', 'cent')
+    },
+    'fr': {
+        'dollars': ('dollars', 'dollar', 'cents', 'cent'),
+        'euros': ('euros', 'euro', 'centimes', 'centime'),
+        'pounds': ('livres', 'livre', 'pence', 'penny'),
+        'pesos': ('pesos', 'peso', 'centimes', 'centime')
+    }
+}
+
+# Word joining the main and sub amounts of a currency
+CURRENCY_CONNECTORS = {
+    'es': 'con',
+    'en': 'and',
+    'fr': 'et',
+    'de': 'und',
+    'it': 'e'
+}
+
+# Decimal separator and percent words per language
+PERCENTAGE_TERMS = {
+    'es': ('coma', 'por ciento'),
+    'en': ('point', 'percent'),
+    'fr': ('virgule', 'pour cent'),
+    'de': ('komma', 'prozent'),
+    'it': ('virgola', 'per cento'),
+    'pt': ('vírgula', 'por cento')
+}
+
 # Spanish abbreviations mapping
 SPANISH_ABBREVIATIONS = {
     "Dr.": "doctor", "Dra.": "doctora", "Sr.": "señor", "Sra.": "señora", 
@@ -42,7 +95,99 @@ SPANISH_ORDINALS = {
     31: "trigésimo primero"
 }
 
-
+# Patterns compiled once at import; the normalizers run them over every chunk of a book.
+# Group names are unique across all of them so they can be combined into one pattern.
+_NUMBER_RE = re.compile(
+    # Large numbers with commas (e.g., 1,250,000)
+    r'(?<![\/\-\.\:$€£])\b(?P<number_commas>\d{1,3}(?:,\d{3})+)\b(?![\/\-\.\:$€£%])'
+    # Regular numbers without commas (including 4-digit years)
+    r'|(?<![\/\-\.\:$€£,])\b(?P<number_plain>\d{1,4})\b(?![\/\-\.\:$€£%,])'
+)
+# Start-of-line list markers: optional whitespace, digits, then one of . ) - : followed by space
+_LIST_ITEM_RE = re.compile(r'^(?P<indent>\s*)(?P<num>\d{1,6})\s*(?:[\.\)\-:])\s+', re.MULTILINE)
+# Dates: DD/MM/YYYY, DD-MM-YYYY, DD.MM.YYYY, and DD/MM/YY
+_DATE_RE = re.compile(r'\b(?P<day>\d{1,2})[\/\-\.](?P<month>\d{1,2})[\/\-\.](?P<year>\d{4}|\d{2})\b')
+# Time: HH:MM (with optional AM/PM)
+_TIME_RE = re.compile(r'\b(?P<hours>\d{1,2}):(?P<minutes>\d{2})(?:\s*(?P<am_pm>AM|PM|am|pm))?\b')
+# Currencies with comma-separated thousands: $150.50, €20, £30 or 150 USD, 20 EUR, 3 pesos
+_CURRENCY_RE = re.compile(
+    r'(?P<currency_symbol>[\$€£])(?P<symbol_amount>\d{1,3}(?:,\d{3})*)(?:\.(?P<symbol_cents>\d{1,2}))?'
+    r'|(?P<code_amount>\d{1,3}(?:,\d{3})*)\s*(?P<currency_code>USD|EUR|pesos?)'
+)
+_PERCENT_RE = re.compile(r'\b(?P<percent>\d+(?:\.\d+)?)\s*%')
+
+
+def _abbreviation_alternation(abbrevs) -> str:
+    """Alternation of abbreviations grouped by first letter (longest first within each group).
+
+    The regex engine tries alternatives one by one at every position, so
+    sharing the first letter lets it discard a whole group with one test.
+    """
+    groups = {}
+    for abbrev in sorted(abbrevs, key=len, reverse=True):
+        groups.setdefault(abbrev[0].casefold(), []).append(abbrev)
+    return '|'.join(
+        re.escape(group[0][0]) + '(?:' + '|'.join(re.escape(abbrev[1:]) for abbrev in group) + ')'
+        for group in groups.values()
+    )
+
+
+# All abbreviations in one case-insensitive pattern: those without a period on word boundaries,
+# those with one literally. The two kinds never match at the same position, and the lookahead
+# skips positions that cannot start any abbreviation with a single character test.
+_ABBREVIATION_FIRST_LETTERS = ''.join(sorted({re.escape(abbrev[0].casefold()) for abbrev in SPANISH_ABBREVIATIONS}))
+_ABBREVIATION_RE = re.compile(
+    f'(?=[{_ABBREVIATION_FIRST_LETTERS}])(?:'
+    + r'\b(?:' + _abbreviation_alternation(a for a in SPANISH_ABBREVIATIONS if not a.endswith('.')) + r')\b'
+    + '|' + _abbreviation_alternation(a for a in SPANISH_ABBREVIATIONS if a.endswith('.'))
+    + ')',
+    re.IGNORECASE
+)
+_ABBREVIATION_EXPANSIONS = {abbrev.casefold(): expansion for abbrev, expansion in SPANISH_ABBREVIATIONS.items()}
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether char is a regex word character (\\w); False for the empty string past either end."""
+    return char.isalnum() or char == '_'
+
+
+def _build_abbreviation_automaton():
+    """Aho-Corasick automaton over the casefolded abbreviations, or None without pyahocorasick.
+
+    Each key maps to (length, expansion, boundaries), the same rules as _ABBREVIATION_RE:
+    boundaries is None for abbreviations with a period, otherwise whether their first and
+    last characters are word characters (a neighbour must then differ to form a \\b).
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for abbrev, expansion in SPANISH_ABBREVIATIONS.items():
+        boundaries = None if abbrev.endswith('.') else (_is_word_char(abbrev[0]), _is_word_char(abbrev[-1]))
+        automaton.add_word(abbrev.casefold(), (len(abbrev), expansion, boundaries))
+    automaton.make_automaton()
+    return automaton
+
+
+_ABBREVIATION_AUTOMATON = _build_abbreviation_automaton()
+
+# Currency keys in CURRENCY_TERMS for each symbol or code matched by _CURRENCY_RE
+_CURRENCY_SYMBOLS = {'$': 'dollars', '€': 'euros', '£': 'pounds'}
+_CURRENCY_CODES = {'USD': 'dollars', 'EUR': 'euros', 'peso': 'pesos', 'pesos': 'pesos'}
+
+# Everything is_normalization_needed looks for, in a single search. Any date, time or
+# percentage also contains a standalone number, so numbers, currencies and abbreviations
+# cover them all: abbreviations with a period match exactly, the others on word
+# boundaries ignoring case (sharing the boundaries of the number alternative)
+_NEEDS_NORMALIZATION_RE = re.compile(
+    r'[\$€£]\d|\b(?:\d+|(?i:'
+    + '|'.join(re.escape(abbrev) for abbrev in SPANISH_ABBREVIATIONS if not abbrev.endswith('.'))
+    + r'))\b|'
+    + '|'.join(re.escape(abbrev) for abbrev in SPANISH_ABBREVIATIONS if abbrev.endswith('.'))
+)
+
+
+# Memoized: books repeat the same small numbers and years, and num2words rebuilds each one
+@functools.lru_cache(maxsize=4096)
 def _convert_number_to_language(num: int, lang: str = 'es') -> str:
     """Convert integer to text in specified language using num2words with fallback."""
     try:
@@ -83,6 +228,7 @@ def _basic_number_conversion(num: int, lang: str = 'es') -> str:
         return str(num)
 
 
+@functools.lru_cache(maxsize=4096)
 def _basic_number_to_spanish(num: int) -> str:
     """Basic number conversion for Spanish (fallback when num2words is not available)."""
     if num == 0:
@@ -136,6 +282,7 @@ def _basic_number_to_spanish(num: int) -> str:
         return str(num)  # Fallback to digits for very large numbers
 
 
+@functools.lru_cache(maxsize=4096)
 def _basic_number_to_english(num: int) -> str:
     """Basic number conversion for English (fallback when num2words is not available)."""
     if num == 0:
@@ -183,20 +330,10 @@ def _basic_number_to_english(num: int) -> str:
         return str(num)  # Fallback to digits for very large numbers
 
 
-def _normalize_numbers(text: str, language: str = 'es') -> str:
-    """Normalize standalone numbers in text."""
-    # Pattern for standalone numbers including comma-separated thousands
-    # Avoid numbers in dates, times, currencies, decimals, etc.
-    number_patterns = [
-        # Large numbers with commas (e.g., 1,250,000) - increased limit for millions
-        r'(?<![\/\-\.\:$€£])\b(\d{1,3}(?:,\d{3})+)\b(?![\/\-\.\:$€£%])',
-        # Regular numbers without commas (including 4-digit years)
-        r'(?<![\/\-\.\:$€£,])\b(\d{1,4})\b(?![\/\-\.\:$€£%,])'
-    ]
-    
-    def replace_comma_number(match):
-        """Replace comma-separated numbers like 1,250,000"""
-        num_str = match.group(1)
+def _replace_number(match, language: str) -> str:
+    """Replace a standalone number, including comma-separated ones like 1,250,000."""
+    num_str = match.group('number_commas')
+    if num_str:
         try:
             # Remove commas and convert to int
             num = int(num_str.replace(',', ''))
@@ -205,24 +342,35 @@ def _normalize_numbers(text: str, language: str = 'es') -> str:
             return _convert_number_to_language(num, language)
         except ValueError:
             return num_str
-    
-    def replace_simple_number(match):
-        """Replace simple numbers"""
-        num_str = match.group(1)
-        try:
-            num = int(num_str)
-            if num > 9999:  # Allow years like 1990, 2020, etc.
-                return num_str
-            return _convert_number_to_language(num, language)
-        except ValueError:
+
+    num_str = match.group('number_plain')
+    try:
+        num = int(num_str)
+        if num > 9999:  # Allow years like 1990, 2020, etc.
             return num_str
-    
-    # Process comma numbers first, then simple numbers
-    result = text
-    result = re.sub(number_patterns[0], replace_comma_number, result)
-    result = re.sub(number_patterns[1], replace_simple_number, result)
-    
-    return result
+        return _convert_number_to_language(num, language)
+    except ValueError:
+        return num_str
+
+
+def _normalize_numbers(text: str, language: str = 'es') -> str:
+    """Normalize standalone numbers in text."""
+    # The pattern's lookarounds avoid numbers in dates, times, currencies, decimals, etc.
+    return _NUMBER_RE.sub(lambda match: _replace_number(match, language), text)
+
+
+def _replace_list_item(match, language: str) -> str:
+    """Replace a list marker with its spoken number plus a single space (preserving indent)."""
+    indent = match.group('indent') or ''
+    num_str = match.group('num')
+    try:
+        num = int(num_str)
+        # Convert number to language-aware text
+        spoken = _convert_number_to_language(num, language)
+        # Return spoken number plus a single space (preserve indent)
+        return f"{indent}{spoken} "
+    except Exception:
+        return match.group(0)
 
 
 def _normalize_list_items(text: str, language: str = 'es') -> str:
@@ -232,22 +380,74 @@ def _normalize_list_items(text: str, language: str = 'es') -> str:
     (e.g. "uno ", "two ") and removes the punctuation so TTS doesn't read
     a literal 'point' or similar marker.
     """
-    # Match start-of-line list markers: optional whitespace, digits, then one of . ) - : followed by space
-    list_pattern = re.compile(r'(?m)^(?P<indent>\s*)(?P<num>\d{1,6})\s*(?:[\.\)\-:])\s+')
+    return _LIST_ITEM_RE.sub(lambda match: _replace_list_item(match, language), text)
 
-    def replace_list(match):
-        indent = match.group('indent') or ''
-        num_str = match.group('num')
-        try:
-            num = int(num_str)
-            # Convert number to language-aware text
-            spoken = _convert_number_to_language(num, language)
-            # Return spoken number plus a single space (preserve indent)
-            return f"{indent}{spoken} "
-        except Exception:
-            return match.group(0)
 
-    return list_pattern.sub(replace_list, text)
+def _get_english_ordinal(num: int, language: str) -> str:
+    """Get English ordinal for a number"""
+    if 10 <= num % 100 <= 20:  # Special case for 11th, 12th, 13th, etc.
+        suffix = "th"
+    else:
+        suffix = {1: "st", 2: "nd", 3: "rd"}.get(num % 10, "th")
+    
+    base_num = _convert_number_to_language(num, language)
+    # Handle special cases
+    if num == 1:
+        return "first"
+    elif num == 2:
+        return "second" 
+    elif num == 3:
+        return "third"
+    elif num == 5:
+        return "fifth"
+    elif num == 21:
+        return "twenty-first"
+    elif num == 22:
+        return "twenty-second"
+    elif num == 23:
+        return "twenty-third"
+    elif num == 25:
+        return "twenty-fifth" 
+    elif num == 31:
+        return "thirty-first"
+    else:
+        return base_num + suffix
+
+
+def _replace_date(match, language: str) -> str:
+    """Replace a DD/MM/YYYY-style date with its spoken form (Spanish and English)."""
+    try:
+        day = int(match.group('day'))
+        month = int(match.group('month'))
+        year = int(match.group('year'))
+        
+        # Handle 2-digit years
+        if year < 100:
+            year = 2000 + year if year < 50 else 1900 + year
+        
+        # Validate month
+        if month < 1 or month > 12:
+            return match.group(0)  # Return original if invalid
+        
+        # Validate day (basic check)
+        if day < 1 or day > 31:
+            return match.group(0)  # Return original if invalid
+        
+        if language == 'es':
+            # Spanish date formatting
+            day_text = "primero" if day == 1 else _convert_number_to_language(day, language)
+            month_text = SPANISH_MONTHS[month]
+            year_text = _convert_number_to_language(year, language)
+            return f"{day_text} de {month_text} de {year_text}"
+        elif language == 'en':
+            # English date formatting
+            day_text = _get_english_ordinal(day, language)
+            month_text = ENGLISH_MONTHS[month]
+            year_text = _convert_number_to_language(year, language)
+            return f"{month_text} {day_text}, {year_text}"
+        
+    except (ValueError, KeyError):
+        return match.group(0)  # Return original on error
 
 
 def _normalize_dates(text: str, language: str = 'es') -> str:
@@ -255,335 +455,269 @@ def _normalize_dates(text: str, language: str = 'es') -> str:
     # Only apply date normalization for supported languages
     if language not in ['es', 'en']:
         return text
-        
-    # Pattern for dates: DD/MM/YYYY, DD-MM-YYYY, DD.MM.YYYY
-    date_patterns = [
-        r'\b(\d{1,2})[\/\-\.](\d{1,2})[\/\-\.](\d{4})\b',  # DD/MM/YYYY
-        r'\b(\d{1,2})[\/\-\.](\d{1,2})[\/\-\.](\d{2})\b'    # DD/MM/YY
-    ]
-    
-    def replace_date(match):
-        try:
-            day = int(match.group(1))
-            month = int(match.group(2))
-            year = int(match.group(3))
-            
-            # Handle 2-digit years
-            if year < 100:
-                year = 2000 + year if year < 50 else 1900 + year
-            
-            # Validate month
-            if month < 1 or month > 12:
-                return match.group(0)  # Return original if invalid
-            
-            # Validate day (basic check)
-            if day < 1 or day > 31:
-                return match.group(0)  # Return original if invalid
-            
-            if language == 'es':
-                # Spanish date formatting
-                day_text = "primero" if day == 1 else _convert_number_to_language(day, language)
-                month_text = SPANISH_MONTHS[month]
-                year_text = _convert_number_to_language(year, language)
-                return f"{day_text} de {month_text} de {year_text}"
-            elif language == 'en':
-                # English date formatting
-                english_months = {
-                    1: "January", 2: "February", 3: "March", 4: "April", 5: "May", 6: "June",
-                    7: "July", 8: "August", 9: "September", 10: "October", 11: "November", 12: "December"
-                }
-                def get_english_ordinal(num):
-                    """Get English ordinal for a number"""
-                    if 10 <= num % 100 <= 20:  # Special case for 11th, 12th, 13th, etc.
-                        suffix = "th"
-                    else:
-                        suffix = {1: "st", 2: "nd", 3: "rd"}.get(num % 10, "th")
-                    
-                    base_num = _convert_number_to_language(num, language)
-                    # Handle special cases
-                    if num == 1:
-                        return "first"
-                    elif num == 2:
-                        return "second" 
-                    elif num == 3:
-                        return "third"
-                    elif num == 5:
-                        return "fifth"
-                    elif num == 21:
-                        return "twenty-first"
-                    elif num == 22:
-                        return "twenty-second"
-                    elif num == 23:
-                        return "twenty-third"
-                    elif num == 25:
-                        return "twenty-fifth" 
-                    elif num == 31:
-                        return "thirty-first"
-                    else:
-                        return base_num + suffix
-                
-                day_text = get_english_ordinal(day)
-                month_text = english_months[month]
-                year_text = _convert_number_to_language(year, language)
-                return f"{month_text} {day_text}, {year_text}"
-            
-        except (ValueError, KeyError):
-            return match.group(0)  # Return original on error
-    
-    result = text
-    for pattern in date_patterns:
-        result = re.sub(pattern, replace_date, result)
     
-    return result
+    return _DATE_RE.sub(lambda match: _replace_date(match, language), text)
 
 
-def _normalize_times(text: str, language: str = 'es') -> str:
-    """Normalize time expressions like 3:30, 15:45, etc."""
-    # Pattern for time: HH:MM (with optional AM/PM)
-    time_pattern = r'\b(\d{1,2}):(\d{2})(?:\s*(AM|PM|am|pm))?\b'
-    
-    def replace_time(match):
-        try:
-            hours = int(match.group(1))
-            minutes = int(match.group(2))
-            am_pm = match.group(3)
-            
-            # Validate time
-            if hours > 23 or minutes > 59:
-                return match.group(0)  # Return original if invalid
-            
-            # Convert hours
-            if am_pm:
-                # 12-hour format
-                if am_pm.upper() == 'AM':
-                    if hours == 12:
-                        hours_text = "doce" if language == 'es' else "twelve"
-                    else:
-                        hours_text = _convert_number_to_language(hours, language)
-                    period = "de la mañana" if language == 'es' else "AM"
-                else:  # PM
-                    if hours == 12:
-                        hours_text = "doce" if language == 'es' else "twelve"
-                    else:
-                        hours_text = _convert_number_to_language(hours, language)
-                    period = "de la tarde" if language == 'es' else "PM"
-            else:
-                # 24-hour format OR ambiguous time
-                hours_text = _convert_number_to_language(hours, language)
-                
-                # Language-specific time periods
-                if language == 'es':
-                    if hours >= 1 and hours <= 11:
-                        full_match = match.group(0)
-                        text_before = match.string[:match.start()]
-                        period = "de la tarde" if "las" in text_before[-10:] else "de la mañana"
-                    elif hours == 12:
-                        period = "del mediodía"
-                    elif hours < 6:
-                        period = "de la madrugada"
-                    elif hours < 12:
-                        period = "de la mañana"
-                    elif hours < 19:
-                        period = "de la tarde"
-                    else:
-                        period = "de la noche"
-                elif language == 'en':
-                    if hours < 12:
-                        period = "AM"
-                    else:
-                        period = "PM"
+def _replace_time(match, language: str) -> str:
+    """Replace an HH:MM time (with optional AM/PM) with its spoken form."""
+    try:
+        hours = int(match.group('hours'))
+        minutes = int(match.group('minutes'))
+        am_pm = match.group('am_pm')
+        
+        # Validate time
+        if hours > 23 or minutes > 59:
+            return match.group(0)  # Return original if invalid
+        
+        # Convert hours
+        if am_pm:
+            # 12-hour format
+            if am_pm.upper() == 'AM':
+                if hours == 12:
+                    hours_text = "doce" if language == 'es' else "twelve"
+                else:
+                    hours_text = _convert_number_to_language(hours, language)
+                period = "de la mañana" if language == 'es' else "AM"
+            else:  # PM
+                if hours == 12:
+                    hours_text = "doce" if language == 'es' else "twelve"
                 else:
-                    # For other languages, use 24-hour format
-                    period = ""
+                    hours_text = _convert_number_to_language(hours, language)
+                period = "de la tarde" if language == 'es' else "PM"
+        else:
+            # 24-hour format OR ambiguous time
+            hours_text = _convert_number_to_language(hours, language)
             
-            # Language-specific minute formatting
+            # Language-specific time periods
             if language == 'es':
-                if minutes == 0:
-                    return f"{hours_text} en punto {period}".strip()
-                elif minutes == 15:
-                    return f"{hours_text} y cuarto {period}".strip()
-                elif minutes == 30:
-                    return f"{hours_text} y media {period}".strip()
-                elif minutes == 45:
-                    next_hour = (hours + 1) % 24
-                    next_hour_text = _convert_number_to_language(next_hour, language)
-                    return f"cuarto para las {next_hour_text} {period}".strip()
+                if hours >= 1 and hours <= 11:
+                    text_before = match.string[max(0, match.start() - 10):match.start()]
+                    period = "de la tarde" if "las" in text_before else "de la mañana"
+                elif hours == 12:
+                    period = "del mediodía"
+                elif hours < 6:
+                    period = "de la madrugada"
+                elif hours < 12:
+                    period = "de la mañana"
+                elif hours < 19:
+                    period = "de la tarde"
                 else:
-                    minutes_text = _convert_number_to_language(minutes, language)
-                    return f"{hours_text} y {minutes_text} {period}".strip()
+                    period = "de la noche"
             elif language == 'en':
-                if minutes == 0:
-                    return f"{hours_text} o'clock {period}".strip()
-                elif minutes == 15:
-                    return f"quarter past {hours_text} {period}".strip()
-                elif minutes == 30:
-                    return f"half past {hours_text} {period}".strip()
-                elif minutes == 45:
-                    next_hour = (hours + 1) % 12 if hours < 12 else (hours + 1 - 12)
-                    if next_hour == 0:
-                        next_hour = 12
-                    next_hour_text = _convert_number_to_language(next_hour, language)
-                    return f"quarter to {next_hour_text} {period}".strip()
+                if hours < 12:
+                    period = "AM"
                 else:
-                    minutes_text = _convert_number_to_language(minutes, language)
-                    return f"{hours_text} {minutes_text} {period}".strip()
+                    period = "PM"
             else:
-                # Other languages: simple format
-                minutes_text = _convert_number_to_language(minutes, language) if minutes > 0 else ""
-                if minutes_text:
-                    return f"{hours_text}:{minutes_text}"
-                else:
-                    return f"{hours_text}:00"
-                
-        except ValueError:
-            return match.group(0)  # Return original on error
-    
-    return re.sub(time_pattern, replace_time, text)
+                # For other languages, use 24-hour format
+                period = ""
+        
+        # Language-specific minute formatting
+        if language == 'es':
+            if minutes == 0:
+                return f"{hours_text} en punto {period}".strip()
+            elif minutes == 15:
+                return f"{hours_text} y cuarto {period}".strip()
+            elif minutes == 30:
+                return f"{hours_text} y media {period}".strip()
+            elif minutes == 45:
+                next_hour = (hours + 1) % 24
+                next_hour_text = _convert_number_to_language(next_hour, language)
+                return f"cuarto para las {next_hour_text} {period}".strip()
+            else:
+                minutes_text = _convert_number_to_language(minutes, language)
+                return f"{hours_text} y {minutes_text} {period}".strip()
+        elif language == 'en':
+            if minutes == 0:
+                return f"{hours_text} o'clock {period}".strip()
+            elif minutes == 15:
+                return f"quarter past {hours_text} {period}".strip()
+            elif minutes == 30:
+                return f"half past {hours_text} {period}".strip()
+            elif minutes == 45:
+                next_hour = (hours + 1) % 12 if hours < 12 else (hours + 1 - 12)
+                if next_hour == 0:
+                    next_hour = 12
+                next_hour_text = _convert_number_to_language(next_hour, language)
+                return f"quarter to {next_hour_text} {period}".strip()
+            else:
+                minutes_text = _convert_number_to_language(minutes, language)
+                return f"{hours_text} {minutes_text} {period}".strip()
+        else:
+            # Other languages: simple format
+            minutes_text = _convert_number_to_language(minutes, language) if minutes > 0 else ""
+            if minutes_text:
+                return f"{hours_text}:{minutes_text}"
+            else:
+                return f"{hours_text}:00"
+            
+    except ValueError:
+        return match.group(0)  # Return original on error
+
+
+def _normalize_times(text: str, language: str = 'es') -> str:
+    """Normalize time expressions like 3:30, 15:45, etc."""
+    return _TIME_RE.sub(lambda match: _replace_time(match, language), text)
+
+
+def _replace_currency(match, language: str) -> str:
+    """Replace a currency amount with its spoken form, e.g. "$150.50" or "20 EUR"."""
+    try:
+        symbol = match.group('currency_symbol')
+        if symbol:
+            main_amount_str = match.group('symbol_amount')
+            sub_amount_str = match.group('symbol_cents')
+            currency = _CURRENCY_SYMBOLS[symbol]
+        else:
+            main_amount_str = match.group('code_amount')
+            sub_amount_str = None
+            currency = _CURRENCY_CODES[match.group('currency_code')]
+        sub_amount = int(sub_amount_str) if sub_amount_str else None
+        
+        # Handle comma-separated numbers
+        main_amount = int(main_amount_str.replace(',', ''))
+        main_text = _convert_number_to_language(main_amount, language)
+        
+        # Get plural/singular forms for the language (fallback to Spanish):
+        # (plural, singular, sub_plural, sub_singular)
+        terms = CURRENCY_TERMS.get(language, CURRENCY_TERMS['es'])
+        main_plural, main_singular, sub_plural, sub_singular = terms[currency]
+        
+        # Handle singular/plural for main unit
+        main_unit_text = main_singular if main_amount == 1 else main_plural
+        
+        # Language-specific connecting words
+        connector = CURRENCY_CONNECTORS.get(language, 'con')
+        
+        result = f"{main_text} {main_unit_text}"
+        
+        # Add sub-amount if present
+        if sub_amount is not None and sub_amount > 0:
+            sub_text = _convert_number_to_language(sub_amount, language)
+            sub_unit_text = sub_singular if sub_amount == 1 else sub_plural
+            result += f" {connector} {sub_text} {sub_unit_text}"
+        
+        return result
+    except ValueError:
+        return match.group(0)  # Return original on error
 
 
 def _normalize_currencies(text: str, language: str = 'es') -> str:
     """Normalize currency expressions like $150, €20, £30, etc."""
-    
-    # Language-specific currency terms
-    currency_terms = {
-        'es': {
-            'dollars': ('dólares', 'dólar', 'centavos', 'centavo'),
-            'euros': ('euros', 'euro', 'céntimos', 'céntimo'),
-            'pounds': ('libras', 'libra', 'peniques', 'penique'),
-            'pesos': ('pesos', 'peso', 'centavos', 'centavo')
-        },
-        'en': {
-            'dollars': ('dollars', 'dollar', 'cents', 'cent'),
-            'euros': ('euros', 'euro', 'cents', 'cent'),
-            'pounds': ('pounds', 'pound', 'pence', 'penny'),
-            'pesos': ('pesos', 'peso', 'cents', 'cent')
-        },
-        'fr': {
-            'dollars': ('dollars', 'dollar', 'cents', 'cent'),
-            'euros': ('euros', 'euro', 'centimes', 'centime'),
-            'pounds': ('livres', 'livre', 'pence', 'penny'),
-            'pesos': ('pesos', 'peso', 'centimes', 'centime')
-        }
-    }
-    
-    # Get currency terms for language, fallback to Spanish
-    terms = currency_terms.get(language, currency_terms['es'])
-    
-    # Patterns for different currencies with comma-separated thousands
-    currency_patterns = [
-        (r'\$(\d{1,3}(?:,\d{3})*)(?:\.(\d{1,2}))?', terms['dollars']),
-        (r'€(\d{1,3}(?:,\d{3})*)(?:\.(\d{1,2}))?', terms['euros']),
-        (r'£(\d{1,3}(?:,\d{3})*)(?:\.(\d{1,2}))?', terms['pounds']),
-        (r'(\d{1,3}(?:,\d{3})*)\s*USD', terms['dollars']),
-        (r'(\d{1,3}(?:,\d{3})*)\s*EUR', terms['euros']),
-        (r'(\d{1,3}(?:,\d{3})*)\s*pesos?', terms['pesos']),
-    ]
-    
-    def replace_currency(match, currency_terms):
-        try:
-            main_amount_str = match.group(1)
-            sub_amount = int(match.group(2)) if match.lastindex >= 2 and match.group(2) else None
-            
-            # Handle comma-separated numbers
-            main_amount = int(main_amount_str.replace(',', ''))
-            main_text = _convert_number_to_language(main_amount, language)
-            
-            # Get plural/singular forms: (plural, singular, sub_plural, sub_singular)
-            main_plural, main_singular, sub_plural, sub_singular = currency_terms
-            
-            # Handle singular/plural for main unit
-            main_unit_text = main_singular if main_amount == 1 else main_plural
-            
-            # Language-specific connecting words
-            connector = {
-                'es': 'con',
-                'en': 'and',
-                'fr': 'et',
-                'de': 'und',
-                'it': 'e'
-            }.get(language, 'con')
+    return _CURRENCY_RE.sub(lambda match: _replace_currency(match, language), text)
+
+
+def _replace_percentage(match, language: str) -> str:
+    """Replace a percentage like 15% or 3.5% with its spoken form."""
+    decimal_word, percent_word = PERCENTAGE_TERMS.get(language, PERCENTAGE_TERMS['es'])
+    try:
+        percentage_str = match.group('percent')
+        
+        if '.' in percentage_str:
+            # Handle decimal percentages
+            parts = percentage_str.split('.')
+            whole = int(parts[0])
+            decimal = int(parts[1])
             
-            result = f"{main_text} {main_unit_text}"
+            whole_text = _convert_number_to_language(whole, language)
+            decimal_text = _convert_number_to_language(decimal, language)
             
-            # Add sub-amount if present
-            if sub_amount is not None and sub_amount > 0:
-                sub_text = _convert_number_to_language(sub_amount, language)
-                sub_unit_text = sub_singular if sub_amount == 1 else sub_plural
-                result += f" {connector} {sub_text} {sub_unit_text}"
+            return f"{whole_text} {decimal_word} {decimal_text} {percent_word}"
+        else:
+            # Handle whole number percentages
+            percentage = int(percentage_str)
+            percentage_text = _convert_number_to_language(percentage, language)
+            return f"{percentage_text} {percent_word}"
             
-            return result
-        except ValueError:
-            return match.group(0)  # Return original on error
-    
-    result = text
-    for pattern, currency_terms in currency_patterns:
-        result = re.sub(pattern, lambda m: replace_currency(m, currency_terms), result)
-    
-    return result
+    except ValueError:
+        return match.group(0)  # Return original on error
 
 
 def _normalize_percentages(text: str, language: str = 'es') -> str:
     """Normalize percentage expressions like 15%, 3.5%, etc."""
-    # Language-specific percentage terms
-    percentage_terms = {
-        'es': ('coma', 'por ciento'),
-        'en': ('point', 'percent'),
-        'fr': ('virgule', 'pour cent'),
-        'de': ('komma', 'prozent'),
-        'it': ('virgola', 'per cento'),
-        'pt': ('vírgula', 'por cento')
-    }
-    
-    decimal_word, percent_word = percentage_terms.get(language, percentage_terms['es'])
-    
-    # Pattern for percentages
-    percentage_pattern = r'\b(\d+(?:\.\d+)?)\s*%'
-    
-    def replace_percentage(match):
-        try:
-            percentage_str = match.group(1)
-            
-            if '.' in percentage_str:
-                # Handle decimal percentages
-                parts = percentage_str.split('.')
-                whole = int(parts[0])
-                decimal = int(parts[1])
-                
-                whole_text = _convert_number_to_language(whole, language)
-                decimal_text = _convert_number_to_language(decimal, language)
-                
-                return f"{whole_text} {decimal_word} {decimal_text} {percent_word}"
-            else:
-                # Handle whole number percentages
-                percentage = int(percentage_str)
-                percentage_text = _convert_number_to_language(percentage, language)
-                return f"{percentage_text} {percent_word}"
-                
-        except ValueError:
-            return match.group(0)  # Return original on error
-    
-    return re.sub(percentage_pattern, replace_percentage, text)
+    return _PERCENT_RE.sub(lambda match: _replace_percentage(match, language), text)
+
+
+def _replace_abbreviation(match, language: str) -> str:
+    """Expand a Spanish abbreviation matched case-insensitively."""
+    return _ABBREVIATION_EXPANSIONS.get(match.group(0).casefold(), match.group(0))
+
+
+def _expand_abbreviations_automaton(text: str) -> Optional[str]:
+    """Expand abbreviations with the Aho-Corasick automaton in a single walk.
+
+    Keeps the same matches as _ABBREVIATION_RE: of the hits that pass the word boundary
+    check, the leftmost wins, the longest among those starting at the same position.
+    None when casefolding changes the text's length (e.g. "ß"), since match offsets
+    would no longer line up.
+    """
+    folded = text.casefold()
+    if len(folded) != len(text):
+        return None
+    hits = []
+    for end, (length, expansion, boundaries) in _ABBREVIATION_AUTOMATON.iter(folded):
+        start = end + 1 - length
+        if boundaries is not None:
+            # Most hits are single letters inside a word, rejected by the first test
+            if (_is_word_char(text[start - 1:start] if start else '') == boundaries[0]
+                    or _is_word_char(text[end + 1:end + 2]) == boundaries[1]):
+                continue
+        hits.append((start, -length, expansion))
+    if not hits:
+        return text
+    hits.sort()
+    parts = []
+    last = 0
+    for start, negative_length, expansion in hits:
+        if start < last:
+            continue
+        parts.append(text[last:start])
+        parts.append(expansion)
+        last = start - negative_length
+    parts.append(text[last:])
+    return ''.join(parts)
 
 
 def _normalize_abbreviations(text: str, language: str = 'es') -> str:
     """Normalize common Spanish abbreviations."""
-    result = text
-    
-    # Sort by length (longest first) to handle overlapping abbreviations correctly
-    sorted_abbrevs = sorted(SPANISH_ABBREVIATIONS.items(), key=lambda x: len(x[0]), reverse=True)
-    
-    for abbrev, expansion in sorted_abbrevs:
-        # Special handling for abbreviations with periods
-        if abbrev.endswith('.'):
-            # Match the abbreviation with the period as literal
-            pattern = re.escape(abbrev)
-        else:
-            # Use word boundaries for abbreviations without periods
-            pattern = r'\b' + re.escape(abbrev) + r'\b'
-        
-        result = re.sub(pattern, expansion, result, flags=re.IGNORECASE)
-    
-    return result
+    if _ABBREVIATION_AUTOMATON is not None:
+        expanded = _expand_abbreviations_automaton(text)
+        if expanded is not None:
+            return expanded
+    return _ABBREVIATION_RE.sub(lambda match: _replace_abbreviation(match, language), text)
+
+
+# Every number-like normalization as (name, pattern, replacement), in order of specificity (most
+# specific first): where several could match at the same position, the earlier one wins, so
+# dates, times, currencies and percentages are read before their digits count as plain numbers.
+# Abbreviations are a separate, final pass (see _normalize_abbreviations).
+_NORMALIZATIONS = [
+    ('date', _DATE_RE, _replace_date),
+    ('time', _TIME_RE, _replace_time),
+    ('currency', _CURRENCY_RE, _replace_currency),
+    ('percentage', _PERCENT_RE, _replace_percentage),
+    ('list_item', _LIST_ITEM_RE, _replace_list_item),
+    ('number', _NUMBER_RE, _replace_number),
+]
+_REPLACEMENTS = {name: replacement for name, _, replacement in _NORMALIZATIONS}
+
+
+def _combined_pattern(*names: str):
+    """Join the named normalizations into one alternation, so the text is scanned once."""
+    alternatives = [f'(?P<{name}>{pattern.pattern})' for name, pattern, _ in _NORMALIZATIONS if name in names]
+    # Every alternative starts with a digit, a currency symbol or (list items) at a line start;
+    # the lookahead skips every other position with one test instead of trying each alternative
+    # there. MULTILINE only affects the list item's ^ anchor.
+    return re.compile(r'(?=[\d$€£]|^)(?:' + '|'.join(alternatives) + ')', re.MULTILINE)
+
+
+# Dates, times and currencies are only spoken for Spanish and English
+_NORMALIZATION_RES = {
+    'es': _combined_pattern('date', 'time', 'currency', 'percentage', 'list_item', 'number'),
+    'en': _combined_pattern('date', 'time', 'currency', 'percentage', 'list_item', 'number'),
+}
+_BASIC_NORMALIZATION_RE = _combined_pattern('percentage', 'list_item', 'number')
 
 
 def normalize_text_for_tts(text: str, language: str = "es") -> str:
@@ -626,30 +760,12 @@ def normalize_text_for_tts(text: str, language: str = "es") -> str:
     logger.debug(f"Normalizing text for {base_lang.upper()} TTS: '{text[:50]}...'")
     
     try:
-        # Apply normalizations in order of specificity (most specific first)
-        normalized = text
-        
-        # 1. Normalize dates (before numbers to avoid conflicts)
-        normalized = _normalize_dates(normalized, base_lang)
-        
-        # 2. Normalize times (before numbers to avoid conflicts) - only for Spanish and English
-        if base_lang in ['es', 'en']:
-            normalized = _normalize_times(normalized, base_lang)
+        # One scan for dates, times, currencies, percentages, list items and numbers; each
+        # match is spoken by the replacement of the alternative that matched it
+        pattern = _NORMALIZATION_RES.get(base_lang, _BASIC_NORMALIZATION_RE)
+        normalized = pattern.sub(lambda match: _REPLACEMENTS[match.lastgroup](match, base_lang), text)
         
-        # 3. Normalize currencies (before numbers to avoid conflicts) - only for Spanish and English
-        if base_lang in ['es', 'en']:
-            normalized = _normalize_currencies(normalized, base_lang)
-        
-        # 4. Normalize percentages (before numbers to avoid conflicts)
-        normalized = _normalize_percentages(normalized, base_lang)
-        
-        # 5. Normalize list items (remove dots like "1.") before number normalization
-        normalized = _normalize_list_items(normalized, base_lang)
-
-        # 6. Normalize standalone numbers
-        normalized = _normalize_numbers(normalized, base_lang)
-        
-        # 7. Normalize abbreviations (last, as they might contain numbers) - only for Spanish
+        # Abbreviations last, in their own single pass - only for Spanish
         if base_lang == 'es':
             normalized = _normalize_abbreviations(normalized, base_lang)
         
@@ -688,33 +804,8 @@ def is_normalization_needed(text: str, language: str = "es") -> bool:
     if base_lang not in supported_languages:
         return False
     
-    # Check for patterns that would be normalized
-    patterns_to_check = [
-        r'\b\d+\b',  # Numbers
-        r'\b\d{1,2}[\/\-\.]\d{1,2}[\/\-\.]\d{2,4}\b',  # Dates
-        r'\b\d{1,2}:\d{2}\b',  # Times
-        r'[\$€£]\d+',  # Currencies
-        r'\b\d+(?:\.\d+)?\s*%',  # Percentages
-    ]
-    
-    # Check abbreviations (use word boundaries for better matching)
-    for abbrev in SPANISH_ABBREVIATIONS.keys():
-        if abbrev.endswith('.'):
-            # For abbreviations with periods, match exactly
-            if abbrev in text:
-                return True
-        else:
-            # For abbreviations without periods, use word boundaries
-            pattern = r'\b' + re.escape(abbrev) + r'\b'
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-    
-    # Check numeric patterns
-    for pattern in patterns_to_check:
-        if re.search(pattern, text):
-            return True
-    
-    return False
+    # Check abbreviations and numeric patterns in a single pass
+    return _NEEDS_NORMALIZATION_RE.search(text) is not None
 
 
 # For backward compatibility and easier imports
@@ -0,0 +1,54 @@
+import json
+import shutil
+import subprocess
+import unittest
+
+from audiobook_generator.ui.web_ui import _RENDER_MIXED_VOICES_JS, _RENDER_TEST_VOICES_JS, \
+    apply_voice_mix_to_main, update_selected_voices_display, update_test_voice_weights_display, \
+    voice_configs_for_selection
+
+_SELECTIONS = ([], ["af_bella"], ["af_bella", "ef_dora", "am_{adam}"])
+
+
+@unittest.skipUnless(shutil.which("node"), "node is needed to run the browser renderers")
+class TestVoiceMixerRenderers(unittest.TestCase):
+
+    def _render(self, renderer, voices):
+        script = f"process.stdout.write(JSON.stringify(({renderer})({json.dumps(voices)})))"
+        return json.loads(subprocess.run(["node", "-e", script], capture_output=True, text=True, check=True).stdout)
+
+    def test_mixed_voices_match_python_display(self):
+        for voices in _SELECTIONS:
+            with self.subTest(voices=voices):
+                html, _ = update_selected_voices_display(voices)
+                self.assertEqual(self._render(_RENDER_MIXED_VOICES_JS, voices), html)
+
+    def test_test_voices_match_python_display(self):
+        for voices in _SELECTIONS:
+            with self.subTest(voices=voices):
+                html, configs_json, combination = update_test_voice_weights_display(voices)
+                self.assertEqual(self._render(_RENDER_TEST_VOICES_JS, voices),
+                                 [html, json.loads(configs_json), combination])
+
+
+class TestApplyVoiceMix(unittest.TestCase):
+
+    def test_applies_configs_from_json_component(self):
+        # gr.JSON hands the handler the decoded list
+        configs = voice_configs_for_selection(["af_bella", "ef_dora"])
+        self.assertEqual(apply_voice_mix_to_main(configs, "af_heart")[0], "af_bella+ef_dora(0.5)")
+
+    def test_applies_configs_from_json_string(self):
+        configs = json.dumps(voice_configs_for_selection(["af_bella", "ef_dora"]))
+        self.assertEqual(apply_voice_mix_to_main(configs, "af_heart")[0], "af_bella+ef_dora(0.5)")
+
+    def test_empty_selection_keeps_main_voice(self):
+        for configs in ([], "[]", None, ""):
+            with self.subTest(configs=configs):
+                voice, status = apply_voice_mix_to_main(configs, "af_heart")
+                self.assertEqual(voice, "af_heart")
+                self.assertIn("❌", status)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+import numpy as np
+from pydub import AudioSegment
+from pydub.effects import compress_dynamic_range
+
+from audiobook_generator.utils.audio_quality import _as_ndarray, _compress_samples
+
+
+def _speech_like(frame_rate, channels, seconds=0.5, level=0.7, seed=0):
+    """Loud tone with a syllable-like envelope and some noise, as int16 PCM"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(frame_rate * seconds)) / frame_rate
+    envelope = np.abs(np.sin(2 * np.pi * 3 * t)) ** 0.7
+    mono = (np.sin(2 * np.pi * 180 * t) + 0.3 * rng.normal(0, 1, t.size)) * envelope * level * 32767
+    samples = np.repeat(mono, channels) if channels == 2 else mono
+    return AudioSegment(np.clip(samples, -32768, 32767).astype(np.int16).tobytes(),
+                        sample_width=2, frame_rate=frame_rate, channels=channels)
+
+
+class TestCompressSamples(unittest.TestCase):
+
+    def _assert_matches_pydub(self, segment, **settings):
+        expected = np.frombuffer(compress_dynamic_range(segment, **settings).raw_data, dtype=np.int16)
+        actual = _compress_samples(_as_ndarray(segment), segment, **settings)
+        self.assertEqual(actual.shape, expected.shape)
+        self.assertFalse(np.array_equal(expected, _as_ndarray(segment)), "clip should be compressed")
+        # Same per-frame algorithm; only the final gain product may round differently
+        self.assertLessEqual(int(np.abs(actual.astype(np.int32) - expected).max()), 1)
+
+    def test_matches_pydub_on_short_clips(self):
+        for frame_rate in (22050, 24000):
+            for channels in (1, 2):
+                with self.subTest(frame_rate=frame_rate, channels=channels):
+                    self._assert_matches_pydub(_speech_like(frame_rate, channels),
+                                               threshold=-12.0, ratio=4.0, attack=5.0, release=50.0)
+
+    def test_matches_pydub_with_combiner_limiter_settings(self):
+        self._assert_matches_pydub(_speech_like(24000, 1, seed=1),
+                                   threshold=-10.0, ratio=3.0, attack=1.0, release=20.0)
+
+    def test_quiet_audio_is_returned_unchanged(self):
+        segment = _speech_like(22050, 1, level=0.1)
+        samples = _as_ndarray(segment)
+        self.assertIs(_compress_samples(samples, segment, threshold=-12.0, ratio=4.0, attack=5.0, release=50.0),
+                      samples)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from audiobook_generator.utils import catalog_cache
+from audiobook_generator.utils.catalog_cache import disk_cached
+
+
+class TestDiskCached(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        patcher = patch.object(catalog_cache, "_cache_dir", return_value=Path(self.tmp_dir.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.calls = []
+
+    def _getter(self, ttl):
+        @disk_cached(ttl=ttl)
+        def get_catalog(language):
+            self.calls.append(language)
+            return [f"{language}-voice"]
+        return get_catalog
+
+    def test_result_is_reused_within_ttl(self):
+        get_catalog = self._getter("1h")
+        self.assertEqual(get_catalog("es"), ["es-voice"])
+        self.assertEqual(get_catalog("es"), ["es-voice"])
+        self.assertEqual(get_catalog("en"), ["en-voice"])
+        self.assertEqual(self.calls, ["es", "en"])
+
+    def test_expired_entry_is_refreshed(self):
+        get_catalog = self._getter(0)
+        get_catalog("es")
+        get_catalog("es")
+        self.assertEqual(self.calls, ["es", "es"])
+
+    def test_corrupt_entry_falls_back_to_call(self):
+        get_catalog = self._getter("1h")
+        get_catalog("es")
+        for entry in Path(self.tmp_dir.name).glob("*.json"):
+            entry.write_text("not json", encoding="utf-8")
+        self.assertEqual(get_catalog("es"), ["es-voice"])
+        self.assertEqual(self.calls, ["es", "es"])
+
+    def test_ttl_strings(self):
+        self.assertEqual(catalog_cache._ttl_seconds("24h"), 86400)
+        self.assertEqual(catalog_cache._ttl_seconds("7d"), 7 * 86400)
+        self.assertEqual(catalog_cache._ttl_seconds(30), 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import io
+import os
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+from audiobook_generator.utils import ffmpeg_setup
+
+ARCHIVE_URL = "https://example.com/ffmpeg.zip"
+
+
+class _StubResponse:
+    def __init__(self, body, status_code, headers=None):
+        self.content = body
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.url = ARCHIVE_URL
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _StubSession:
+    """Serves one in-memory archive, answering Range headers like a static file server"""
+
+    def __init__(self, archive, honor_ranges=True):
+        self.archive = archive
+        self.honor_ranges = honor_ranges
+        self.ranges = []
+
+    def get(self, url, stream=False, timeout=None, headers=None):
+        byte_range = (headers or {}).get("Range")
+        if not byte_range or not self.honor_ranges:
+            return _StubResponse(self.archive, 200)
+        self.ranges.append(byte_range)
+        first, last = byte_range.split("=", 1)[1].split("-")
+        size = len(self.archive)
+        if not first:
+            start, end = max(size - int(last), 0), size - 1
+        else:
+            start, end = int(first), int(last)
+        return _StubResponse(self.archive[start:end + 1], 206,
+                             {"Content-Range": f"bytes {start}-{end}/{size}"})
+
+
+def _make_archive(compression, doc_count=3):
+    members = {
+        "ffmpeg-build/bin/ffmpeg.exe": os.urandom(20000) + b"f" * 50000,
+        "ffmpeg-build/bin/ffprobe.exe": b"p" * 3000,
+        "ffmpeg-build/bin/ffplay.exe": os.urandom(10000),
+    }
+    members.update({f"ffmpeg-build/doc/{i:04d}-documentation-page.html": os.urandom(500)
+                    for i in range(doc_count)})
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", compression) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buf.getvalue(), members
+
+
+class TestInstallFromZipRanges(unittest.TestCase):
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.target_bin = Path(tmp_dir.name)
+
+    def _assert_installed(self, members):
+        self.assertEqual(sorted(path.name for path in self.target_bin.iterdir()), ["ffmpeg.exe", "ffprobe.exe"])
+        for name in ("ffmpeg.exe", "ffprobe.exe"):
+            self.assertEqual((self.target_bin / name).read_bytes(), members[f"ffmpeg-build/bin/{name}"])
+
+    def test_deflated_members_are_extracted(self):
+        archive, members = _make_archive(zipfile.ZIP_DEFLATED)
+        session = _StubSession(archive)
+        ffmpeg_setup._install_from_zip_ranges(session, ARCHIVE_URL, self.target_bin)
+        self._assert_installed(members)
+        # Tail (with the central directory), then a header and a data range per binary
+        self.assertEqual(len(session.ranges), 5)
+
+    def test_stored_members_with_central_directory_outside_tail(self):
+        archive, members = _make_archive(zipfile.ZIP_STORED, doc_count=2000)
+        session = _StubSession(archive)
+        ffmpeg_setup._install_from_zip_ranges(session, ARCHIVE_URL, self.target_bin)
+        self._assert_installed(members)
+        self.assertEqual(len(session.ranges), 6)
+
+    def test_server_ignoring_ranges_raises(self):
+        archive, _ = _make_archive(zipfile.ZIP_DEFLATED)
+        with self.assertRaises(ValueError):
+            ffmpeg_setup._install_from_zip_ranges(_StubSession(archive, honor_ranges=False),
+                                                  ARCHIVE_URL, self.target_bin)
+
+    def test_corrupt_member_fails_crc_check(self):
+        archive, _ = _make_archive(zipfile.ZIP_STORED)
+        data_at = archive.index(b"p" * 3000)
+        corrupt = archive[:data_at] + b"q" + archive[data_at + 1:]
+        with self.assertRaisesRegex(ValueError, "CRC mismatch"):
+            ffmpeg_setup._install_from_zip_ranges(_StubSession(corrupt), ARCHIVE_URL, self.target_bin)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+import unittest
+
+import numpy as np
+from pydub import AudioSegment
+
+from audiobook_generator.utils.intelligent_audio_combiner import IntelligentAudioCombiner, _best_splice, \
+    _fade_curves, _FAST_HASH_BYTES
+
+
+def _speech_like(ms, frame_rate=24000, level=0.3, seed=0, lead_ms=0, trail_ms=0):
+    """Noisy tone with a syllable-like envelope, with optional digital silence around it"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(frame_rate * ms / 1000)) / frame_rate
+    envelope = 0.3 + 0.7 * np.abs(np.sin(2 * np.pi * rng.uniform(2, 4) * t))
+    voice = (np.sin(2 * np.pi * rng.uniform(120, 250) * t) + 0.2 * rng.normal(0, 1, t.size)) * envelope * level
+    samples = np.concatenate([np.zeros(int(frame_rate * lead_ms / 1000)), voice * 32767,
+                              np.zeros(int(frame_rate * trail_ms / 1000))])
+    return AudioSegment(samples.astype(np.int16).tobytes(), sample_width=2, frame_rate=frame_rate, channels=1)
+
+
+class TestSplice(unittest.TestCase):
+
+    def setUp(self):
+        self.combiner = IntelligentAudioCombiner(tts_type="kokoro")
+
+    def test_speech_is_never_trimmed(self):
+        # 300 ms is the longest kokoro crossfade (sharp transitions)
+        for seed in range(5):
+            with self.subTest(seed=seed):
+                audio1, audio2 = _speech_like(800, seed=seed), _speech_like(800, seed=seed + 10)
+                self.assertEqual(self.combiner._find_splice(audio1, audio2, 300), (0, 0))
+
+    def test_only_silence_is_trimmed(self):
+        audio1 = _speech_like(800, trail_ms=12)
+        audio2 = _speech_like(800, seed=1, lead_ms=100)
+        trim_end, trim_start = self.combiner._find_splice(audio1, audio2, 300)
+        # At most the 8 ms hop that fits in the 12 ms of trailing silence, and at most 3 hops of the lead
+        self.assertIn(trim_end, (0, 8))
+        self.assertLessEqual(trim_start, 24)
+
+    def test_splice_keeps_speech_energy(self):
+        audio1, audio2 = _speech_like(800), _speech_like(800, seed=1)
+        tail = np.frombuffer(audio1.raw_data, dtype=np.int16).astype(float)
+        head = np.frombuffer(audio2.raw_data, dtype=np.int16).astype(float)
+        silence = audio1.max_possible_amplitude * 10 ** (-50.0 / 20)
+        self.assertEqual(_best_splice(tail, head, audio1.frame_rate, silence), (0, 0))
+
+
+class TestIntelligentCombine(unittest.TestCase):
+
+    # Close levels give smooth transitions, big jumps sharp ones (which slice in ms and may trim the splice)
+    _LEVELS = (0.3, 0.28, 0.05, 0.6, 0.1, 0.13, 0.5, 0.04)
+
+    def _chunks(self, frame_rate):
+        chunks = [_speech_like(900 + 70 * i, frame_rate=frame_rate, level=level, seed=i,
+                               lead_ms=40 * (i % 2), trail_ms=30 * (i % 3)) for i, level in enumerate(self._LEVELS)]
+        chunks.insert(4, AudioSegment.silent(duration=400, frame_rate=frame_rate))
+        return chunks
+
+    def _unwindowed(self, combiner, segments, transitions):
+        # The combine loop before the tail window: every addition copies the whole result
+        result = segments[0]['audio']
+        for i, transition in enumerate(transitions):
+            next_segment = segments[i + 1]['audio']
+            if transition['needs_pause'] and transition['pause_duration'] > 0:
+                result += AudioSegment.silent(duration=transition['pause_duration'])
+            if transition['crossfade_duration'] > 0 and not segments[i + 1]['is_silence']:
+                result = combiner._apply_intelligent_crossfade(result, next_segment, transition)
+            else:
+                result += next_segment
+        return result
+
+    def test_windowed_combine_matches_unwindowed(self):
+        for frame_rate in (22050, 24000):
+            for tts_type in ("kokoro", "coqui"):
+                with self.subTest(frame_rate=frame_rate, tts_type=tts_type):
+                    combiner = IntelligentAudioCombiner(tts_type=tts_type)
+                    segments = combiner._validate_and_filter_segments(self._chunks(frame_rate))
+                    transitions = combiner._analyze_all_transitions(segments)
+                    self.assertLessEqual({'smooth', 'sharp', 'silence'}, {t['type'] for t in transitions})
+                    windowed = combiner._intelligent_combine(segments, transitions)
+                    expected = self._unwindowed(combiner, segments, transitions)
+                    self.assertEqual(windowed.frame_rate, expected.frame_rate)
+                    self.assertEqual(windowed.raw_data, expected.raw_data)
+
+
+class TestDuplicateDetection(unittest.TestCase):
+
+    def setUp(self):
+        self.combiner = IntelligentAudioCombiner()
+
+    def test_exact_duplicate_is_rejected(self):
+        audio = _speech_like(500)
+        self.assertIsNotNone(self.combiner._register_chunk_hash(audio))
+        self.assertIsNotNone(self.combiner._register_chunk_hash(_speech_like(500, seed=1)))
+        self.assertIsNone(self.combiner._register_chunk_hash(audio._spawn(audio.raw_data)))
+
+    def test_fast_hash_collision_is_resolved_by_content(self):
+        # Same edges, length and format, different middle: only the MD5 tells them apart
+        first, other = _speech_like(500), _speech_like(500, seed=1)
+        edge = _FAST_HASH_BYTES
+        raw = first.raw_data
+        collision = first._spawn(raw[:edge] + other.raw_data[edge:-edge] + raw[-edge:])
+        self.assertIsNotNone(self.combiner._register_chunk_hash(first))
+        self.assertIsNotNone(self.combiner._register_chunk_hash(collision))
+        self.assertEqual(len(self.combiner.chunk_hashes), 2)
+        self.assertIsNone(self.combiner._register_chunk_hash(collision._spawn(collision.raw_data)))
+        self.assertIsNone(self.combiner._register_chunk_hash(first._spawn(raw)))
+
+    def test_duplicate_chunks_are_dropped_when_combining(self):
+        audio = _speech_like(500)
+        segments = self.combiner._validate_and_filter_segments([audio, _speech_like(500, seed=1), audio])
+        self.assertEqual([segment['index'] for segment in segments], [0, 1])
+
+
+class TestUnifyFormats(unittest.TestCase):
+
+    def test_same_format_is_left_alone(self):
+        chunks = [_speech_like(200), _speech_like(300, seed=1)]
+        self.assertIs(IntelligentAudioCombiner._unify_formats(chunks), chunks)
+
+    def test_mixed_formats_take_the_richest_of_each(self):
+        chunks = [_speech_like(200, frame_rate=22050),
+                  _speech_like(200, frame_rate=24000).set_channels(2),
+                  _speech_like(200, frame_rate=16000).set_sample_width(4)]
+        unified = IntelligentAudioCombiner._unify_formats(chunks)
+        self.assertEqual({(a.frame_rate, a.channels, a.sample_width) for a in unified}, {(24000, 2, 4)})
+        self.assertEqual([len(a) for a in unified], [len(a) for a in chunks])
+
+    def test_mixed_formats_combine(self):
+        chunks = [_speech_like(900, frame_rate=22050), _speech_like(900, frame_rate=24000, seed=1).set_channels(2)]
+        combined = IntelligentAudioCombiner(tts_type="kokoro").combine_audio_segments(chunks)
+        self.assertEqual((combined.frame_rate, combined.channels), (24000, 2))
+
+
+class TestFadeCurves(unittest.TestCase):
+
+    def test_endpoints(self):
+        for equal_power in (True, False):
+            with self.subTest(equal_power=equal_power):
+                fade_out, fade_in = _fade_curves(441, equal_power)
+                self.assertEqual(len(fade_out), 441)
+                self.assertAlmostEqual(fade_out[0], 1.0)
+                self.assertAlmostEqual(fade_out[-1], 0.0)
+                self.assertAlmostEqual(fade_in[0], 0.0)
+                self.assertAlmostEqual(fade_in[-1], 1.0)
+                self.assertFalse(fade_out.flags.writeable or fade_in.flags.writeable)
+
+    def test_equal_power_keeps_total_power(self):
+        fade_out, fade_in = _fade_curves(100)
+        np.testing.assert_allclose(fade_out ** 2 + fade_in ** 2, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()